@@ -0,0 +1,84 @@
+"""
+Bulk import script.
+
+Runs the ingestion pipeline and extraction over a document corpus offline
+and writes deduplicated nodes and aggregated relationships as CSV files
+for an initial load with neo4j-admin database import.
+"""
+
+import argparse
+import shlex
+from pathlib import Path
+
+from scholaris.config import load_config
+from scholaris.extraction.chunks import extract_chunk
+from scholaris.extraction.entities import EntityExtractor
+from scholaris.extraction.relations import RelationExtractor
+from scholaris.graph.admin_import import AdminImportWriter
+from scholaris.ingestion.pipeline import create_ingestion_pipeline, find_documents
+from scholaris.utils.logging import setup_logging
+
+logger = setup_logging("INFO")
+
+
+def main():
+    """Main bulk import function."""
+    parser = argparse.ArgumentParser(
+        description="Write neo4j-admin import CSV files for a document corpus"
+    )
+
+    parser.add_argument(
+        "--path",
+        required=True,
+        help="Path to file or directory to import",
+    )
+
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Directory for the generated CSV files",
+    )
+
+    parser.add_argument(
+        "--spill-rows",
+        type=int,
+        default=None,
+        help="Rows held in memory per file (defaults to graph.import_spill_rows)",
+    )
+
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if not path.exists():
+        logger.error(f"Invalid path: {args.path}")
+        return
+
+    config = load_config()
+    pipeline = create_ingestion_pipeline(config)
+    entity_extractor = EntityExtractor(config)
+    relation_extractor = RelationExtractor(config)
+
+    with AdminImportWriter(config, Path(args.output), args.spill_rows) as writer:
+        for file_path in find_documents(path):
+            try:
+                _, chunks = pipeline.stream_document(str(file_path))
+                for chunk in chunks:
+                    entities, relations = extract_chunk(
+                        chunk, entity_extractor, relation_extractor
+                    )
+                    writer.add_chunk(chunk, entities, relations)
+            except Exception as e:
+                logger.error(f"Failed to process {file_path}: {e}")
+
+        stats = writer.close()
+        command = writer.import_command(config.neo4j.database)
+
+    logger.info(
+        f"Wrote {stats['entities']} entities, {stats['relations']} relationships "
+        f"and {stats['chunks']} chunks to {args.output}"
+    )
+    logger.info(f"Import with: {shlex.join(command)}")
+
+
+if __name__ == "__main__":
+    main()
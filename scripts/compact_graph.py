@@ -0,0 +1,67 @@
+"""
+Graph compaction script.
+
+Merges duplicate entities that share a normalized text and type, rewires
+their relationships, prunes low-confidence relationships and removes
+orphaned entities, committing in small batches so it can run against a
+live database.
+"""
+
+import argparse
+
+from scholaris.config import load_config
+from scholaris.graph.cache import GraphVersion
+from scholaris.graph.compaction import GraphCompactor
+from scholaris.graph.neo4j_client import Neo4jClient
+from scholaris.memory.redis_client import RedisClient
+from scholaris.utils.logging import setup_logging
+
+logger = setup_logging("INFO")
+
+
+def main():
+    """Main compaction function."""
+    parser = argparse.ArgumentParser(description="Compact the Scholaris graph")
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Rows per transaction (defaults to graph.write_batch_size)",
+    )
+
+    parser.add_argument(
+        "--resume-after",
+        default="",
+        help="Resume merging after this dedup key (logged as 'after' per batch)",
+    )
+
+    parser.add_argument(
+        "--no-prune",
+        action="store_true",
+        help="Only merge duplicates; keep low-confidence edges and orphans",
+    )
+
+    args = parser.parse_args()
+
+    config = load_config()
+    if config.graph.backend != "neo4j":
+        logger.error("Graph compaction requires graph.backend: neo4j")
+        return
+
+    client = Neo4jClient(config)
+
+    try:
+        compactor = GraphCompactor(config, client, args.batch_size)
+        stats = compactor.run(after=args.resume_after, prune=not args.no_prune)
+        logger.info(
+            f"Merged {stats['groups']} duplicate groups "
+            f"({stats['removed']} nodes removed) in {stats['seconds']}s"
+        )
+        GraphVersion(RedisClient(config)).bump(removed=True)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
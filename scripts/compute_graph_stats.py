@@ -0,0 +1,50 @@
+"""
+Graph statistics maintenance script.
+
+Computes degree, per-relation-type degree and PageRank for every entity
+and writes them back as node properties in batched passes.
+"""
+
+import argparse
+
+from scholaris.config import load_config
+from scholaris.graph.backend import create_graph_backend
+from scholaris.graph.statistics import GraphStatistics
+from scholaris.utils.logging import setup_logging
+
+logger = setup_logging("INFO")
+
+
+def main():
+    """Main statistics function."""
+    parser = argparse.ArgumentParser(
+        description="Compute degree and PageRank statistics on graph nodes"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Nodes written per transaction (defaults to graph.write_batch_size)",
+    )
+
+    args = parser.parse_args()
+
+    config = load_config()
+    if args.batch_size:
+        config.graph.write_batch_size = args.batch_size
+
+    client = create_graph_backend(config)
+
+    try:
+        stats = GraphStatistics(config, client).update(full=True)
+        logger.info(
+            f"Updated statistics on {stats['updated']} of {stats['nodes']} nodes "
+            f"in {stats['seconds']}s"
+        )
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
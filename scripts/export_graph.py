@@ -0,0 +1,76 @@
+"""
+Graph export script.
+
+Streams nodes and edges out of the graph backend into JSON Lines files
+without holding the graph in memory.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+from scholaris.config import load_config
+from scholaris.graph.backend import create_graph_backend
+from scholaris.utils.logging import setup_logging
+
+logger = setup_logging("INFO")
+
+
+def write_jsonl(path: Path, records: Iterator[dict[str, Any]]) -> int:
+    """Write records to a JSON Lines file, one at a time."""
+    count = 0
+    with path.open("w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, default=str))
+            handle.write("\n")
+            count += 1
+    return count
+
+
+def main():
+    """Main export function."""
+    parser = argparse.ArgumentParser(description="Export the Scholaris graph")
+
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Directory to write nodes.jsonl and edges.jsonl into",
+    )
+
+    parser.add_argument(
+        "--since",
+        type=int,
+        default=0,
+        help="Only export entities updated after this timestamp (ms)",
+    )
+
+    parser.add_argument(
+        "--fetch-size",
+        type=int,
+        default=None,
+        help="Records fetched per round trip (defaults to neo4j.fetch_size)",
+    )
+
+    args = parser.parse_args()
+
+    config = load_config()
+    client = create_graph_backend(config)
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    try:
+        nodes = write_jsonl(
+            output / "nodes.jsonl", client.iter_nodes(args.since, args.fetch_size)
+        )
+        edges = write_jsonl(
+            output / "edges.jsonl", client.iter_edges(args.since, args.fetch_size)
+        )
+        logger.info(f"Exported {nodes} nodes and {edges} edges to {output}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ CLI tool for ingesting documents into the knowledge graph.
 
 import argparse
 from pathlib import Path
+from typing import Optional
 
 from scholaris.chatbot import ScholarisChatbot
 from scholaris.config import load_config
@@ -14,11 +15,15 @@ from scholaris.utils.logging import setup_logging
 logger = setup_logging("INFO")
 
 
-def ingest_file(chatbot: ScholarisChatbot, file_path: str) -> None:
+def ingest_file(chatbot: ScholarisChatbot, file_path: str, force: bool = False) -> None:
     """Ingest a single file."""
     logger.info(f"Ingesting file: {file_path}")
 
-    result = chatbot.ingest_document(file_path)
+    result = chatbot.ingest_document(file_path, force)
+
+    if result["skipped"]:
+        logger.info(f"Unchanged since last ingestion ({result['chunks']} chunks)")
+        return
 
     logger.info(
         f"Ingested {result['chunks']} chunks, "
@@ -27,22 +32,33 @@ def ingest_file(chatbot: ScholarisChatbot, file_path: str) -> None:
     )
 
 
-def ingest_directory(chatbot: ScholarisChatbot, directory_path: str) -> None:
-    """Ingest all documents in a directory."""
+def ingest_directory(
+    chatbot: ScholarisChatbot,
+    directory_path: str,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> None:
+    """Ingest all documents in a directory, extracting in parallel workers."""
     directory = Path(directory_path)
 
     if not directory.exists():
         logger.error(f"Directory not found: {directory_path}")
         return
 
-    supported_extensions = {".pdf", ".txt", ".md", ".markdown"}
+    report = chatbot.ingest_directory(str(directory), workers, force)
+
+    for failure in report["failed"]:
+        logger.error(f"Failed to ingest {failure['file']}: {failure['error']}")
 
-    for file_path in directory.rglob("*"):
-        if file_path.suffix.lower() in supported_extensions:
-            try:
-                ingest_file(chatbot, str(file_path))
-            except Exception as e:
-                logger.error(f"Failed to ingest {file_path}: {e}")
+    logger.info(
+        f"Ingested {report['ingested']}/{report['files']} files "
+        f"({report['skipped']} unchanged) with "
+        f"{report['workers']} workers in {report['seconds']}s "
+        f"({report['files_per_second']} files/s, "
+        f"{report['chunks_per_second']} chunks/s): "
+        f"{report['chunks']} chunks, {report['entities']} entities, "
+        f"{report['relations']} relations"
+    )
 
 
 def main():
@@ -61,6 +77,19 @@ def main():
         help="Recursively process directories",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Extraction processes for directories (defaults to extraction.workers)",
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-ingest files even if the manifest records them as unchanged",
+    )
+
     args = parser.parse_args()
 
     config = load_config()
@@ -69,9 +98,9 @@ def main():
     path = Path(args.path)
 
     if path.is_file():
-        ingest_file(chatbot, str(path))
+        ingest_file(chatbot, str(path), args.force)
     elif path.is_dir():
-        ingest_directory(chatbot, str(path))
+        ingest_directory(chatbot, str(path), args.workers, args.force)
     else:
         logger.error(f"Invalid path: {args.path}")
 
@@ -5,8 +5,8 @@ Initializes Neo4j schema and Redis configuration.
 """
 
 from scholaris.config import load_config
+from scholaris.graph.backend import create_graph_backend
 from scholaris.graph.builder import GraphBuilder
-from scholaris.graph.neo4j_client import Neo4jClient
 from scholaris.memory.redis_client import RedisClient
 from scholaris.utils.logging import setup_logging
 
@@ -17,10 +17,11 @@ def setup_neo4j(config):
     """Initialize Neo4j database with schema and indexes."""
     logger.info("Setting up Neo4j database...")
 
-    client = Neo4jClient(config)
+    client = create_graph_backend(config)
     builder = GraphBuilder(config, client)
 
     builder.create_indexes()
+    builder.create_fulltext_index()
 
     logger.info("Neo4j setup complete")
     client.close()
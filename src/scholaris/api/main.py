@@ -1,11 +1,12 @@
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from scholaris.api.routes import router
+from scholaris.api.routes import chatbot, ingestion_jobs, router
 from scholaris.config import load_config
 from scholaris.utils.logging import setup_logging
 
@@ -16,8 +17,12 @@ logger = setup_logging(config.app.log_level)
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("application_starting")
+    if chatbot.async_neo4j_client is not None:
+        await chatbot.async_neo4j_client.verify_connectivity()
     yield
     logger.info("application_shutting_down")
+    await asyncio.to_thread(ingestion_jobs.shutdown)
+    await chatbot.aclose()
 
 
 app = FastAPI(
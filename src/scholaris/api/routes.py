@@ -1,16 +1,24 @@
 
+from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
-from scholaris.chatbot import ScholarisChatbot
+from scholaris.chatbot import ScholarisChatbot, create_document_ingest
 from scholaris.config import load_config
-from scholaris.types import QueryRequest, QueryResponse
+from scholaris.ingestion.jobs import IngestionJobQueue
+from scholaris.types import IngestionJob, QueryRequest, QueryResponse
 
 router = APIRouter(prefix="/api/v1", tags=["scholaris"])
 
 config = load_config()
 chatbot = ScholarisChatbot(config)
+ingestion_jobs = IngestionJobQueue(
+    config,
+    chatbot.redis_client,
+    chatbot.ingest_document,
+    ingest_factory=create_document_ingest if config.graph.backend == "neo4j" else None,
+)
 
 
 @router.get("/health")
@@ -21,7 +29,7 @@ async def health_check() -> dict[str, str]:
 @router.post("/query", response_model=QueryResponse)
 async def query(request: QueryRequest) -> QueryResponse:
     try:
-        response = chatbot.ask(
+        response = await chatbot.aask(
             query=request.query,
             session_id=request.session_id,
             max_hops=request.max_hops,
@@ -33,21 +41,42 @@ async def query(request: QueryRequest) -> QueryResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/ingest")
-async def ingest_document(file_path: str) -> dict[str, Any]:
-    try:
-        result = chatbot.ingest_document(file_path)
-        return {
-            "status": "success",
-            "document_id": result.get("document_id"),
-            "chunks": result.get("chunks", 0),
-            "entities": result.get("entities", 0),
-        }
+@router.post("/ingest", response_model=IngestionJob, status_code=202)
+async def ingest_document(file_path: str, force: bool = False) -> IngestionJob:
+    if not Path(file_path).is_file():
+        raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
+    try:
+        return ingestion_jobs.submit(file_path, force)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/ingest/jobs", response_model=list[IngestionJob])
+async def list_ingestion_jobs(limit: int = 50) -> list[IngestionJob]:
+    return ingestion_jobs.list_jobs(limit)
+
+
+@router.get("/ingest/jobs/{job_id}", response_model=IngestionJob)
+async def get_ingestion_job(job_id: str) -> IngestionJob:
+    job = ingestion_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.delete("/ingest/jobs/{job_id}", response_model=IngestionJob)
+async def cancel_ingestion_job(job_id: str) -> IngestionJob:
+    job = ingestion_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if not job.cancel_requested:
+        raise HTTPException(
+            status_code=409, detail=f"Job {job_id} already {job.status.value}"
+        )
+    return job
+
+
 @router.delete("/session/{session_id}")
 async def clear_session(session_id: str) -> dict[str, str]:
     chatbot.clear_session(session_id)
@@ -60,4 +89,5 @@ async def get_stats() -> dict[str, Any]:
         "status": "operational",
         "provider": config.llm.provider,
         "model": config.llm.model,
+        "graph_cache": chatbot.graph_cache_stats(),
     }
@@ -1,24 +1,45 @@
 
+import asyncio
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
 from typing import Any, Optional
 from uuid import uuid4
 
 from scholaris.config import Config, load_config
 from scholaris.explainability.formatter import ReasoningFormatter
 from scholaris.explainability.visualizer import GraphVisualizer
+from scholaris.extraction.chunks import extract_chunk
 from scholaris.extraction.entities import EntityExtractor
 from scholaris.extraction.linker import EntityLinker
 from scholaris.extraction.relations import RelationExtractor
+from scholaris.graph.async_neo4j_client import AsyncNeo4jClient
+from scholaris.graph.backend import create_graph_backend
 from scholaris.graph.builder import GraphBuilder
-from scholaris.graph.neo4j_client import Neo4jClient
-from scholaris.graph.traversal import GraphTraversal
-from scholaris.ingestion.pipeline import IngestionPipeline
+from scholaris.graph.cache import GraphVersion
+from scholaris.graph.ranking import ContextRanker
+from scholaris.graph.statistics import GraphStatistics
+from scholaris.graph.traversal import AsyncGraphTraversal, GraphTraversal
+from scholaris.graph.write_buffer import GraphWriteBuffer, GraphWriteError
+from scholaris.ingestion.chunker import Chunk
+from scholaris.ingestion.loader import document_id_for
+from scholaris.ingestion.manifest import IngestionManifest, pipeline_version
+from scholaris.ingestion.parallel import ParallelExtractor
+from scholaris.ingestion.pipeline import create_ingestion_pipeline, find_documents
 from scholaris.llm.client import LLMClient
 from scholaris.llm.prompts import PromptManager
 from scholaris.memory.context import ContextManager
 from scholaris.memory.redis_client import RedisClient
 from scholaris.reasoning.cot_engine import ChainOfThoughtEngine
 from scholaris.reasoning.query_analyzer import QueryAnalyzer
-from scholaris.types import QueryResponse, ReasoningStep, Source
+from scholaris.types import (
+    Entity,
+    GraphSubgraph,
+    QueryResponse,
+    ReasoningStep,
+    Relation,
+    Source,
+)
 from scholaris.utils.logging import StructuredLogger
 from scholaris.vectorstore.chroma_client import ChromaClient
 from scholaris.vectorstore.embedder import Embedder
@@ -36,7 +57,10 @@ class ScholarisChatbot:
         logger.info("scholaris_initialized")
 
     def _initialize_components(self) -> None:
-        self.neo4j_client = Neo4jClient(self.config)
+        self.graph_client = create_graph_backend(self.config)
+        self.async_neo4j_client: Optional[AsyncNeo4jClient] = None
+        if self.config.graph.backend == "neo4j":
+            self.async_neo4j_client = AsyncNeo4jClient(self.config)
         self.redis_client = RedisClient(self.config)
         self.chroma_client = ChromaClient(self.config)
 
@@ -48,54 +72,352 @@ class ScholarisChatbot:
         self.relation_extractor = RelationExtractor(self.config)
         self.entity_linker = EntityLinker()
 
-        self.graph_builder = GraphBuilder(self.config, self.neo4j_client)
-        self.graph_traversal = GraphTraversal(self.config, self.neo4j_client)
+        self.graph_version = GraphVersion(
+            self.redis_client, self.config.graph.version_refresh_seconds
+        )
+        self.graph_builder = GraphBuilder(
+            self.config, self.graph_client, self.graph_version
+        )
+        self.graph_traversal = GraphTraversal(
+            self.config, self.graph_client, version=self.graph_version
+        )
+        self.graph_statistics: Optional[GraphStatistics] = None
+        if self.graph_traversal.snapshot is not None:
+            self.graph_statistics = GraphStatistics(
+                self.config, self.graph_client, self.graph_traversal
+            )
+        self.async_graph_traversal: Optional[AsyncGraphTraversal] = None
+        if self.async_neo4j_client is not None:
+            snapshot_traversal = None
+            if self.graph_traversal.snapshot is not None:
+                snapshot_traversal = self.graph_traversal
+            self.async_graph_traversal = AsyncGraphTraversal(
+                self.config,
+                self.async_neo4j_client,
+                self.graph_version,
+                snapshot_traversal,
+            )
 
         self.context_manager = ContextManager(self.config, self.redis_client)
+        self.context_ranker = ContextRanker(
+            self.config, self.context_manager.count_tokens
+        )
         self.query_analyzer = QueryAnalyzer(self.config)
         self.cot_engine = ChainOfThoughtEngine(self.config)
 
         self.formatter = ReasoningFormatter()
         self.visualizer = GraphVisualizer()
 
-        self.ingestion_pipeline = IngestionPipeline()
+        self.ingestion_pipeline = create_ingestion_pipeline(self.config)
+        self.ingestion_manifest: Optional[IngestionManifest] = None
+        manifest_path = self.config.extraction.manifest_path
+        if manifest_path and self.config.graph.backend == "neo4j":
+            self.ingestion_manifest = IngestionManifest(
+                manifest_path, pipeline_version(self.config)
+            )
 
-    def ingest_document(self, file_path: str) -> dict[str, Any]:
+    def ingest_document(
+        self,
+        file_path: str,
+        force: bool = False,
+        progress: Optional[Callable[[dict[str, int]], None]] = None,
+    ) -> dict[str, Any]:
         logger.info("ingesting_document", file=file_path)
 
-        document_id, chunks = self.ingestion_pipeline.process_document(file_path)
+        path = Path(file_path)
+        current, fingerprint = self._check_manifest(path, force)
+        if current:
+            return self._skipped_result(path, fingerprint)
 
-        all_entities = []
-        all_relations = []
+        try:
+            document_id, chunks = self.ingestion_pipeline.stream_document(file_path)
+            result = self._ingest_chunks(document_id, chunks, progress=progress)
+        except Exception as e:
+            self._record_manifest(path, fingerprint, error=e)
+            raise
+
+        self._record_manifest(path, fingerprint, result)
+        return {**result, "skipped": False}
 
-        for chunk in chunks:
-            entities = self.entity_extractor.extract_entities(chunk.text)
-            all_entities.extend(entities)
+    def _check_manifest(
+        self, path: Path, force: bool
+    ) -> tuple[bool, Optional[dict[str, Any]]]:
+        if self.ingestion_manifest is None or not path.is_file():
+            return False, None
 
-            relations = self.relation_extractor.extract_relations(
-                chunk.text, entities
+        try:
+            current, fingerprint = self.ingestion_manifest.check(
+                path, document_id_for(path)
             )
-            all_relations.extend(relations)
+        except OSError as e:
+            logger.warning("manifest_check_failed", file=str(path), error=str(e))
+            return False, None
 
-        unique_entities = self.entity_extractor.deduplicate_entities(all_entities)
+        return current and not force, fingerprint
 
-        self.graph_builder.build_graph(unique_entities, all_relations)
+    def _record_manifest(
+        self,
+        path: Path,
+        fingerprint: Optional[dict[str, Any]],
+        result: Optional[dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        if self.ingestion_manifest is None or fingerprint is None:
+            return
+
+        if error is None and result is not None:
+            self.ingestion_manifest.record(
+                path, result["document_id"], "ingested", fingerprint, result["chunks"]
+            )
+        else:
+            self.ingestion_manifest.record(
+                path, document_id_for(path), "failed", fingerprint, error=str(error)
+            )
+
+    def _skipped_result(
+        self, path: Path, fingerprint: dict[str, Any]
+    ) -> dict[str, Any]:
+        document_id = document_id_for(path)
+        logger.info("document_unchanged", file=str(path), document_id=document_id)
+        return {
+            "document_id": document_id,
+            "chunks": fingerprint["chunks"],
+            "chunks_added": 0,
+            "chunks_removed": 0,
+            "entities": 0,
+            "relations": 0,
+            "skipped": True,
+        }
+
+    def ingest_directory(
+        self,
+        directory_path: str,
+        workers: Optional[int] = None,
+        force: bool = False,
+    ) -> dict[str, Any]:
+        start_time = time.perf_counter()
+        files = sorted(
+            find_documents(Path(directory_path)),
+            key=lambda path: path.stat().st_size,
+            reverse=True,
+        )
+
+        report: dict[str, Any] = {
+            "files": len(files),
+            "ingested": 0,
+            "skipped": 0,
+            "failed": [],
+            "chunks": 0,
+            "chunks_added": 0,
+            "chunks_removed": 0,
+            "entities": 0,
+            "relations": 0,
+        }
+
+        fingerprints: dict[str, Optional[dict[str, Any]]] = {}
+
+        def changed_files() -> Iterator[Path]:
+            for path in files:
+                current, fingerprint = self._check_manifest(path, force)
+                if current:
+                    report["skipped"] += 1
+                    continue
+                fingerprints[str(path)] = fingerprint
+                yield path
+
+        def known_chunk_ids(path: Path) -> frozenset[str]:
+            return frozenset(self.graph_client.document_chunks(document_id_for(path)))
+
+        with ParallelExtractor(self.config, workers) as extractor:
+            for file_path, document, error in extractor.extract(
+                changed_files(), known_chunk_ids
+            ):
+                if document is not None:
+                    try:
+                        result = self._ingest_chunks(
+                            document["document_id"],
+                            document["chunks"],
+                            document["extracted"],
+                            update_statistics=False,
+                        )
+                    except Exception as e:
+                        error = e
+                    else:
+                        self._record_manifest(
+                            Path(file_path), fingerprints.pop(file_path, None), result
+                        )
+                        report["ingested"] += 1
+                        for key in [
+                            "chunks",
+                            "chunks_added",
+                            "chunks_removed",
+                            "entities",
+                            "relations",
+                        ]:
+                            report[key] += result[key]
+
+                if error is not None:
+                    self._record_manifest(
+                        Path(file_path), fingerprints.pop(file_path, None), error=error
+                    )
+                    report["failed"].append({"file": file_path, "error": str(error)})
+                    logger.error(
+                        "document_ingestion_failed", file=file_path, error=str(error)
+                    )
+
+                done = report["ingested"] + report["skipped"] + len(report["failed"])
+                elapsed = time.perf_counter() - start_time
+                logger.info(
+                    "ingestion_progress",
+                    done=done,
+                    total=len(files),
+                    failed=len(report["failed"]),
+                    files_per_second=round(done / elapsed, 2) if elapsed else 0.0,
+                )
+
+        if report["chunks_added"] or report["chunks_removed"]:
+            self._update_statistics(full=bool(report["chunks_removed"]))
+
+        seconds = time.perf_counter() - start_time
+        report.update(
+            {
+                "workers": extractor.workers,
+                "seconds": round(seconds, 3),
+                "files_per_second": round(len(files) / seconds, 2) if seconds else 0.0,
+                "chunks_per_second": (
+                    round(report["chunks"] / seconds, 2) if seconds else 0.0
+                ),
+            }
+        )
+        logger.info(
+            "directory_ingested",
+            **{key: value for key, value in report.items() if key != "failed"},
+            failed=len(report["failed"]),
+        )
+        return report
+
+    def _ingest_chunks(
+        self,
+        document_id: str,
+        chunks: Iterable[Chunk],
+        extracted: Optional[dict[str, tuple[list[Entity], list[Relation]]]] = None,
+        update_statistics: bool = True,
+        progress: Optional[Callable[[dict[str, int]], None]] = None,
+    ) -> dict[str, Any]:
+        extracted = extracted or {}
+        previous = set(self.graph_client.document_chunks(document_id))
+        current: set[str] = set()
+
+        entity_ids: set[str] = set()
+        chunk_entities: dict[str, list[str]] = {}
+        relation_count = 0
+        pending: list[Chunk] = []
+
+        with GraphWriteBuffer(self.graph_builder) as write_buffer:
+            try:
+                for chunk in chunks:
+                    if chunk.id in current:
+                        continue
+                    current.add(chunk.id)
+                    if chunk.id in previous:
+                        continue
+
+                    prepared = extracted.pop(chunk.id, None)
+                    entities, relations = prepared or extract_chunk(
+                        chunk, self.entity_extractor, self.relation_extractor
+                    )
+                    write_buffer.add_entities(entities)
+                    chunk_entities[chunk.id] = sorted(
+                        {entity.id for entity in entities if entity.id}
+                    )
+                    entity_ids.update(chunk_entities[chunk.id])
+
+                    write_buffer.add_relations(relations)
+                    relation_count += len(relations)
+
+                    pending.append(chunk)
+                    if len(pending) >= self.config.embeddings.batch_size:
+                        self._index_chunks(pending)
+                        pending = []
+
+                    if progress is not None:
+                        progress(
+                            {
+                                "chunks": len(current),
+                                "chunks_added": len(chunk_entities),
+                                "entities": len(entity_ids),
+                                "relations": relation_count,
+                            }
+                        )
+
+                self._index_chunks(pending)
+                write_buffer.flush()
+            except GraphWriteError:
+                raise
+            except Exception:
+                try:
+                    self._index_chunks(pending)
+                finally:
+                    write_buffer.flush()
+                    self.graph_builder.record_chunks(document_id, chunk_entities)
+                raise
+
+        removed = sorted(previous - current)
+        if removed:
+            self.graph_builder.remove_chunks(removed)
+            self.chroma_client.delete_embeddings(removed)
+
+        self.graph_builder.record_chunks(document_id, chunk_entities)
+
+        if update_statistics:
+            self._update_statistics(full=bool(removed))
 
         logger.info(
             "document_ingested",
             document_id=document_id,
-            chunks=len(chunks),
-            entities=len(unique_entities),
-            relations=len(all_relations),
+            chunks=len(current),
+            chunks_added=len(chunk_entities),
+            chunks_removed=len(removed),
+            entities=len(entity_ids),
+            relations=relation_count,
+            flushes=write_buffer.stats["flushes"],
         )
 
         return {
             "document_id": document_id,
-            "chunks": len(chunks),
-            "entities": len(unique_entities),
-            "relations": len(all_relations),
+            "chunks": len(current),
+            "chunks_added": len(chunk_entities),
+            "chunks_removed": len(removed),
+            "entities": len(entity_ids),
+            "relations": relation_count,
         }
 
+    def _index_chunks(self, chunks: list[Chunk]) -> None:
+        if not chunks:
+            return
+
+        texts = [chunk.text for chunk in chunks]
+        self.chroma_client.add_embeddings(
+            ids=[chunk.id for chunk in chunks],
+            embeddings=self.embedder.embed_batch(texts),
+            documents=texts,
+            metadatas=[
+                {"document_id": chunk.document_id, **chunk.metadata}
+                for chunk in chunks
+            ],
+        )
+
+    def _update_statistics(self, full: bool) -> None:
+        if not self.config.graph.stats_update_on_ingest:
+            return
+        if self.graph_statistics is None:
+            logger.info(
+                "graph_statistics_skipped",
+                reason="no in-process snapshot; run scripts/compute_graph_stats.py",
+            )
+            return
+        self.graph_statistics.update(full=full)
+
     def ask(
         self,
         query: str,
@@ -111,6 +433,42 @@ class ScholarisChatbot:
 
         graph_context = self._retrieve_graph_context(analysis.key_entities, max_hops)
 
+        return self._answer_with_context(
+            query, session_id, graph_context, include_reasoning
+        )
+
+    async def aask(
+        self,
+        query: str,
+        session_id: Optional[str] = None,
+        max_hops: Optional[int] = None,
+        include_reasoning: bool = True,
+    ) -> QueryResponse:
+        session_id = session_id or str(uuid4())
+
+        logger.info("processing_query", query=query, session_id=session_id)
+
+        analysis = self.query_analyzer.analyze_query(query)
+
+        graph_context = await self._aretrieve_graph_context(
+            analysis.key_entities, max_hops
+        )
+
+        return await asyncio.to_thread(
+            self._answer_with_context,
+            query,
+            session_id,
+            graph_context,
+            include_reasoning,
+        )
+
+    def _answer_with_context(
+        self,
+        query: str,
+        session_id: str,
+        graph_context: str,
+        include_reasoning: bool,
+    ) -> QueryResponse:
         conversation = self.context_manager.get_conversation(session_id)
         history = self._format_conversation_history(conversation)
 
@@ -140,19 +498,27 @@ class ScholarisChatbot:
     def _retrieve_graph_context(
         self, key_entities: list[str], max_hops: Optional[int]
     ) -> str:
-        context_parts = []
+        subgraph = self.graph_traversal.expand_neighborhoods(
+            seed_texts=key_entities, max_hops=max_hops
+        )
 
-        for entity_text in key_entities[:3]:
-            results = self.graph_traversal.search_entities_by_text(
-                entity_text, limit=5
-            )
+        return self._format_graph_context(subgraph)
+
+    async def _aretrieve_graph_context(
+        self, key_entities: list[str], max_hops: Optional[int]
+    ) -> str:
+        if self.async_graph_traversal is None:
+            return self._retrieve_graph_context(key_entities, max_hops)
+
+        subgraph = await self.async_graph_traversal.expand_neighborhoods(
+            seed_texts=key_entities, max_hops=max_hops
+        )
 
-            for result in results:
-                node = result.get("n", {})
-                if node:
-                    context_parts.append(f"Entity: {node.get('text', '')}")
+        return self._format_graph_context(subgraph)
 
-        return "\n".join(context_parts) if context_parts else "No graph context found."
+    def _format_graph_context(self, subgraph: GraphSubgraph) -> str:
+        context = self.context_ranker.build_context(subgraph)
+        return context or "No graph context found."
 
     def _format_conversation_history(self, conversation: Any) -> str:
         if not conversation.messages:
@@ -193,6 +559,24 @@ class ScholarisChatbot:
         self.context_manager.clear_conversation(session_id)
         logger.info("session_cleared", session_id=session_id)
 
+    def graph_cache_stats(self) -> dict[str, Any]:
+        stats = {"sync": self.graph_traversal.cache_stats()}
+        if self.async_graph_traversal is not None:
+            stats["async"] = self.async_graph_traversal.cache_stats()
+        return stats
+
     def close(self) -> None:
-        self.neo4j_client.close()
+        self.graph_version.close()
+        self.graph_client.close()
+        if self.ingestion_manifest is not None:
+            self.ingestion_manifest.close()
         logger.info("scholaris_closed")
+
+    async def aclose(self) -> None:
+        if self.async_neo4j_client is not None:
+            await self.async_neo4j_client.close()
+        self.close()
+
+
+def create_document_ingest(config: Config) -> Callable[..., dict[str, Any]]:
+    return ScholarisChatbot(config).ingest_document
@@ -21,6 +21,8 @@ class Neo4jConfig(BaseSettings):
     database: str = Field(default="scholaris")
     max_connection_lifetime: int = Field(default=3600)
     max_connection_pool_size: int = Field(default=50)
+    max_transaction_retry_time: float = Field(default=30.0, ge=0.0)
+    fetch_size: int = Field(default=1000, gt=0)
 
     model_config = SettingsConfigDict(env_prefix="NEO4J_")
 
@@ -48,8 +50,25 @@ class ContextConfig(BaseSettings):
 
 
 class GraphConfig(BaseSettings):
+    backend: str = Field(default="neo4j")
     max_hops: int = Field(default=3, ge=1, le=10)
     min_confidence: float = Field(default=0.7, ge=0.0, le=1.0)
+    write_batch_size: int = Field(default=1000, gt=0)
+    write_queue_size: int = Field(default=64, gt=0)
+    write_flush_size: int = Field(default=5000, gt=0)
+    write_flush_seconds: float = Field(default=2.0, ge=0.0)
+    traversal_mode: str = Field(default="database")
+    snapshot_refresh_seconds: int = Field(default=300, ge=0)
+    hub_degree_threshold: int = Field(default=0, ge=0)
+    landmark_count: int = Field(default=0, ge=0)
+    context_token_budget: int = Field(default=1000, gt=0)
+    pagerank_damping: float = Field(default=0.85, gt=0.0, lt=1.0)
+    stats_pagerank_tolerance: float = Field(default=0.05, ge=0.0)
+    stats_update_on_ingest: bool = Field(default=True)
+    import_spill_rows: int = Field(default=100000, gt=0)
+    cache_max_entries: int = Field(default=1024, ge=0)
+    cache_ttl_seconds: int = Field(default=300, ge=0)
+    version_refresh_seconds: float = Field(default=1.0, gt=0.0)
     entity_types: list[str] = Field(
         default_factory=lambda: [
             "CONCEPT",
@@ -85,6 +104,17 @@ class ExtractionConfig(BaseSettings):
     batch_size: int = Field(default=32, gt=0)
     entity_confidence_threshold: float = Field(default=0.6, ge=0.0, le=1.0)
     relation_confidence_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
+    workers: int = Field(default=1, ge=1)
+    pdf_workers: int = Field(default=1, ge=1)
+    pdf_parallel_pages: int = Field(default=200, ge=0)
+    manifest_path: str = Field(default="./data/ingestion_manifest.db")
+    chunk_size: int = Field(default=1000, gt=0)
+    chunk_overlap: int = Field(default=200, ge=0)
+    chunk_tokens: int = Field(default=0, ge=0)
+    chunk_overlap_tokens: int = Field(default=32, ge=0)
+    tokenizer_encoding: str = Field(default="cl100k_base")
+    job_workers: int = Field(default=1, ge=1, le=1)
+    job_ttl: int = Field(default=604800, gt=0)
 
 
 class EmbeddingsConfig(BaseSettings):
@@ -151,6 +181,18 @@ class Config:
                 f"must be less than max tokens ({self.context.max_tokens})"
             )
 
+        if self.graph.backend not in ["neo4j", "embedded"]:
+            raise ValueError(
+                f"Unsupported graph backend: {self.graph.backend}. "
+                "Must be 'neo4j' or 'embedded'"
+            )
+
+        if self.graph.traversal_mode not in ["database", "snapshot"]:
+            raise ValueError(
+                f"Unsupported graph traversal mode: {self.graph.traversal_mode}. "
+                "Must be 'database' or 'snapshot'"
+            )
+
         if self.llm.provider not in ["anthropic", "openai"]:
             raise ValueError(
                 f"Unsupported LLM provider: {self.llm.provider}. "
@@ -0,0 +1,20 @@
+from scholaris.extraction.entities import EntityExtractor
+from scholaris.extraction.relations import RelationExtractor
+from scholaris.ingestion.chunker import Chunk
+from scholaris.types import Entity, Relation
+
+
+def extract_chunk(
+    chunk: Chunk,
+    entity_extractor: EntityExtractor,
+    relation_extractor: RelationExtractor,
+) -> tuple[list[Entity], list[Relation]]:
+    entities = [
+        entity.model_copy(update={"chunk_ids": [chunk.id]})
+        for entity in entity_extractor.extract_entities(chunk.text)
+    ]
+    relations = [
+        relation.model_copy(update={"provenance": {chunk.id: relation.weight}})
+        for relation in relation_extractor.extract_relations(chunk.text, entities)
+    ]
+    return entities, relations
@@ -9,6 +9,12 @@ from scholaris.utils.logging import StructuredLogger
 logger = StructuredLogger(__name__)
 
 
+def merge_entities(existing: Entity, entity: Entity) -> Entity:
+    winner = entity if entity.confidence > existing.confidence else existing
+    chunk_ids = list(dict.fromkeys(existing.chunk_ids + entity.chunk_ids))
+    return winner.model_copy(update={"chunk_ids": chunk_ids})
+
+
 class EntityExtractor:
 
     def __init__(self, config: Config) -> None:
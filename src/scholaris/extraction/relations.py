@@ -8,6 +8,37 @@ from scholaris.utils.logging import StructuredLogger
 logger = StructuredLogger(__name__)
 
 
+def relation_key(relation: Relation) -> tuple[str, str, str]:
+    return relation.source_id, relation.target_id, relation.type.value
+
+
+def merge_relations(existing: Relation, relation: Relation) -> Relation:
+    provenance = dict(existing.provenance)
+    for chunk_id, count in relation.provenance.items():
+        provenance[chunk_id] = provenance.get(chunk_id, 0) + count
+
+    return existing.model_copy(
+        update={
+            "weight": existing.weight + relation.weight,
+            "confidence": max(existing.confidence, relation.confidence),
+            "provenance": provenance,
+        }
+    )
+
+
+def aggregate_relations(relations: list[Relation]) -> list[Relation]:
+    aggregated: dict[tuple[str, str, str], Relation] = {}
+
+    for relation in relations:
+        key = relation_key(relation)
+        existing = aggregated.get(key)
+        aggregated[key] = (
+            relation if existing is None else merge_relations(existing, relation)
+        )
+
+    return list(aggregated.values())
+
+
 class RelationExtractor:
 
     def __init__(self, config: Config) -> None:
@@ -21,9 +52,9 @@ class RelationExtractor:
 
         relations.extend(self._extract_proximity_relations(text, entities))
 
-        filtered_relations = [
-            r for r in relations if r.confidence >= self.confidence_threshold
-        ]
+        filtered_relations = aggregate_relations(
+            [r for r in relations if r.confidence >= self.confidence_threshold]
+        )
 
         logger.info(
             "relations_extracted",
@@ -41,10 +72,11 @@ class RelationExtractor:
 
         for i, entity1 in enumerate(entities):
             for entity2 in entities[i + 1 : i + 3]:
-                if entity1.id and entity2.id:
+                if entity1.id and entity2.id and entity1.id != entity2.id:
+                    source_id, target_id = sorted((entity1.id, entity2.id))
                     relation = Relation(
-                        source_id=entity1.id,
-                        target_id=entity2.id,
+                        source_id=source_id,
+                        target_id=target_id,
                         type=RelationType.MENTIONS,
                         confidence=0.7,
                         metadata={"method": "proximity"},
@@ -0,0 +1,299 @@
+import csv
+import heapq
+import json
+import tempfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Optional
+
+from scholaris.config import Config
+from scholaris.graph.queries import CHUNK_LABEL, ENTITY_LABEL
+from scholaris.ingestion.chunker import Chunk
+from scholaris.types import Entity, Relation
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+ENTITY_HEADER = [
+    "id:ID(Entity)",
+    ":LABEL",
+    "text",
+    "confidence:float",
+    "chunk_ids:string[]",
+]
+CHUNK_HEADER = ["id:ID(Chunk)", ":LABEL", "document_id", "entity_ids:string[]"]
+RELATIONSHIP_HEADER = [
+    ":START_ID(Entity)",
+    ":END_ID(Entity)",
+    ":TYPE",
+    "confidence:float",
+    "weight:int",
+    "chunk_ids:string[]",
+    "chunk_weights:int[]",
+]
+ARRAY_DELIMITER = ";"
+
+
+def merge_entity_rows(existing: list[Any], row: list[Any]) -> list[Any]:
+    node_id, labels, confidence, text, chunk_ids = existing
+    if row[2] > confidence:
+        confidence, text = row[2], row[3]
+    return [
+        node_id,
+        sorted(set(labels) | set(row[1])),
+        confidence,
+        text,
+        sorted(set(chunk_ids) | set(row[4])),
+    ]
+
+
+def merge_relation_rows(existing: list[Any], row: list[Any]) -> list[Any]:
+    provenance = dict(existing[5])
+    for chunk_id, count in row[5]:
+        provenance[chunk_id] = provenance.get(chunk_id, 0) + count
+    return [
+        *existing[:3],
+        max(existing[3], row[3]),
+        existing[4] + row[4],
+        sorted([chunk_id, count] for chunk_id, count in provenance.items()),
+    ]
+
+
+class SpillAggregator:
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        key_size: int,
+        merge: Callable[[list[Any], list[Any]], list[Any]],
+        spill_rows: int,
+    ) -> None:
+        self.directory = directory
+        self.name = name
+        self.key_size = key_size
+        self.merge = merge
+        self.spill_rows = spill_rows
+
+        self._rows: dict[tuple[Any, ...], list[Any]] = {}
+        self._runs: list[Path] = []
+
+    def add(self, row: list[Any]) -> None:
+        key = tuple(row[: self.key_size])
+        existing = self._rows.get(key)
+        self._rows[key] = row if existing is None else self.merge(existing, row)
+
+        if len(self._rows) >= self.spill_rows:
+            self._spill()
+
+    def _spill(self) -> None:
+        path = self.directory / f"{self.name}-{len(self._runs):05d}.jsonl"
+        with path.open("w", encoding="utf-8") as f:
+            for key in sorted(self._rows):
+                f.write(json.dumps(self._rows[key], ensure_ascii=False) + "\n")
+
+        self._runs.append(path)
+        self._rows.clear()
+        logger.debug("import_rows_spilled", name=self.name, runs=len(self._runs))
+
+    def _read_run(self, path: Path) -> Iterator[list[Any]]:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def __iter__(self) -> Iterator[list[Any]]:
+        if not self._runs:
+            for key in sorted(self._rows):
+                yield self._rows[key]
+            return
+
+        if self._rows:
+            self._spill()
+
+        current: Optional[list[Any]] = None
+        for row in heapq.merge(
+            *(self._read_run(path) for path in self._runs),
+            key=lambda row: row[: self.key_size],
+        ):
+            if current is not None and current[: self.key_size] == row[: self.key_size]:
+                current = self.merge(current, row)
+                continue
+            if current is not None:
+                yield current
+            current = row
+
+        if current is not None:
+            yield current
+
+
+class AdminImportWriter:
+
+    def __init__(
+        self,
+        config: Config,
+        output_dir: Path,
+        spill_rows: Optional[int] = None,
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.spill_rows = spill_rows or config.graph.import_spill_rows
+
+        self.entities_path = self.output_dir / "entities.csv"
+        self.chunks_path = self.output_dir / "chunks.csv"
+        self.relationships_path = self.output_dir / "relationships.csv"
+
+        self._spill_dir = tempfile.TemporaryDirectory(
+            prefix=".spill-", dir=self.output_dir
+        )
+        spill_path = Path(self._spill_dir.name)
+        self._entities = SpillAggregator(
+            spill_path, "entities", 1, merge_entity_rows, self.spill_rows
+        )
+        self._relations = SpillAggregator(
+            spill_path, "relations", 3, merge_relation_rows, self.spill_rows
+        )
+
+        self._chunks_file = self.chunks_path.open("w", encoding="utf-8", newline="")
+        self._chunks = self._csv_writer(self._chunks_file)
+        self._chunks.writerow(CHUNK_HEADER)
+        self._document_id: Optional[str] = None
+        self._document_chunks: set[str] = set()
+        self._closed = False
+
+        self.stats: dict[str, int] = {
+            "chunks": 0,
+            "entities_received": 0,
+            "relations_received": 0,
+            "entities": 0,
+            "relations": 0,
+        }
+
+    def __enter__(self) -> "AdminImportWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        elif not self._closed:
+            self._closed = True
+            self._chunks_file.close()
+            self._spill_dir.cleanup()
+
+    def _csv_writer(self, f: Any) -> Any:
+        return csv.writer(f, lineterminator="\n")
+
+    def add_chunk(
+        self,
+        chunk: Chunk,
+        entities: list[Entity],
+        relations: list[Relation],
+    ) -> None:
+        if chunk.document_id != self._document_id:
+            self._document_id = chunk.document_id
+            self._document_chunks.clear()
+        if chunk.id in self._document_chunks:
+            return
+        self._document_chunks.add(chunk.id)
+
+        entity_ids = sorted({entity.id for entity in entities if entity.id})
+        self._chunks.writerow(
+            [
+                chunk.id,
+                CHUNK_LABEL,
+                chunk.document_id,
+                ARRAY_DELIMITER.join(entity_ids),
+            ]
+        )
+        self.stats["chunks"] += 1
+
+        for entity in entities:
+            self.stats["entities_received"] += 1
+            if not entity.id:
+                logger.warning("entity_missing_id", text=entity.text)
+                continue
+            self._entities.add(
+                [
+                    entity.id,
+                    [entity.type.value],
+                    entity.confidence,
+                    entity.text,
+                    sorted(set(entity.chunk_ids)),
+                ]
+            )
+
+        for relation in relations:
+            self.stats["relations_received"] += 1
+            self._relations.add(
+                [
+                    relation.source_id,
+                    relation.target_id,
+                    relation.type.value,
+                    relation.confidence,
+                    relation.weight,
+                    sorted(
+                        [chunk_id, count]
+                        for chunk_id, count in relation.provenance.items()
+                    ),
+                ]
+            )
+
+    def close(self) -> dict[str, int]:
+        if self._closed:
+            return self.stats
+        self._closed = True
+        self._chunks_file.close()
+
+        try:
+            with self.entities_path.open("w", encoding="utf-8", newline="") as f:
+                writer = self._csv_writer(f)
+                writer.writerow(ENTITY_HEADER)
+                for node_id, labels, confidence, text, chunk_ids in self._entities:
+                    writer.writerow(
+                        [
+                            node_id,
+                            ARRAY_DELIMITER.join([ENTITY_LABEL, *labels]),
+                            text,
+                            repr(float(confidence)),
+                            ARRAY_DELIMITER.join(chunk_ids),
+                        ]
+                    )
+                    self.stats["entities"] += 1
+
+            with self.relationships_path.open(
+                "w", encoding="utf-8", newline=""
+            ) as f:
+                writer = self._csv_writer(f)
+                writer.writerow(RELATIONSHIP_HEADER)
+                for row in self._relations:
+                    source, target, rel_type, confidence, weight, provenance = row
+                    writer.writerow(
+                        [
+                            source,
+                            target,
+                            rel_type,
+                            repr(float(confidence)),
+                            weight,
+                            ARRAY_DELIMITER.join(chunk for chunk, _ in provenance),
+                            ARRAY_DELIMITER.join(str(count) for _, count in provenance),
+                        ]
+                    )
+                    self.stats["relations"] += 1
+        finally:
+            self._spill_dir.cleanup()
+
+        logger.info("admin_import_written", output=str(self.output_dir), **self.stats)
+        return self.stats
+
+    def import_command(self, database: str) -> list[str]:
+        return [
+            "neo4j-admin",
+            "database",
+            "import",
+            "full",
+            f"--nodes={self.entities_path}",
+            f"--nodes={self.chunks_path}",
+            f"--relationships={self.relationships_path}",
+            f"--array-delimiter={ARRAY_DELIMITER}",
+            "--overwrite-destination=true",
+            database,
+        ]
@@ -0,0 +1,352 @@
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+)
+from neo4j.exceptions import ServiceUnavailable
+
+from scholaris.config import Config
+from scholaris.graph.neo4j_client import (
+    GraphConnectionError,
+    KShortestPathSearch,
+    batch_parameters,
+    build_graph_path,
+    build_subgraph,
+    connection_error,
+    driver_options,
+    expansion_request,
+    first_value,
+    log_bulk_write,
+    node_params,
+    path_request,
+    relationship_params,
+    search_requests,
+)
+from scholaris.graph.queries import (
+    bulk_merge_nodes_query,
+    bulk_merge_relationships_query,
+    find_node_query,
+    merge_node_query,
+    merge_relationship_query,
+    related_entities_query,
+)
+from scholaris.types import GraphPath, GraphSubgraph
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def run_query(
+    tx: AsyncManagedTransaction,
+    query: str,
+    parameters: Optional[dict[str, Any]] = None,
+) -> list[dict[str, Any]]:
+    result = await tx.run(query, parameters or {})
+    return [dict(record) async for record in result]
+
+
+class AsyncNeo4jClient:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.driver: Optional[AsyncDriver] = AsyncGraphDatabase.driver(
+            config.neo4j.uri, **driver_options(config)
+        )
+
+    async def verify_connectivity(self) -> None:
+        if not self.driver:
+            raise GraphConnectionError("Not connected to Neo4j")
+
+        try:
+            await self.driver.verify_connectivity()
+            logger.info("neo4j_async_connected", uri=self.config.neo4j.uri)
+
+        except ServiceUnavailable as e:
+            raise GraphConnectionError(
+                f"Failed to connect to Neo4j at {self.config.neo4j.uri}: {e}"
+            ) from e
+
+    async def close(self) -> None:
+        if self.driver:
+            await self.driver.close()
+            self.driver = None
+            logger.info("neo4j_async_connection_closed")
+
+    async def execute_query(
+        self, query: str, parameters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        if not self.driver:
+            raise GraphConnectionError("Not connected to Neo4j")
+
+        try:
+            async with self.driver.session(
+                database=self.config.neo4j.database
+            ) as session:
+                result = await session.run(query, parameters or {})
+                records = [dict(record) async for record in result]
+
+                logger.debug(
+                    "query_executed",
+                    query=query[:100],
+                    params=bool(parameters),
+                    results=len(records),
+                )
+
+                return records
+
+        except Exception as e:
+            raise connection_error(
+                "query_failed", "Query execution failed", e, query=query[:100]
+            ) from e
+
+    async def stream_query(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+        fetch_size: Optional[int] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        if not self.driver:
+            raise GraphConnectionError("Not connected to Neo4j")
+
+        streamed = 0
+        try:
+            async with self.driver.session(
+                database=self.config.neo4j.database,
+                default_access_mode=READ_ACCESS,
+                fetch_size=fetch_size or self.config.neo4j.fetch_size,
+            ) as session:
+                result = await session.run(query, parameters or {})
+                async for record in result:
+                    streamed += 1
+                    yield dict(record)
+
+        except Exception as e:
+            raise connection_error(
+                "stream_failed",
+                "Streaming query failed",
+                e,
+                query=query[:100],
+                streamed=streamed,
+            ) from e
+
+        logger.debug("query_streamed", query=query[:100], results=streamed)
+
+    @asynccontextmanager
+    async def session(
+        self, access_mode: str = WRITE_ACCESS
+    ) -> AsyncIterator[AsyncSession]:
+        if not self.driver:
+            raise GraphConnectionError("Not connected to Neo4j")
+
+        async with self.driver.session(
+            database=self.config.neo4j.database, default_access_mode=access_mode
+        ) as session:
+            yield session
+
+    async def read_transaction(
+        self, work: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        try:
+            async with self.session(READ_ACCESS) as session:
+                return await session.execute_read(work, *args, **kwargs)
+
+        except GraphConnectionError:
+            raise
+        except Exception as e:
+            raise connection_error(
+                "read_transaction_failed", "Read transaction failed", e
+            ) from e
+
+    async def write_transaction(
+        self, work: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        try:
+            async with self.session(WRITE_ACCESS) as session:
+                return await session.execute_write(work, *args, **kwargs)
+
+        except GraphConnectionError:
+            raise
+        except Exception as e:
+            raise connection_error(
+                "write_transaction_failed", "Write transaction failed", e
+            ) from e
+
+    async def execute_read(
+        self, query: str, parameters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        records = await self.read_transaction(run_query, query, parameters)
+        logger.debug("read_executed", query=query[:100], results=len(records))
+        return records
+
+    async def execute_write(
+        self, query: str, parameters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        records = await self.write_transaction(run_query, query, parameters)
+        logger.debug("write_executed", query=query[:100], results=len(records))
+        return records
+
+    async def create_node(
+        self, label: str, properties: dict[str, Any]
+    ) -> dict[str, Any]:
+        result = await self.execute_write(
+            merge_node_query(label), node_params(properties)
+        )
+        return first_value(result, "n", {})
+
+    async def create_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str,
+        properties: dict[str, Any],
+    ) -> dict[str, Any]:
+        result = await self.execute_write(
+            merge_relationship_query(rel_type),
+            relationship_params(source_id, target_id, properties),
+        )
+        return first_value(result, "r", {})
+
+    async def find_node(
+        self, label: str, property_key: str, property_value: Any
+    ) -> Optional[dict[str, Any]]:
+        query = find_node_query(label, property_key)
+        result = await self.execute_read(query, {"value": property_value})
+        return first_value(result, "n")
+
+    async def search_entities(
+        self,
+        search_texts: list[str],
+        entity_types: Optional[list[str]] = None,
+        limit: int = 10,
+        mode: str = "prefix",
+    ) -> list[list[dict[str, Any]]]:
+        query, param_sets = search_requests(search_texts, entity_types, limit, mode)
+
+        async def search_all(
+            tx: AsyncManagedTransaction,
+        ) -> list[list[dict[str, Any]]]:
+            return [
+                await run_query(tx, query, params) if params is not None else []
+                for params in param_sets
+            ]
+
+        return await self.read_transaction(search_all)
+
+    async def find_related(
+        self,
+        entity_id: str,
+        relation_types: Optional[list[str]] = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        query = related_entities_query(relation_types)
+        return await self.execute_read(
+            query, {"entity_id": entity_id, "limit": limit}
+        )
+
+    async def expand_neighborhoods(
+        self,
+        seed_texts: Optional[list[str]] = None,
+        seed_ids: Optional[list[str]] = None,
+        max_hops: int = 1,
+        relation_types: Optional[list[str]] = None,
+        entity_types: Optional[list[str]] = None,
+        per_seed_limit: int = 25,
+        matches_per_seed: int = 1,
+        mode: str = "prefix",
+    ) -> GraphSubgraph:
+        request = expansion_request(
+            self.config,
+            seed_texts,
+            seed_ids,
+            max_hops,
+            relation_types,
+            entity_types,
+            per_seed_limit,
+            matches_per_seed,
+            mode,
+        )
+        if request is None:
+            return GraphSubgraph()
+
+        query, params = request
+        records = await self.execute_read(query, params)
+        return build_subgraph(params["seeds"], records)
+
+    async def find_shortest_path(
+        self, source_id: str, target_id: str, max_hops: int
+    ) -> Optional[GraphPath]:
+        query, params = path_request(self.config, source_id, target_id, max_hops)
+        results = await self.execute_read(query, params)
+
+        if not results:
+            return None
+
+        return build_graph_path(results[0])
+
+    async def find_k_shortest_paths(
+        self, source_id: str, target_id: str, k: int, max_hops: int
+    ) -> list[GraphPath]:
+        search = KShortestPathSearch(self.config, source_id, target_id, k, max_hops)
+        request = search.request()
+        while request is not None:
+            search.add_results(await self.execute_read(*request))
+            request = search.request()
+        return search.paths()
+
+    async def bulk_create_nodes(
+        self,
+        label: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        query = bulk_merge_nodes_query(label)
+        return await self._write_batches(query, rows, batch_size, label=label)
+
+    async def bulk_create_relationships(
+        self,
+        rel_type: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        query = bulk_merge_relationships_query(rel_type)
+        return await self._write_batches(query, rows, batch_size, rel_type=rel_type)
+
+    async def _write_batches(
+        self,
+        query: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+        **log_fields: Any,
+    ) -> int:
+        if not rows:
+            return 0
+
+        size = batch_size or self.config.graph.write_batch_size
+        start_time = time.perf_counter()
+        written = 0
+
+        try:
+            async with self.session(WRITE_ACCESS) as session:
+                for params in batch_parameters(rows, size):
+                    await session.execute_write(run_query, query, params)
+                    written += len(params["rows"])
+
+        except Exception as e:
+            raise connection_error(
+                "bulk_write_failed",
+                "Bulk write failed",
+                e,
+                written=written,
+                **log_fields,
+            ) from e
+
+        log_bulk_write(written, size, start_time, **log_fields)
+        return written
@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Optional
+
+from scholaris.config import Config
+from scholaris.types import GraphPath, GraphSubgraph
+
+
+class GraphBackend(ABC):
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+    @abstractmethod
+    def create_node(self, label: str, properties: dict[str, Any]) -> dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def create_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str,
+        properties: dict[str, Any],
+    ) -> dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def find_node(
+        self, label: str, property_key: str, property_value: Any
+    ) -> Optional[dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def bulk_create_nodes(
+        self,
+        label: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        ...
+
+    @abstractmethod
+    def bulk_create_relationships(
+        self,
+        rel_type: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        ...
+
+    @abstractmethod
+    def update_node_properties(
+        self, rows: list[dict[str, Any]], batch_size: Optional[int] = None
+    ) -> int:
+        ...
+
+    @abstractmethod
+    def document_chunks(self, document_id: str) -> list[str]:
+        ...
+
+    @abstractmethod
+    def record_chunks(
+        self, rows: list[dict[str, Any]], batch_size: Optional[int] = None
+    ) -> int:
+        ...
+
+    @abstractmethod
+    def remove_chunks(
+        self, chunk_ids: list[str], batch_size: Optional[int] = None
+    ) -> dict[str, int]:
+        ...
+
+    @abstractmethod
+    def search_entities(
+        self,
+        search_texts: list[str],
+        entity_types: Optional[list[str]] = None,
+        limit: int = 10,
+        mode: str = "prefix",
+    ) -> list[list[dict[str, Any]]]:
+        ...
+
+    @abstractmethod
+    def find_related(
+        self,
+        entity_id: str,
+        relation_types: Optional[list[str]] = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def expand_neighborhoods(
+        self,
+        seed_texts: Optional[list[str]] = None,
+        seed_ids: Optional[list[str]] = None,
+        max_hops: int = 1,
+        relation_types: Optional[list[str]] = None,
+        entity_types: Optional[list[str]] = None,
+        per_seed_limit: int = 25,
+        matches_per_seed: int = 1,
+        mode: str = "prefix",
+    ) -> GraphSubgraph:
+        ...
+
+    @abstractmethod
+    def find_shortest_path(
+        self, source_id: str, target_id: str, max_hops: int
+    ) -> Optional[GraphPath]:
+        ...
+
+    @abstractmethod
+    def find_k_shortest_paths(
+        self, source_id: str, target_id: str, k: int, max_hops: int
+    ) -> list[GraphPath]:
+        ...
+
+    @abstractmethod
+    def iter_nodes(
+        self, since: int = 0, fetch_size: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def iter_edges(
+        self, since: int = 0, fetch_size: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        ...
+
+    def deletion_count(self) -> int:
+        return 0
+
+    def export_nodes(self, since: int = 0) -> list[dict[str, Any]]:
+        return list(self.iter_nodes(since))
+
+    def export_edges(self, since: int = 0) -> list[dict[str, Any]]:
+        return list(self.iter_edges(since))
+
+    def create_indexes(self, entity_types: list[str]) -> None:
+        pass
+
+    def create_fulltext_index(self) -> None:
+        pass
+
+
+def create_graph_backend(config: Config) -> GraphBackend:
+    if config.graph.backend == "embedded":
+        from scholaris.graph.embedded import EmbeddedGraphClient
+
+        return EmbeddedGraphClient(config)
+
+    from scholaris.graph.neo4j_client import Neo4jClient
+
+    return Neo4jClient(config)
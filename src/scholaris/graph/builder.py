@@ -1,40 +1,114 @@
-
-from typing import Optional
+import time
+from collections import defaultdict
+from typing import Any, Optional
 
 from scholaris.config import Config
-from scholaris.graph.neo4j_client import Neo4jClient
+from scholaris.graph.async_neo4j_client import AsyncNeo4jClient
+from scholaris.graph.backend import GraphBackend
+from scholaris.graph.cache import GraphVersion
 from scholaris.types import Entity, Relation
 from scholaris.utils.logging import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
 
+def entity_properties(entity: Entity) -> dict[str, Any]:
+    return {
+        "id": entity.id,
+        "text": entity.text,
+        "confidence": entity.confidence,
+        **entity.metadata,
+        "chunk_ids": entity.chunk_ids,
+    }
+
+
+def relation_properties(relation: Relation) -> dict[str, Any]:
+    return {
+        **relation.metadata,
+        "confidence": relation.confidence,
+        "weight": relation.weight,
+        "chunk_ids": list(relation.provenance),
+        "chunk_weights": list(relation.provenance.values()),
+    }
+
+
+def group_entity_rows(entities: list[Entity]) -> dict[str, list[dict[str, Any]]]:
+    node_rows: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+    for entity in entities:
+        if not entity.id:
+            logger.warning("entity_missing_id", text=entity.text)
+            continue
+        node_rows[entity.type.value].append(entity_properties(entity))
+
+    return node_rows
+
+
+def group_relation_rows(
+    relations: list[Relation],
+) -> dict[str, list[dict[str, Any]]]:
+    rel_rows: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+    for relation in relations:
+        rel_rows[relation.type.value].append(
+            {
+                "source_id": relation.source_id,
+                "target_id": relation.target_id,
+                "properties": relation_properties(relation),
+            }
+        )
+
+    return rel_rows
+
+
+def _build_stats(
+    nodes_written: int, relations_written: int, start_time: float
+) -> dict[str, Any]:
+    elapsed = time.perf_counter() - start_time
+    total_rows = nodes_written + relations_written
+    rows_per_sec = int(total_rows / elapsed) if elapsed > 0 else total_rows
+
+    logger.info(
+        "graph_built",
+        entities=nodes_written,
+        relations=relations_written,
+        seconds=round(elapsed, 3),
+        rows_per_sec=rows_per_sec,
+    )
+
+    return {
+        "entities": nodes_written,
+        "relations": relations_written,
+        "seconds": elapsed,
+        "rows_per_sec": rows_per_sec,
+    }
+
+
 class GraphBuilder:
 
-    def __init__(self, config: Config, neo4j_client: Neo4jClient) -> None:
+    def __init__(
+        self,
+        config: Config,
+        graph_client: GraphBackend,
+        version: Optional[GraphVersion] = None,
+    ) -> None:
         self.config = config
-        self.client = neo4j_client
+        self.client = graph_client
+        self.version = version or GraphVersion()
 
     def add_entity(self, entity: Entity) -> None:
         if not entity.id:
             logger.warning("entity_missing_id", text=entity.text)
             return
 
-        properties = {
-            "id": entity.id,
-            "text": entity.text,
-            "confidence": entity.confidence,
-            **entity.metadata,
-        }
+        properties = entity_properties(entity)
 
         self.client.create_node(label=entity.type.value, properties=properties)
+        self.version.bump()
         logger.debug("entity_added", id=entity.id, type=entity.type.value)
 
     def add_relation(self, relation: Relation) -> None:
-        properties = {
-            "confidence": relation.confidence,
-            **relation.metadata,
-        }
+        properties = relation_properties(relation)
 
         self.client.create_relationship(
             source_id=relation.source_id,
@@ -42,6 +116,7 @@ class GraphBuilder:
             rel_type=relation.type.value,
             properties=properties,
         )
+        self.version.bump()
         logger.debug(
             "relation_added",
             source=relation.source_id,
@@ -50,28 +125,113 @@ class GraphBuilder:
         )
 
     def build_graph(
-        self, entities: list[Entity], relations: list[Relation]
-    ) -> None:
+        self,
+        entities: list[Entity],
+        relations: list[Relation],
+        batch_size: Optional[int] = None,
+    ) -> dict[str, Any]:
         logger.info("building_graph", entities=len(entities), relations=len(relations))
 
-        for entity in entities:
-            self.add_entity(entity)
-
-        for relation in relations:
-            self.add_relation(relation)
+        start_time = time.perf_counter()
+
+        nodes_written = 0
+        relations_written = 0
+        try:
+            for label, rows in group_entity_rows(entities).items():
+                nodes_written += self.client.bulk_create_nodes(label, rows, batch_size)
+
+            for rel_type, rows in group_relation_rows(relations).items():
+                relations_written += self.client.bulk_create_relationships(
+                    rel_type, rows, batch_size
+                )
+        finally:
+            self.version.bump()
+
+        return _build_stats(nodes_written, relations_written, start_time)
+
+    def record_chunks(
+        self, document_id: str, chunk_entities: dict[str, list[str]]
+    ) -> int:
+        rows = [
+            {"id": chunk_id, "document_id": document_id, "entity_ids": entity_ids}
+            for chunk_id, entity_ids in chunk_entities.items()
+        ]
+        return self.client.record_chunks(rows)
 
-        logger.info("graph_built", entities=len(entities), relations=len(relations))
+    def remove_chunks(self, chunk_ids: list[str]) -> dict[str, int]:
+        try:
+            return self.client.remove_chunks(chunk_ids)
+        finally:
+            self.version.bump(removed=True)
 
     def create_indexes(self) -> None:
-        indexes = [
-            "CREATE INDEX entity_id_index IF NOT EXISTS FOR (n:CONCEPT) ON (n.id)",
-            "CREATE INDEX author_id_index IF NOT EXISTS FOR (n:AUTHOR) ON (n.id)",
-            "CREATE INDEX paper_id_index IF NOT EXISTS FOR (n:PAPER) ON (n.id)",
-        ]
+        self.client.create_indexes(self.config.graph.entity_types)
+
+    def create_fulltext_index(self) -> None:
+        self.client.create_fulltext_index()
+
+
+class AsyncGraphBuilder:
+
+    def __init__(
+        self,
+        config: Config,
+        neo4j_client: AsyncNeo4jClient,
+        version: Optional[GraphVersion] = None,
+    ) -> None:
+        self.config = config
+        self.client = neo4j_client
+        self.version = version or GraphVersion()
+
+    async def add_entity(self, entity: Entity) -> None:
+        if not entity.id:
+            logger.warning("entity_missing_id", text=entity.text)
+            return
+
+        await self.client.create_node(
+            label=entity.type.value, properties=entity_properties(entity)
+        )
+        self.version.bump()
+        logger.debug("entity_added", id=entity.id, type=entity.type.value)
+
+    async def add_relation(self, relation: Relation) -> None:
+        await self.client.create_relationship(
+            source_id=relation.source_id,
+            target_id=relation.target_id,
+            rel_type=relation.type.value,
+            properties=relation_properties(relation),
+        )
+        self.version.bump()
+        logger.debug(
+            "relation_added",
+            source=relation.source_id,
+            target=relation.target_id,
+            type=relation.type.value,
+        )
+
+    async def build_graph(
+        self,
+        entities: list[Entity],
+        relations: list[Relation],
+        batch_size: Optional[int] = None,
+    ) -> dict[str, Any]:
+        logger.info("building_graph", entities=len(entities), relations=len(relations))
+
+        start_time = time.perf_counter()
+
+        nodes_written = 0
+        relations_written = 0
+        try:
+            for label, rows in group_entity_rows(entities).items():
+                nodes_written += await self.client.bulk_create_nodes(
+                    label, rows, batch_size
+                )
+
+            for rel_type, rows in group_relation_rows(relations).items():
+                relations_written += await self.client.bulk_create_relationships(
+                    rel_type, rows, batch_size
+                )
+        finally:
+            self.version.bump()
 
-        for index_query in indexes:
-            try:
-                self.client.execute_query(index_query)
-                logger.info("index_created", query=index_query[:50])
-            except Exception as e:
-                logger.error("index_creation_failed", query=index_query[:50], error=str(e))
+        return _build_stats(nodes_written, relations_written, start_time)
@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from scholaris.memory.redis_client import RedisClient
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+GRAPH_VERSION_KEY = "graph_version"
+
+
+class GraphVersion:
+
+    def __init__(
+        self, redis_client: Optional[RedisClient] = None, refresh_seconds: float = 1.0
+    ) -> None:
+        self.redis = redis_client
+        self.refresh_seconds = refresh_seconds
+        self._state = (0, 0)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+        if self.redis is not None:
+            self.refresh()
+            threading.Thread(
+                target=self._poll, name="graph-version", daemon=True
+            ).start()
+
+    @property
+    def value(self) -> int:
+        return self._state[0]
+
+    @property
+    def epoch(self) -> int:
+        return self._state[1]
+
+    def current(self) -> tuple[int, int]:
+        return self._state
+
+    def refresh(self) -> tuple[int, int]:
+        if self.redis is None:
+            return self._state
+
+        with self._lock:
+            try:
+                counters = self.redis.counters(GRAPH_VERSION_KEY)
+            except Exception as e:
+                logger.warning("graph_version_refresh_failed", error=str(e))
+                return self._state
+            self._state = (counters.get("value", 0), counters.get("epoch", 0))
+            return self._state
+
+    def _poll(self) -> None:
+        while not self._stopped.wait(self.refresh_seconds):
+            self.refresh()
+
+    def bump(self, removed: bool = False) -> int:
+        with self._lock:
+            value, epoch = self._state
+            if self.redis is not None:
+                try:
+                    counters = self.redis.increment_counters(
+                        GRAPH_VERSION_KEY, value=1, epoch=int(removed)
+                    )
+                    self._state = (counters["value"], counters["epoch"])
+                    return self._state[0]
+                except Exception as e:
+                    logger.warning("graph_version_bump_failed", error=str(e))
+
+            self._state = (value + 1, epoch + int(removed))
+            return self._state[0]
+
+    def close(self) -> None:
+        self._stopped.set()
+
+
+def cache_key(method: str, *args: Any) -> tuple[Hashable, ...]:
+    normalized: list[Hashable] = [method]
+    for arg in args:
+        if isinstance(arg, (list, tuple, set)):
+            normalized.append(tuple(sorted(arg)))
+        else:
+            normalized.append(arg)
+    return tuple(normalized)
+
+
+class TraversalCache:
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: Hashable, version: int) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, value = entry
+                if entry_version == version and time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, version: int, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            expires_at = time.monotonic() + self.ttl_seconds
+            self._entries[key] = (version, expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
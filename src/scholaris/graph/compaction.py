@@ -0,0 +1,229 @@
+import time
+from collections import defaultdict
+from typing import Any, Optional
+
+from neo4j import ManagedTransaction
+
+from scholaris.config import Config
+from scholaris.extraction.relations import merge_relations
+from scholaris.graph.neo4j_client import Neo4jClient, run_query
+from scholaris.graph.queries import (
+    DELETE_NODES_QUERY,
+    DUPLICATE_GROUPS_QUERY,
+    GROUP_EDGES_QUERY,
+    GROUP_NODES_QUERY,
+    MERGE_CANONICAL_QUERY,
+    MISSING_DEDUP_KEYS_QUERY,
+    PRUNE_RELATIONSHIPS_QUERY,
+    RECORD_DELETION_QUERY,
+    REMOVE_ORPHANS_QUERY,
+    UPDATE_NODE_PROPERTIES_QUERY,
+    bulk_merge_relationships_query,
+)
+from scholaris.types import Relation
+from scholaris.utils.helpers import generate_id, normalize_text
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+
+def dedup_key(node_id: str, text: Optional[str], label: Optional[str]) -> str:
+    normalized = normalize_text(text or "")
+    if not normalized:
+        return generate_id(f"id:{node_id}")
+    return generate_id(f"{label or ''}:{normalized}")
+
+
+def plan_merge(
+    nodes: list[dict[str, Any]], edges: list[dict[str, Any]]
+) -> dict[str, Any]:
+    canonical = min(node["id"] for node in nodes)
+    duplicates = sorted(node["id"] for node in nodes if node["id"] != canonical)
+    group = set(duplicates) | {canonical}
+
+    chunk_ids = list(
+        dict.fromkeys(chunk_id for node in nodes for chunk_id in node["chunk_ids"])
+    )
+    confidence = max(node["confidence"] for node in nodes)
+
+    rewired: dict[tuple[str, str, str], Relation] = {}
+    for edge in edges:
+        source = canonical if edge["source_id"] in group else edge["source_id"]
+        target = canonical if edge["target_id"] in group else edge["target_id"]
+        if source == target:
+            continue
+
+        properties = dict(edge["properties"])
+        relation = Relation.model_construct(
+            source_id=source,
+            target_id=target,
+            type=edge["type"],
+            confidence=properties.pop("confidence", 1.0),
+            weight=properties.pop("weight", 1),
+            provenance=dict(
+                zip(
+                    properties.pop("chunk_ids", []),
+                    properties.pop("chunk_weights", []),
+                )
+            ),
+            metadata=properties,
+        )
+        key = (source, target, edge["type"])
+        existing = rewired.get(key)
+        rewired[key] = (
+            relation if existing is None else merge_relations(existing, relation)
+        )
+
+    relationships: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for (source, target, rel_type), relation in sorted(rewired.items()):
+        relationships[rel_type].append(
+            {
+                "source_id": source,
+                "target_id": target,
+                "properties": {
+                    **relation.metadata,
+                    "confidence": relation.confidence,
+                    "weight": relation.weight,
+                    "chunk_ids": list(relation.provenance),
+                    "chunk_weights": list(relation.provenance.values()),
+                },
+            }
+        )
+
+    return {
+        "canonical": canonical,
+        "duplicates": duplicates,
+        "chunk_ids": chunk_ids,
+        "confidence": confidence,
+        "relationships": dict(relationships),
+    }
+
+
+class GraphCompactor:
+
+    def __init__(
+        self,
+        config: Config,
+        client: Neo4jClient,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        self.config = config
+        self.client = client
+        self.batch_size = batch_size or config.graph.write_batch_size
+
+    def assign_dedup_keys(self) -> int:
+        assigned = 0
+        while True:
+            nodes = self.client.execute_read(
+                MISSING_DEDUP_KEYS_QUERY, {"limit": self.batch_size}
+            )
+            if not nodes:
+                break
+
+            rows = [
+                {
+                    "id": node["id"],
+                    "properties": {
+                        "dedup_key": dedup_key(node["id"], node["text"], node["label"])
+                    },
+                }
+                for node in nodes
+            ]
+            self.client.execute_write(UPDATE_NODE_PROPERTIES_QUERY, {"rows": rows})
+            assigned += len(rows)
+            logger.info("dedup_keys_assigned", batch=len(rows), total=assigned)
+
+        return assigned
+
+    def merge_duplicates(self, after: str = "") -> dict[str, Any]:
+        merged: dict[str, Any] = {"groups": 0, "removed": 0, "after": after}
+
+        while True:
+            groups = self.client.execute_read(
+                DUPLICATE_GROUPS_QUERY, {"after": after, "limit": self.batch_size}
+            )
+            if not groups:
+                break
+
+            duplicates = [group["ids"] for group in groups if len(group["ids"]) > 1]
+            if duplicates:
+                removed = self.client.write_transaction(self._merge_groups, duplicates)
+                merged["groups"] += len(duplicates)
+                merged["removed"] += removed
+
+            after = groups[-1]["key"]
+            merged["after"] = after
+            logger.info("compaction_progress", phase="merge", **merged)
+
+        return merged
+
+    def _merge_groups(self, tx: ManagedTransaction, groups: list[list[str]]) -> int:
+        removed = 0
+        for ids in groups:
+            nodes = run_query(tx, GROUP_NODES_QUERY, {"ids": ids})
+            if len(nodes) < 2:
+                continue
+
+            canonical = min(node["id"] for node in nodes)
+            duplicates = [node["id"] for node in nodes if node["id"] != canonical]
+            edges = run_query(tx, GROUP_EDGES_QUERY, {"ids": duplicates})
+            plan = plan_merge(nodes, edges)
+
+            run_query(
+                tx,
+                MERGE_CANONICAL_QUERY,
+                {
+                    "id": plan["canonical"],
+                    "duplicates": plan["duplicates"],
+                    "chunk_ids": plan["chunk_ids"],
+                    "confidence": plan["confidence"],
+                },
+            )
+            run_query(tx, DELETE_NODES_QUERY, {"ids": plan["duplicates"]})
+            for rel_type, rows in plan["relationships"].items():
+                run_query(tx, bulk_merge_relationships_query(rel_type), {"rows": rows})
+
+            removed += len(plan["duplicates"])
+
+        if removed:
+            run_query(tx, RECORD_DELETION_QUERY)
+        return removed
+
+    def prune_relationships(self, min_confidence: Optional[float] = None) -> int:
+        threshold = (
+            min_confidence
+            if min_confidence is not None
+            else self.config.graph.min_confidence
+        )
+        records = self.client.execute_query(
+            PRUNE_RELATIONSHIPS_QUERY,
+            {"min_confidence": threshold, "batch_size": self.batch_size},
+        )
+        removed = records[0]["removed"] if records else 0
+        if removed:
+            self.client.execute_write(RECORD_DELETION_QUERY)
+        logger.info("relationships_pruned", removed=removed, threshold=threshold)
+        return removed
+
+    def remove_orphans(self) -> int:
+        records = self.client.execute_query(
+            REMOVE_ORPHANS_QUERY, {"batch_size": self.batch_size}
+        )
+        removed = records[0]["removed"] if records else 0
+        if removed:
+            self.client.execute_write(RECORD_DELETION_QUERY)
+        logger.info("orphans_removed", removed=removed)
+        return removed
+
+    def run(self, after: str = "", prune: bool = True) -> dict[str, Any]:
+        start_time = time.perf_counter()
+
+        stats: dict[str, Any] = {"keys_assigned": self.assign_dedup_keys()}
+        stats.update(self.merge_duplicates(after))
+        if prune:
+            stats["relationships_pruned"] = self.prune_relationships()
+            stats["orphans_removed"] = self.remove_orphans()
+
+        stats["seconds"] = round(time.perf_counter() - start_time, 3)
+        logger.info("graph_compacted", **stats)
+        return stats
@@ -0,0 +1,482 @@
+import difflib
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Iterator, Optional, Sequence
+
+from scholaris.config import Config
+from scholaris.graph.backend import GraphBackend
+from scholaris.graph.paths import PathFinder
+from scholaris.graph.queries import SEARCH_MODES
+from scholaris.graph.snapshot import GraphSnapshot
+from scholaris.types import GraphPath, GraphSubgraph
+from scholaris.utils.helpers import normalize_text
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+
+class EmbeddedGraphClient(GraphBackend):
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self._lock = threading.RLock()
+        self._graph = GraphSnapshot()
+        self._paths = PathFinder(
+            self._graph,
+            hub_degree=config.graph.hub_degree_threshold,
+            landmark_count=config.graph.landmark_count,
+        )
+        self._edge_properties: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._chunks: dict[str, dict[str, Any]] = {}
+        self._document_chunks: dict[str, set[str]] = defaultdict(set)
+        self._token_index: dict[str, set[int]] = defaultdict(set)
+        self._sorted_tokens: list[str] = []
+        self._clock = 0
+        self._deletions = 0
+        self._dirty = False
+
+        logger.info("embedded_graph_initialized")
+
+    def close(self) -> None:
+        logger.info("embedded_graph_closed")
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def _ensure_built(self) -> None:
+        if self._dirty:
+            self._graph.rebuild()
+            self._sorted_tokens = sorted(self._token_index)
+            self._dirty = False
+
+    def _upsert_node(self, label: str, properties: dict[str, Any]) -> dict[str, Any]:
+        node_id = properties.get("id")
+        if not node_id:
+            raise ValueError("Node properties must include an 'id'")
+
+        index = self._graph.add_node(node_id)
+        node = self._graph.node_properties[index]
+
+        for token in normalize_text(str(node.get("text", ""))).split():
+            self._token_index[token].discard(index)
+
+        chunk_ids = node.get("chunk_ids", [])
+        node.update(properties)
+        node["chunk_ids"] = chunk_ids + [
+            chunk_id
+            for chunk_id in properties.get("chunk_ids", [])
+            if chunk_id not in chunk_ids
+        ]
+        node["label"] = label
+        node["updated_at"] = self._tick()
+
+        for token in normalize_text(str(node.get("text", ""))).split():
+            self._token_index[token].add(index)
+
+        self._dirty = True
+        return node
+
+    def _upsert_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str,
+        properties: dict[str, Any],
+    ) -> dict[str, Any]:
+        source = self._graph.node_index.get(source_id)
+        target = self._graph.node_index.get(target_id)
+        if source is None or target is None:
+            return {}
+
+        key = (source_id, target_id, rel_type)
+        edge = self._edge_properties.setdefault(key, {})
+        previous_weight = edge.get("weight", 0)
+        chunk_ids = edge.get("chunk_ids", [])
+        chunk_weights = edge.get("chunk_weights", [])
+        confidences = [
+            c
+            for c in (edge.get("confidence"), properties.get("confidence"))
+            if c is not None
+        ]
+
+        edge.update(properties)
+        edge["weight"] = previous_weight + properties.get("weight", 1)
+        edge["chunk_ids"] = chunk_ids + properties.get("chunk_ids", [])
+        edge["chunk_weights"] = chunk_weights + properties.get("chunk_weights", [])
+        if confidences:
+            edge["confidence"] = max(confidences)
+        edge["updated_at"] = self._tick()
+
+        self._graph.add_edge(
+            source_id, target_id, rel_type, float(edge.get("confidence", 1.0))
+        )
+        for node in (source, target):
+            self._graph.node_properties[node]["updated_at"] = edge["updated_at"]
+
+        self._dirty = True
+        return edge
+
+    def create_node(self, label: str, properties: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            return dict(self._upsert_node(label, properties))
+
+    def create_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str,
+        properties: dict[str, Any],
+    ) -> dict[str, Any]:
+        with self._lock:
+            return dict(
+                self._upsert_relationship(source_id, target_id, rel_type, properties)
+            )
+
+    def find_node(
+        self, label: str, property_key: str, property_value: Any
+    ) -> Optional[dict[str, Any]]:
+        with self._lock:
+            if property_key == "id":
+                index = self._graph.node_index.get(property_value)
+                candidates: Sequence[int] = [] if index is None else [index]
+            else:
+                candidates = range(self._graph.node_count)
+
+            for index in candidates:
+                node = self._graph.node_properties[index]
+                if node.get("label") != label:
+                    continue
+                if node.get(property_key) == property_value:
+                    return dict(node)
+
+        return None
+
+    def bulk_create_nodes(
+        self,
+        label: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        with self._lock:
+            for row in rows:
+                self._upsert_node(label, row)
+        return len(rows)
+
+    def bulk_create_relationships(
+        self,
+        rel_type: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        written = 0
+        with self._lock:
+            for row in rows:
+                edge = self._upsert_relationship(
+                    row["source_id"], row["target_id"], rel_type, row["properties"]
+                )
+                written += bool(edge)
+        return written
+
+    def update_node_properties(
+        self, rows: list[dict[str, Any]], batch_size: Optional[int] = None
+    ) -> int:
+        written = 0
+        with self._lock:
+            for row in rows:
+                index = self._graph.node_index.get(row["id"])
+                if index is None:
+                    continue
+
+                node = self._graph.node_properties[index]
+                for key, value in row["properties"].items():
+                    if value is None:
+                        node.pop(key, None)
+                    else:
+                        node[key] = value
+                written += 1
+        return written
+
+    def document_chunks(self, document_id: str) -> list[str]:
+        with self._lock:
+            return sorted(self._document_chunks.get(document_id, ()))
+
+    def record_chunks(
+        self, rows: list[dict[str, Any]], batch_size: Optional[int] = None
+    ) -> int:
+        with self._lock:
+            for row in rows:
+                self._chunks[row["id"]] = dict(row)
+                self._document_chunks[row["document_id"]].add(row["id"])
+        return len(rows)
+
+    def remove_chunks(
+        self, chunk_ids: list[str], batch_size: Optional[int] = None
+    ) -> dict[str, int]:
+        removed = {"chunks": 0, "entities": 0, "relations": 0}
+
+        with self._lock:
+            stale = set(chunk_ids)
+            entity_ids: set[str] = set()
+            for chunk_id in chunk_ids:
+                chunk = self._chunks.pop(chunk_id, None)
+                if chunk is None:
+                    continue
+                removed["chunks"] += 1
+                entity_ids.update(chunk["entity_ids"])
+                self._document_chunks[chunk["document_id"]].discard(chunk_id)
+
+            for key, edge in list(self._edge_properties.items()):
+                if key[0] not in entity_ids:
+                    continue
+
+                pairs = list(
+                    zip(edge.get("chunk_ids", []), edge.get("chunk_weights", []))
+                )
+                keep = [(c, w) for c, w in pairs if c not in stale]
+                if len(keep) == len(pairs):
+                    continue
+
+                edge["weight"] -= sum(w for c, w in pairs if c in stale)
+                edge["chunk_ids"] = [c for c, _ in keep]
+                edge["chunk_weights"] = [w for _, w in keep]
+                edge["updated_at"] = self._tick()
+                if not keep:
+                    del self._edge_properties[key]
+                    removed["relations"] += 1
+
+            deleted: set[str] = set()
+            for entity_id in entity_ids:
+                index = self._graph.node_index.get(entity_id)
+                if index is None:
+                    continue
+
+                node = self._graph.node_properties[index]
+                node["chunk_ids"] = [
+                    c for c in node.get("chunk_ids", []) if c not in stale
+                ]
+                node["updated_at"] = self._tick()
+                if not node["chunk_ids"]:
+                    deleted.add(entity_id)
+
+            for key in list(self._edge_properties):
+                if key[0] in deleted or key[1] in deleted:
+                    del self._edge_properties[key]
+                    removed["relations"] += 1
+            removed["entities"] = len(deleted)
+
+            if removed["entities"] or removed["relations"]:
+                self._deletions += 1
+                self._compact(deleted)
+
+        logger.info("chunks_removed", **removed)
+        return removed
+
+    def _compact(self, deleted: set[str]) -> None:
+        nodes = [
+            node
+            for node in self._graph.node_properties
+            if node["id"] not in deleted
+        ]
+
+        self._graph = GraphSnapshot()
+        self._paths = PathFinder(
+            self._graph,
+            hub_degree=self.config.graph.hub_degree_threshold,
+            landmark_count=self.config.graph.landmark_count,
+        )
+        self._token_index = defaultdict(set)
+
+        for node in nodes:
+            index = self._graph.add_node(node["id"])
+            self._graph.node_properties[index] = node
+            for token in normalize_text(str(node.get("text", ""))).split():
+                self._token_index[token].add(index)
+
+        for (source_id, target_id, rel_type), edge in self._edge_properties.items():
+            self._graph.add_edge(
+                source_id, target_id, rel_type, float(edge.get("confidence", 1.0))
+            )
+
+        self._dirty = True
+
+    def search_entities(
+        self,
+        search_texts: list[str],
+        entity_types: Optional[list[str]] = None,
+        limit: int = 10,
+        mode: str = "prefix",
+    ) -> list[list[dict[str, Any]]]:
+        if mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Unsupported search mode: {mode}. Must be one of {SEARCH_MODES}"
+            )
+
+        with self._lock:
+            self._ensure_built()
+            return [
+                self._search(text, entity_types, limit, mode) for text in search_texts
+            ]
+
+    def _search(
+        self,
+        search_text: str,
+        entity_types: Optional[list[str]],
+        limit: int,
+        mode: str,
+    ) -> list[dict[str, Any]]:
+        terms = normalize_text(search_text).split()
+        if not terms:
+            return []
+
+        matches: Optional[set[int]] = None
+        for term in terms:
+            term_matches = set()
+            for token in self._matching_tokens(term, mode):
+                term_matches |= self._token_index[token]
+            matches = term_matches if matches is None else matches & term_matches
+            if not matches:
+                return []
+
+        phrase = " ".join(terms)
+        results: list[dict[str, Any]] = []
+        for index in matches or ():
+            node = self._graph.node_properties[index]
+            if entity_types and node.get("label") not in entity_types:
+                continue
+
+            text = normalize_text(str(node.get("text", "")))
+            if mode == "exact" and phrase not in text:
+                continue
+
+            score = len(terms) / max(len(text.split()), len(terms))
+            results.append({"n": dict(node), "score": score})
+
+        results.sort(key=lambda r: (-r["score"], r["n"].get("text", "")))
+        return results[:limit]
+
+    def _matching_tokens(self, term: str, mode: str) -> list[str]:
+        if mode == "exact":
+            return [term] if term in self._token_index else []
+
+        if mode == "fuzzy":
+            return difflib.get_close_matches(
+                term, self._sorted_tokens, n=10, cutoff=0.75
+            )
+
+        start = bisect_left(self._sorted_tokens, term)
+        end = bisect_left(self._sorted_tokens, term + "\uffff", lo=start)
+        return self._sorted_tokens[start:end]
+
+    def find_related(
+        self,
+        entity_id: str,
+        relation_types: Optional[list[str]] = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        with self._lock:
+            self._ensure_built()
+            return [
+                {**neighbor, "target": dict(neighbor["target"])}
+                for neighbor in self._graph.neighbors(entity_id, relation_types, limit)
+            ]
+
+    def expand_neighborhoods(
+        self,
+        seed_texts: Optional[list[str]] = None,
+        seed_ids: Optional[list[str]] = None,
+        max_hops: int = 1,
+        relation_types: Optional[list[str]] = None,
+        entity_types: Optional[list[str]] = None,
+        per_seed_limit: int = 25,
+        matches_per_seed: int = 1,
+        mode: str = "prefix",
+    ) -> GraphSubgraph:
+        with self._lock:
+            self._ensure_built()
+
+            seeds = {
+                text: [
+                    result["n"]["id"]
+                    for result in self._search(
+                        text, entity_types, matches_per_seed, mode
+                    )
+                ]
+                for text in seed_texts or []
+            }
+            for node_id in seed_ids or []:
+                seeds[node_id] = [node_id]
+
+            return self._graph.expand(
+                seeds,
+                max_hops,
+                relation_types,
+                per_seed_limit,
+                hub_degree=self.config.graph.hub_degree_threshold,
+            )
+
+    def find_shortest_path(
+        self, source_id: str, target_id: str, max_hops: int
+    ) -> Optional[GraphPath]:
+        with self._lock:
+            self._ensure_built()
+            path = self._paths.shortest_path(source_id, target_id, max_hops)
+
+        if path is not None:
+            self._fill_edge_properties(path)
+        return path
+
+    def find_k_shortest_paths(
+        self, source_id: str, target_id: str, k: int, max_hops: int
+    ) -> list[GraphPath]:
+        with self._lock:
+            self._ensure_built()
+            paths = self._paths.k_shortest_paths(source_id, target_id, k, max_hops)
+
+        for path in paths:
+            self._fill_edge_properties(path)
+        return paths
+
+    def _fill_edge_properties(self, path: GraphPath) -> None:
+        for edge in path.edges:
+            key = (edge.source, edge.target, edge.type)
+            edge.properties = dict(self._edge_properties.get(key, {}))
+
+    def deletion_count(self) -> int:
+        with self._lock:
+            return self._deletions
+
+    def iter_nodes(
+        self, since: int = 0, fetch_size: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            nodes = [
+                {
+                    "id": node["id"],
+                    "text": node.get("text"),
+                    "label": node.get("label"),
+                    "updated_at": node.get("updated_at", 0),
+                }
+                for node in self._graph.node_properties
+                if node.get("updated_at", 0) >= since
+            ]
+        return iter(nodes)
+
+    def iter_edges(
+        self, since: int = 0, fetch_size: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            edges = [
+                {
+                    "source_id": source_id,
+                    "target_id": target_id,
+                    "type": rel_type,
+                    "confidence": properties.get("confidence", 1.0),
+                }
+                for (source_id, target_id, rel_type), properties in (
+                    self._edge_properties.items()
+                )
+                if properties.get("updated_at", 0) >= since
+            ]
+        return iter(edges)
@@ -1,19 +1,367 @@
-from typing import Any, Optional
+import heapq
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
 
-from neo4j import GraphDatabase, Driver, Session
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    Driver,
+    GraphDatabase,
+    ManagedTransaction,
+    Session,
+)
 from neo4j.exceptions import ServiceUnavailable
 
 from scholaris.config import Config
+from scholaris.graph.backend import GraphBackend
+from scholaris.graph.queries import (
+    CHUNK_LABEL,
+    DELETE_CHUNKS_QUERY,
+    DELETION_COUNT_QUERY,
+    DOCUMENT_CHUNKS_QUERY,
+    ENTITY_LABEL,
+    EXPORT_EDGES_QUERY,
+    EXPORT_NODES_QUERY,
+    FULLTEXT_INDEX,
+    GRAPH_META_LABEL,
+    RECORD_CHUNKS_QUERY,
+    RECORD_DELETION_QUERY,
+    REMOVE_CHUNK_ENTITIES_QUERY,
+    REMOVE_CHUNK_RELATIONS_QUERY,
+    UPDATE_NODE_PROPERTIES_QUERY,
+    bulk_merge_nodes_query,
+    bulk_merge_relationships_query,
+    expand_neighborhoods_query,
+    expansion_params,
+    find_node_query,
+    merge_node_query,
+    merge_relationship_query,
+    related_entities_query,
+    search_entities_query,
+    search_params,
+    shortest_path_query,
+    spur_paths_query,
+    validate_identifier,
+)
+from scholaris.types import GraphEdge, GraphNode, GraphPath, GraphSubgraph
+from scholaris.utils.helpers import chunk_list
 from scholaris.utils.logging import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
+T = TypeVar("T")
+
 
 class GraphConnectionError(Exception):
     pass
 
 
-class Neo4jClient:
+def run_query(
+    tx: ManagedTransaction, query: str, parameters: Optional[dict[str, Any]] = None
+) -> list[dict[str, Any]]:
+    result = tx.run(query, parameters or {})
+    return [dict(record) for record in result]
+
+
+def type_label(labels: Any) -> str:
+    type_labels = sorted(label for label in labels if label != ENTITY_LABEL)
+    return type_labels[0] if type_labels else ""
+
+
+def build_graph_path(result: dict[str, Any]) -> GraphPath:
+    nodes = [
+        GraphNode(
+            id=node.get("id", ""),
+            label=type_label(node.labels),
+            properties=dict(node),
+        )
+        for node in result.get("nodes", [])
+    ]
+
+    edges = [
+        GraphEdge(
+            source=edge.start_node.get("id", ""),
+            target=edge.end_node.get("id", ""),
+            type=edge.type,
+            properties=dict(edge),
+        )
+        for edge in result.get("edges", [])
+    ]
+
+    return GraphPath(nodes=nodes, edges=edges, length=len(edges))
+
+
+def build_subgraph(
+    seeds: list[dict[str, Any]], records: list[dict[str, Any]]
+) -> GraphSubgraph:
+    matches: dict[str, list[str]] = {seed["key"]: [] for seed in seeds}
+    nodes: dict[str, GraphNode] = {}
+    edges: dict[tuple[str, str, str], GraphEdge] = {}
+
+    for record in records:
+        matches[record["seed"]].append(record["start_id"])
+
+        for node in record["nodes"]:
+            if node["id"] not in nodes:
+                nodes[node["id"]] = GraphNode(
+                    id=node["id"], label=node.get("label") or "", properties=node
+                )
+
+        for edge in record["edges"]:
+            key = (edge["source"], edge["target"], edge["type"])
+            if key not in edges:
+                edges[key] = GraphEdge(
+                    source=edge["source"],
+                    target=edge["target"],
+                    type=edge["type"],
+                    properties={"confidence": edge["confidence"]},
+                )
+
+    return GraphSubgraph(
+        seeds=matches, nodes=list(nodes.values()), edges=list(edges.values())
+    )
+
+
+def driver_options(config: Config) -> dict[str, Any]:
+    return {
+        "auth": (config.neo4j.user, config.neo4j.password),
+        "max_connection_lifetime": config.neo4j.max_connection_lifetime,
+        "max_connection_pool_size": config.neo4j.max_connection_pool_size,
+        "max_transaction_retry_time": config.neo4j.max_transaction_retry_time,
+    }
+
+
+def connection_error(
+    event: str, message: str, error: Exception, **log_fields: Any
+) -> GraphConnectionError:
+    logger.error(event, error=str(error), **log_fields)
+    return GraphConnectionError(f"{message}: {error}")
+
+
+def first_value(records: list[dict[str, Any]], key: str, default: Any = None) -> Any:
+    return records[0][key] if records else default
+
+
+def node_params(properties: dict[str, Any]) -> dict[str, Any]:
+    if not properties.get("id"):
+        raise ValueError("Node properties must include an 'id'")
+    return {"properties": properties}
+
+
+def relationship_params(
+    source_id: str, target_id: str, properties: dict[str, Any]
+) -> dict[str, Any]:
+    return {
+        "source_id": source_id,
+        "target_id": target_id,
+        "properties": properties,
+    }
+
+
+def search_requests(
+    search_texts: list[str],
+    entity_types: Optional[list[str]],
+    limit: int,
+    mode: str,
+) -> tuple[str, list[Optional[dict[str, Any]]]]:
+    query = search_entities_query(filter_labels=bool(entity_types))
+    return query, [
+        search_params(text, entity_types, limit, mode) for text in search_texts
+    ]
+
+
+def expansion_request(
+    config: Config,
+    seed_texts: Optional[list[str]],
+    seed_ids: Optional[list[str]],
+    max_hops: int,
+    relation_types: Optional[list[str]],
+    entity_types: Optional[list[str]],
+    per_seed_limit: int,
+    matches_per_seed: int,
+    mode: str,
+) -> Optional[tuple[str, dict[str, Any]]]:
+    params = expansion_params(
+        seed_texts or [],
+        seed_ids or [],
+        entity_types,
+        mode,
+        matches_per_seed,
+        per_seed_limit,
+    )
+    if not params["seeds"]:
+        return None
+
+    hub_degree = config.graph.hub_degree_threshold
+    params["hub_degree"] = hub_degree
+    return expand_neighborhoods_query(max_hops, relation_types, hub_degree), params
+
+
+def path_request(
+    config: Config, source_id: str, target_id: str, max_hops: int
+) -> tuple[str, dict[str, Any]]:
+    hub_degree = config.graph.hub_degree_threshold
+    return shortest_path_query(max_hops, hub_degree), {
+        "source_id": source_id,
+        "target_id": target_id,
+        "hub_degree": hub_degree,
+    }
+
+
+PathRecord = tuple[list[Any], list[Any]]
+
+
+class KShortestPathSearch:
+
+    def __init__(
+        self, config: Config, source_id: str, target_id: str, k: int, max_hops: int
+    ) -> None:
+        self.target_id = target_id
+        self.k = k
+        self.max_hops = max_hops
+        self.hub_degree = config.graph.hub_degree_threshold
+        self.query = spur_paths_query(max_hops, self.hub_degree)
+
+        self.accepted: list[PathRecord] = []
+        self.candidates: list[tuple[int, tuple[str, ...], PathRecord]] = []
+        self.seen: set[tuple[str, ...]] = set()
+        self.spurs: list[dict[str, Any]] = []
+        self.roots: list[PathRecord] = []
+        if k > 0:
+            self._add_spur(source_id, max_hops, [], [], ([], []))
+
+    def _add_spur(
+        self,
+        source_id: str,
+        max_hops: int,
+        banned_nodes: list[str],
+        banned_edges: list[str],
+        root: PathRecord,
+    ) -> None:
+        self.spurs.append(
+            {
+                "index": len(self.spurs),
+                "source_id": source_id,
+                "max_hops": max_hops,
+                "banned_nodes": banned_nodes,
+                "banned_edges": banned_edges,
+            }
+        )
+        self.roots.append(root)
+
+    def request(self) -> Optional[tuple[str, dict[str, Any]]]:
+        if not self.spurs:
+            return None
+        return self.query, {
+            "target_id": self.target_id,
+            "hub_degree": self.hub_degree,
+            "spurs": self.spurs,
+        }
+
+    def add_results(self, records: list[dict[str, Any]]) -> None:
+        for record in records:
+            root_nodes, root_edges = self.roots[record["spur"]]
+            route = (
+                root_nodes + list(record["nodes"]),
+                root_edges + list(record["edges"]),
+            )
+            key = tuple(edge.element_id for edge in route[1])
+            if key not in self.seen:
+                self.seen.add(key)
+                heapq.heappush(self.candidates, (len(key), key, route))
+
+        self.spurs, self.roots = [], []
+        if len(self.accepted) >= self.k or not self.candidates:
+            return
+
+        self.accepted.append(heapq.heappop(self.candidates)[2])
+        if len(self.accepted) < self.k:
+            self._plan_spurs(self.accepted[-1])
+
+    def _plan_spurs(self, route: PathRecord) -> None:
+        nodes, edges = route
+        node_ids = [node.get("id") for node in nodes]
+        edge_ids = [edge.element_id for edge in edges]
+
+        for i in range(len(nodes) - 1):
+            banned_edges = [
+                path_edges[i].element_id
+                for path_nodes, path_edges in self.accepted
+                if len(path_edges) > i
+                and [node.get("id") for node in path_nodes[: i + 1]]
+                == node_ids[: i + 1]
+                and [edge.element_id for edge in path_edges[:i]] == edge_ids[:i]
+            ]
+            self._add_spur(
+                node_ids[i],
+                self.max_hops - i,
+                node_ids[:i],
+                banned_edges,
+                (nodes[:i], edges[:i]),
+            )
+
+    def paths(self) -> list[GraphPath]:
+        return [
+            build_graph_path({"nodes": nodes, "edges": edges})
+            for nodes, edges in self.accepted
+        ]
+
+
+def index_queries(entity_types: list[str]) -> list[str]:
+    indexes = [
+        f"CREATE CONSTRAINT entity_id_unique IF NOT EXISTS "
+        f"FOR (n:{ENTITY_LABEL}) REQUIRE n.id IS UNIQUE",
+        f"CREATE INDEX entity_updated_at_index IF NOT EXISTS "
+        f"FOR (n:{ENTITY_LABEL}) ON (n.updated_at)",
+        f"CREATE INDEX entity_dedup_key_index IF NOT EXISTS "
+        f"FOR (n:{ENTITY_LABEL}) ON (n.dedup_key)",
+        f"CREATE CONSTRAINT chunk_id_unique IF NOT EXISTS "
+        f"FOR (c:{CHUNK_LABEL}) REQUIRE c.id IS UNIQUE",
+        f"CREATE INDEX chunk_document_id_index IF NOT EXISTS "
+        f"FOR (c:{CHUNK_LABEL}) ON (c.document_id)",
+        f"CREATE CONSTRAINT graph_meta_id_unique IF NOT EXISTS "
+        f"FOR (m:{GRAPH_META_LABEL}) REQUIRE m.id IS UNIQUE",
+    ]
+
+    for entity_type in entity_types:
+        label = validate_identifier(entity_type)
+        indexes.append(
+            f"CREATE INDEX {label.lower()}_id_index IF NOT EXISTS "
+            f"FOR (n:{label}) ON (n.id)"
+        )
+
+    return indexes
+
+
+FULLTEXT_INDEX_QUERY = (
+    f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX} IF NOT EXISTS "
+    f"FOR (n:{ENTITY_LABEL}) ON EACH [n.text]"
+)
+
+
+def batch_parameters(
+    rows: list[dict[str, Any]], size: int
+) -> Iterator[dict[str, Any]]:
+    for batch in chunk_list(rows, size):
+        yield {"rows": batch}
+
+
+def log_bulk_write(
+    written: int, size: int, start_time: float, **log_fields: Any
+) -> None:
+    elapsed = time.perf_counter() - start_time
+    logger.debug(
+        "bulk_write_completed",
+        rows=written,
+        batches=-(-written // size),
+        seconds=round(elapsed, 3),
+        rows_per_sec=int(written / elapsed) if elapsed > 0 else written,
+        **log_fields,
+    )
+
+
+class Neo4jClient(GraphBackend):
     def __init__(self, config: Config) -> None:
         self.config = config
         self.driver: Optional[Driver] = None
@@ -22,10 +370,7 @@ class Neo4jClient:
     def _connect(self) -> None:
         try:
             self.driver = GraphDatabase.driver(
-                self.config.neo4j.uri,
-                auth=(self.config.neo4j.user, self.config.neo4j.password),
-                max_connection_lifetime=self.config.neo4j.max_connection_lifetime,
-                max_connection_pool_size=self.config.neo4j.max_connection_pool_size,
+                self.config.neo4j.uri, **driver_options(self.config)
             )
 
             self.driver.verify_connectivity()
@@ -64,18 +409,98 @@ class Neo4jClient:
                 return records
 
         except Exception as e:
-            logger.error("query_failed", query=query[:100], error=str(e))
-            raise GraphConnectionError(f"Query execution failed: {e}") from e
+            raise connection_error(
+                "query_failed", "Query execution failed", e, query=query[:100]
+            ) from e
+
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+        fetch_size: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        if not self.driver:
+            raise GraphConnectionError("Not connected to Neo4j")
+
+        streamed = 0
+        try:
+            with self.driver.session(
+                database=self.config.neo4j.database,
+                default_access_mode=READ_ACCESS,
+                fetch_size=fetch_size or self.config.neo4j.fetch_size,
+            ) as session:
+                for record in session.run(query, parameters or {}):
+                    streamed += 1
+                    yield dict(record)
+
+        except Exception as e:
+            raise connection_error(
+                "stream_failed",
+                "Streaming query failed",
+                e,
+                query=query[:100],
+                streamed=streamed,
+            ) from e
+
+        logger.debug("query_streamed", query=query[:100], results=streamed)
+
+    @contextmanager
+    def session(self, access_mode: str = WRITE_ACCESS) -> Iterator[Session]:
+        if not self.driver:
+            raise GraphConnectionError("Not connected to Neo4j")
+
+        with self.driver.session(
+            database=self.config.neo4j.database, default_access_mode=access_mode
+        ) as session:
+            yield session
+
+    def read_transaction(
+        self, work: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        try:
+            with self.session(READ_ACCESS) as session:
+                return session.execute_read(work, *args, **kwargs)
+
+        except GraphConnectionError:
+            raise
+        except Exception as e:
+            raise connection_error(
+                "read_transaction_failed", "Read transaction failed", e
+            ) from e
+
+    def write_transaction(
+        self, work: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        try:
+            with self.session(WRITE_ACCESS) as session:
+                return session.execute_write(work, *args, **kwargs)
+
+        except GraphConnectionError:
+            raise
+        except Exception as e:
+            raise connection_error(
+                "write_transaction_failed", "Write transaction failed", e
+            ) from e
+
+    def execute_read(
+        self, query: str, parameters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        records = self.read_transaction(run_query, query, parameters)
+        logger.debug("read_executed", query=query[:100], results=len(records))
+        return records
+
+    def execute_write(
+        self, query: str, parameters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        records = self.write_transaction(run_query, query, parameters)
+        logger.debug("write_executed", query=query[:100], results=len(records))
+        return records
 
     def create_node(
         self, label: str, properties: dict[str, Any]
     ) -> dict[str, Any]:
-        query = f"""
-        CREATE (n:{label} $properties)
-        RETURN n
-        """
-        result = self.execute_query(query, {"properties": properties})
-        return result[0]["n"] if result else {}
+        result = self.execute_write(merge_node_query(label), node_params(properties))
+        return first_value(result, "n", {})
 
     def create_relationship(
         self,
@@ -84,27 +509,215 @@ class Neo4jClient:
         rel_type: str,
         properties: dict[str, Any],
     ) -> dict[str, Any]:
-        query = f"""
-        MATCH (source {{id: $source_id}})
-        MATCH (target {{id: $target_id}})
-        CREATE (source)-[r:{rel_type} $properties]->(target)
-        RETURN r
-        """
-        params = {
-            "source_id": source_id,
-            "target_id": target_id,
-            "properties": properties,
-        }
-        result = self.execute_query(query, params)
-        return result[0]["r"] if result else {}
+        result = self.execute_write(
+            merge_relationship_query(rel_type),
+            relationship_params(source_id, target_id, properties),
+        )
+        return first_value(result, "r", {})
 
     def find_node(
         self, label: str, property_key: str, property_value: Any
     ) -> Optional[dict[str, Any]]:
-        query = f"""
-        MATCH (n:{label} {{{property_key}: $value}})
-        RETURN n
-        LIMIT 1
-        """
-        result = self.execute_query(query, {"value": property_value})
-        return result[0]["n"] if result else None
\ No newline at end of file
+        query = find_node_query(label, property_key)
+        result = self.execute_read(query, {"value": property_value})
+        return first_value(result, "n")
+
+    def search_entities(
+        self,
+        search_texts: list[str],
+        entity_types: Optional[list[str]] = None,
+        limit: int = 10,
+        mode: str = "prefix",
+    ) -> list[list[dict[str, Any]]]:
+        query, param_sets = search_requests(search_texts, entity_types, limit, mode)
+
+        def search_all(tx: ManagedTransaction) -> list[list[dict[str, Any]]]:
+            return [
+                run_query(tx, query, params) if params is not None else []
+                for params in param_sets
+            ]
+
+        return self.read_transaction(search_all)
+
+    def find_related(
+        self,
+        entity_id: str,
+        relation_types: Optional[list[str]] = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        query = related_entities_query(relation_types)
+        return self.execute_read(query, {"entity_id": entity_id, "limit": limit})
+
+    def expand_neighborhoods(
+        self,
+        seed_texts: Optional[list[str]] = None,
+        seed_ids: Optional[list[str]] = None,
+        max_hops: int = 1,
+        relation_types: Optional[list[str]] = None,
+        entity_types: Optional[list[str]] = None,
+        per_seed_limit: int = 25,
+        matches_per_seed: int = 1,
+        mode: str = "prefix",
+    ) -> GraphSubgraph:
+        request = expansion_request(
+            self.config,
+            seed_texts,
+            seed_ids,
+            max_hops,
+            relation_types,
+            entity_types,
+            per_seed_limit,
+            matches_per_seed,
+            mode,
+        )
+        if request is None:
+            return GraphSubgraph()
+
+        query, params = request
+        return build_subgraph(params["seeds"], self.execute_read(query, params))
+
+    def find_shortest_path(
+        self, source_id: str, target_id: str, max_hops: int
+    ) -> Optional[GraphPath]:
+        query, params = path_request(self.config, source_id, target_id, max_hops)
+        results = self.execute_read(query, params)
+
+        if not results:
+            return None
+
+        return build_graph_path(results[0])
+
+    def find_k_shortest_paths(
+        self, source_id: str, target_id: str, k: int, max_hops: int
+    ) -> list[GraphPath]:
+        search = KShortestPathSearch(self.config, source_id, target_id, k, max_hops)
+        request = search.request()
+        while request is not None:
+            search.add_results(self.execute_read(*request))
+            request = search.request()
+        return search.paths()
+
+    def deletion_count(self) -> int:
+        return first_value(self.execute_read(DELETION_COUNT_QUERY), "deletions", 0)
+
+    def iter_nodes(
+        self, since: int = 0, fetch_size: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        return self.stream_query(EXPORT_NODES_QUERY, {"since": since}, fetch_size)
+
+    def iter_edges(
+        self, since: int = 0, fetch_size: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        return self.stream_query(EXPORT_EDGES_QUERY, {"since": since}, fetch_size)
+
+    def create_indexes(self, entity_types: list[str]) -> None:
+        for index_query in index_queries(entity_types):
+            try:
+                self.execute_query(index_query)
+                logger.info("index_created", query=index_query[:50])
+            except Exception as e:
+                logger.error(
+                    "index_creation_failed", query=index_query[:50], error=str(e)
+                )
+
+    def create_fulltext_index(self) -> None:
+        try:
+            self.execute_query(FULLTEXT_INDEX_QUERY)
+            logger.info("fulltext_index_created", index=FULLTEXT_INDEX)
+        except Exception as e:
+            logger.error(
+                "fulltext_index_creation_failed", index=FULLTEXT_INDEX, error=str(e)
+            )
+
+    def bulk_create_nodes(
+        self,
+        label: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        query = bulk_merge_nodes_query(label)
+        return self._write_batches(query, rows, batch_size, label=label)
+
+    def bulk_create_relationships(
+        self,
+        rel_type: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        query = bulk_merge_relationships_query(rel_type)
+        return self._write_batches(query, rows, batch_size, rel_type=rel_type)
+
+    def update_node_properties(
+        self, rows: list[dict[str, Any]], batch_size: Optional[int] = None
+    ) -> int:
+        return self._write_batches(UPDATE_NODE_PROPERTIES_QUERY, rows, batch_size)
+
+    def document_chunks(self, document_id: str) -> list[str]:
+        records = self.execute_read(
+            DOCUMENT_CHUNKS_QUERY, {"document_id": document_id}
+        )
+        return [record["id"] for record in records]
+
+    def record_chunks(
+        self, rows: list[dict[str, Any]], batch_size: Optional[int] = None
+    ) -> int:
+        return self._write_batches(RECORD_CHUNKS_QUERY, rows, batch_size)
+
+    def remove_chunks(
+        self, chunk_ids: list[str], batch_size: Optional[int] = None
+    ) -> dict[str, int]:
+        def remove(tx: ManagedTransaction, batch: list[str]) -> dict[str, int]:
+            params = {"chunk_ids": batch}
+            relations = run_query(tx, REMOVE_CHUNK_RELATIONS_QUERY, params)
+            entities = run_query(tx, REMOVE_CHUNK_ENTITIES_QUERY, params)
+            run_query(tx, DELETE_CHUNKS_QUERY, params)
+            counts = {
+                "entities": entities[0]["removed"],
+                "relations": relations[0]["removed"],
+            }
+            if counts["entities"] or counts["relations"]:
+                run_query(tx, RECORD_DELETION_QUERY)
+            return counts
+
+        removed = {"chunks": 0, "entities": 0, "relations": 0}
+        size = batch_size or self.config.graph.write_batch_size
+        for batch in chunk_list(chunk_ids, size):
+            counts = self.write_transaction(remove, batch)
+            removed["chunks"] += len(batch)
+            removed["entities"] += counts["entities"]
+            removed["relations"] += counts["relations"]
+
+        logger.info("chunks_removed", **removed)
+        return removed
+
+    def _write_batches(
+        self,
+        query: str,
+        rows: list[dict[str, Any]],
+        batch_size: Optional[int] = None,
+        **log_fields: Any,
+    ) -> int:
+        if not rows:
+            return 0
+
+        size = batch_size or self.config.graph.write_batch_size
+        start_time = time.perf_counter()
+        written = 0
+
+        try:
+            with self.session(WRITE_ACCESS) as session:
+                for params in batch_parameters(rows, size):
+                    session.execute_write(run_query, query, params)
+                    written += len(params["rows"])
+
+        except Exception as e:
+            raise connection_error(
+                "bulk_write_failed",
+                "Bulk write failed",
+                e,
+                written=written,
+                **log_fields,
+            ) from e
+
+        log_bulk_write(written, size, start_time, **log_fields)
+        return written
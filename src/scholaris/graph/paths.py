@@ -0,0 +1,282 @@
+import heapq
+from typing import Optional
+
+import numpy as np
+
+from scholaris.graph.snapshot import GraphSnapshot
+from scholaris.types import GraphPath
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+UNREACHABLE = np.iinfo(np.int32).max
+
+Route = tuple[list[int], list[int]]
+
+
+class _Frontier:
+
+    def __init__(self, root: int, node_count: int) -> None:
+        self.root = root
+        self.level = 0
+        self.frontier = np.asarray([root], dtype=np.int64)
+        self.depth = np.full(node_count, -1, dtype=np.int32)
+        self.parent = np.full(node_count, -1, dtype=np.int64)
+        self.edge = np.full(node_count, -1, dtype=np.int64)
+        self.depth[root] = 0
+
+
+class PathFinder:
+
+    def __init__(
+        self,
+        snapshot: GraphSnapshot,
+        hub_degree: int = 0,
+        landmark_count: int = 0,
+    ) -> None:
+        self.snapshot = snapshot
+        self.hub_degree = hub_degree
+        self.landmark_count = landmark_count
+
+        self.landmarks = np.empty(0, dtype=np.int64)
+        self.landmark_distances = np.empty((0, 0), dtype=np.int32)
+        self._degrees = np.empty(0, dtype=np.int64)
+        self._generation = -1
+
+    def _sync(self) -> None:
+        if self._generation == self.snapshot.generation:
+            return
+
+        self._generation = self.snapshot.generation
+        self._degrees = np.diff(self.snapshot.indptr)
+        self.build_landmarks(self.landmark_count)
+
+    def build_landmarks(self, count: int) -> None:
+        graph = self.snapshot
+        count = min(count, graph.node_count)
+
+        landmarks: list[int] = []
+        distances = np.full((count, graph.node_count), -1, dtype=np.int32)
+        nearest = np.full(graph.node_count, UNREACHABLE, dtype=np.int64)
+        covered = np.zeros(graph.node_count, dtype=bool)
+
+        landmark = int(np.argmax(self._degrees)) if count else -1
+        for row in range(count):
+            landmarks.append(landmark)
+            distances[row] = self._distances_from(landmark)
+
+            reachable = distances[row] >= 0
+            covered |= reachable
+            nearest = np.where(
+                reachable, np.minimum(nearest, distances[row]), nearest
+            )
+
+            score = np.where(covered, nearest, -1)
+            landmark = int(np.argmax(score))
+            if score[landmark] <= 0:
+                uncovered = np.flatnonzero(~covered)
+                if uncovered.size == 0:
+                    break
+                landmark = int(uncovered[np.argmax(self._degrees[uncovered])])
+
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.landmark_distances = distances[: len(landmarks)]
+
+        if landmarks:
+            logger.info("landmarks_built", landmarks=len(landmarks))
+
+    def _distances_from(self, node: int) -> np.ndarray:
+        graph = self.snapshot
+        distances = np.full(graph.node_count, -1, dtype=np.int32)
+        distances[node] = 0
+        frontier = np.asarray([node], dtype=np.int64)
+
+        hop = 0
+        while frontier.size:
+            hop += 1
+            _, positions = graph.gather(frontier)
+            reached = np.unique(graph.indices[positions])
+            frontier = reached[distances[reached] < 0].astype(np.int64)
+            distances[frontier] = hop
+
+        return distances
+
+    def _lower_bounds(self, nodes: np.ndarray, goal: int) -> np.ndarray:
+        if self.landmarks.size == 0:
+            return np.zeros(nodes.size, dtype=np.int64)
+
+        from_nodes = self.landmark_distances[:, nodes].astype(np.int64)
+        to_goal = self.landmark_distances[:, [goal]].astype(np.int64)
+
+        both = (from_nodes >= 0) & (to_goal >= 0)
+        split = (from_nodes >= 0) != (to_goal >= 0)
+
+        bounds = np.where(both, np.abs(from_nodes - to_goal), 0).max(axis=0)
+        return np.where(split.any(axis=0), UNREACHABLE, bounds)
+
+    def distance_lower_bound(self, source_id: str, target_id: str) -> Optional[int]:
+        endpoints = self._endpoints(source_id, target_id)
+        if endpoints is None:
+            return None
+
+        source, target = endpoints
+        bound = int(self._lower_bounds(np.asarray([source]), target)[0])
+        return None if bound == UNREACHABLE else bound
+
+    def _search(
+        self,
+        source: int,
+        target: int,
+        max_hops: int,
+        banned_nodes: Optional[np.ndarray] = None,
+        banned_edges: Optional[np.ndarray] = None,
+    ) -> Optional[Route]:
+        if source == target:
+            return [source], []
+
+        if self._lower_bounds(np.asarray([source]), target)[0] > max_hops:
+            return None
+
+        graph = self.snapshot
+        blocked = np.zeros(graph.node_count, dtype=bool)
+        if banned_nodes is not None:
+            blocked |= banned_nodes
+        if self.hub_degree:
+            blocked |= self._degrees > self.hub_degree
+        blocked[[source, target]] = False
+
+        forward = _Frontier(source, graph.node_count)
+        backward = _Frontier(target, graph.node_count)
+
+        while forward.level + backward.level < max_hops:
+            if forward.frontier.size == 0 or backward.frontier.size == 0:
+                return None
+
+            side, other = forward, backward
+            if self._degrees[backward.frontier].sum() < (
+                self._degrees[forward.frontier].sum()
+            ):
+                side, other = backward, forward
+
+            parents, positions = graph.gather(side.frontier)
+            if banned_edges is not None and banned_edges.size:
+                keep = ~np.isin(graph.edge_ids[positions], banned_edges)
+                parents, positions = parents[keep], positions[keep]
+
+            reached = graph.indices[positions].astype(np.int64)
+            reached, first = np.unique(reached, return_index=True)
+            fresh = (side.depth[reached] < 0) & ~blocked[reached]
+            reached, first = reached[fresh], first[fresh]
+
+            side.level += 1
+            if reached.size and self.landmarks.size:
+                bounds = self._lower_bounds(reached, other.root)
+                keep = side.level + bounds <= max_hops
+                reached, first = reached[keep], first[keep]
+
+            side.depth[reached] = side.level
+            side.parent[reached] = parents[first]
+            side.edge[reached] = positions[first]
+            side.frontier = reached
+
+            meets = reached[other.depth[reached] >= 0]
+            if meets.size:
+                meet = int(meets[np.argmin(other.depth[meets])])
+                return self._join(forward, backward, meet)
+
+        return None
+
+    def _join(self, forward: _Frontier, backward: _Frontier, meet: int) -> Route:
+        chain = [meet]
+        positions = []
+        while chain[-1] != forward.root:
+            positions.append(int(forward.edge[chain[-1]]))
+            chain.append(int(forward.parent[chain[-1]]))
+
+        chain.reverse()
+        positions.reverse()
+
+        node = meet
+        while node != backward.root:
+            positions.append(int(backward.edge[node]))
+            node = int(backward.parent[node])
+            chain.append(node)
+
+        return chain, positions
+
+    def _endpoints(
+        self, source_id: str, target_id: str
+    ) -> Optional[tuple[int, int]]:
+        self._sync()
+        source = self.snapshot.node_index.get(source_id)
+        target = self.snapshot.node_index.get(target_id)
+        if source is None or target is None:
+            return None
+        return source, target
+
+    def shortest_path(
+        self, source_id: str, target_id: str, max_hops: int
+    ) -> Optional[GraphPath]:
+        endpoints = self._endpoints(source_id, target_id)
+        if endpoints is None:
+            return None
+
+        route = self._search(*endpoints, max_hops)
+        if route is None:
+            return None
+
+        return self.snapshot.path_from_positions(*route)
+
+    def k_shortest_paths(
+        self, source_id: str, target_id: str, k: int, max_hops: int
+    ) -> list[GraphPath]:
+        endpoints = self._endpoints(source_id, target_id)
+        if endpoints is None or k < 1:
+            return []
+
+        source, target = endpoints
+        first = self._search(source, target, max_hops)
+        if first is None:
+            return []
+
+        edge_ids = self.snapshot.edge_ids
+        accepted = [first]
+        seen = {tuple(edge_ids[first[1]].tolist())}
+        candidates: list[tuple[int, tuple[int, ...], Route]] = []
+
+        while len(accepted) < k:
+            chain, positions = accepted[-1]
+
+            for i in range(len(chain) - 1):
+                root = chain[: i + 1]
+                root_edges = edge_ids[positions[:i]].tolist()
+                banned_edges = np.asarray(
+                    [
+                        edge_ids[path_positions[i]]
+                        for path_chain, path_positions in accepted
+                        if len(path_positions) > i
+                        and path_chain[: i + 1] == root
+                        and edge_ids[path_positions[:i]].tolist() == root_edges
+                    ],
+                    dtype=np.int64,
+                )
+                banned_nodes = np.zeros(self.snapshot.node_count, dtype=bool)
+                banned_nodes[root[:-1]] = True
+
+                spur = self._search(
+                    chain[i], target, max_hops - i, banned_nodes, banned_edges
+                )
+                if spur is None:
+                    continue
+
+                route = (root[:-1] + spur[0], positions[:i] + spur[1])
+                key = tuple(edge_ids[route[1]].tolist())
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (len(route[1]), key, route))
+
+            if not candidates:
+                break
+            accepted.append(heapq.heappop(candidates)[2])
+
+        return [self.snapshot.path_from_positions(*route) for route in accepted]
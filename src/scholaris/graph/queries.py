@@ -0,0 +1,482 @@
+import re
+from typing import Any, Optional
+
+ENTITY_LABEL = "Entity"
+CHUNK_LABEL = "Chunk"
+FULLTEXT_INDEX = "entity_text_index"
+
+GRAPH_META_LABEL = "GraphMeta"
+
+SEARCH_MODES = ("exact", "prefix", "fuzzy")
+
+EXPORT_NODES_QUERY = f"""
+MATCH (n:{ENTITY_LABEL})
+WHERE coalesce(n.updated_at, 0) >= $since
+RETURN n.id AS id,
+       n.text AS text,
+       [label IN labels(n) WHERE label <> '{ENTITY_LABEL}'][0] AS label,
+       coalesce(n.updated_at, 0) AS updated_at
+"""
+
+EXPORT_EDGES_QUERY = f"""
+MATCH (source:{ENTITY_LABEL})-[r]->(target:{ENTITY_LABEL})
+WHERE coalesce(source.updated_at, 0) >= $since
+RETURN source.id AS source_id,
+       target.id AS target_id,
+       type(r) AS type,
+       coalesce(r.confidence, 1.0) AS confidence
+"""
+
+RECORD_DELETION_QUERY = f"""
+MERGE (m:{GRAPH_META_LABEL} {{id: 'graph'}})
+SET m.deletions = coalesce(m.deletions, 0) + 1
+"""
+
+DELETION_COUNT_QUERY = f"""
+OPTIONAL MATCH (m:{GRAPH_META_LABEL} {{id: 'graph'}})
+RETURN coalesce(m.deletions, 0) AS deletions
+"""
+
+UPDATE_NODE_PROPERTIES_QUERY = f"""
+UNWIND $rows AS row
+MATCH (n:{ENTITY_LABEL} {{id: row.id}})
+SET n += row.properties
+"""
+
+DOCUMENT_CHUNKS_QUERY = f"""
+MATCH (c:{CHUNK_LABEL} {{document_id: $document_id}})
+RETURN c.id AS id
+"""
+
+RECORD_CHUNKS_QUERY = f"""
+UNWIND $rows AS row
+MERGE (c:{CHUNK_LABEL} {{id: row.id}})
+SET c.document_id = row.document_id, c.entity_ids = row.entity_ids
+"""
+
+REMOVE_CHUNK_RELATIONS_QUERY = f"""
+MATCH (c:{CHUNK_LABEL}) WHERE c.id IN $chunk_ids
+UNWIND c.entity_ids AS entity_id
+WITH DISTINCT entity_id
+MATCH (:{ENTITY_LABEL} {{id: entity_id}})-[r]->(:{ENTITY_LABEL})
+WHERE any(chunk_id IN r.chunk_ids WHERE chunk_id IN $chunk_ids)
+WITH DISTINCT r, range(0, size(r.chunk_ids) - 1) AS positions
+WITH r,
+     [i IN positions WHERE NOT r.chunk_ids[i] IN $chunk_ids] AS keep,
+     reduce(
+         removed = 0, i IN positions |
+         removed + CASE
+             WHEN r.chunk_ids[i] IN $chunk_ids THEN r.chunk_weights[i]
+             ELSE 0
+         END
+     ) AS removed_weight
+SET r.chunk_weights = [i IN keep | r.chunk_weights[i]],
+    r.chunk_ids = [i IN keep | r.chunk_ids[i]],
+    r.weight = r.weight - removed_weight,
+    r.updated_at = timestamp()
+WITH r WHERE size(r.chunk_ids) = 0
+DELETE r
+RETURN count(*) AS removed
+"""
+
+REMOVE_CHUNK_ENTITIES_QUERY = f"""
+MATCH (c:{CHUNK_LABEL}) WHERE c.id IN $chunk_ids
+UNWIND c.entity_ids AS entity_id
+WITH DISTINCT entity_id
+MATCH (n:{ENTITY_LABEL} {{id: entity_id}})
+SET n.chunk_ids = [
+        chunk_id IN coalesce(n.chunk_ids, []) WHERE NOT chunk_id IN $chunk_ids
+    ],
+    n.updated_at = timestamp()
+WITH n WHERE size(n.chunk_ids) = 0
+DETACH DELETE n
+RETURN count(*) AS removed
+"""
+
+DELETE_CHUNKS_QUERY = f"""
+MATCH (c:{CHUNK_LABEL}) WHERE c.id IN $chunk_ids
+DELETE c
+"""
+
+MISSING_DEDUP_KEYS_QUERY = f"""
+MATCH (n:{ENTITY_LABEL}) WHERE n.dedup_key IS NULL
+RETURN n.id AS id,
+       n.text AS text,
+       [label IN labels(n) WHERE label <> '{ENTITY_LABEL}'][0] AS label
+LIMIT $limit
+"""
+
+DUPLICATE_GROUPS_QUERY = f"""
+MATCH (n:{ENTITY_LABEL}) WHERE n.dedup_key > $after
+WITH DISTINCT n.dedup_key AS key
+ORDER BY key
+LIMIT $limit
+MATCH (m:{ENTITY_LABEL} {{dedup_key: key}})
+WITH key, collect(m.id) AS ids
+RETURN key, ids
+ORDER BY key
+"""
+
+GROUP_NODES_QUERY = f"""
+MATCH (n:{ENTITY_LABEL}) WHERE n.id IN $ids
+RETURN n.id AS id,
+       [label IN labels(n) WHERE label <> '{ENTITY_LABEL}'][0] AS label,
+       coalesce(n.chunk_ids, []) AS chunk_ids,
+       coalesce(n.confidence, 1.0) AS confidence
+"""
+
+GROUP_EDGES_QUERY = f"""
+MATCH (n:{ENTITY_LABEL})-[r]-(:{ENTITY_LABEL}) WHERE n.id IN $ids
+WITH DISTINCT r
+RETURN startNode(r).id AS source_id,
+       endNode(r).id AS target_id,
+       type(r) AS type,
+       properties(r) AS properties
+"""
+
+MERGE_CANONICAL_QUERY = f"""
+MATCH (n:{ENTITY_LABEL} {{id: $id}})
+SET n.chunk_ids = $chunk_ids,
+    n.confidence = $confidence,
+    n.updated_at = timestamp()
+WITH n
+MATCH (c:{CHUNK_LABEL}) WHERE c.id IN $chunk_ids
+SET c.entity_ids = [
+    entity_id IN c.entity_ids
+    WHERE NOT entity_id IN $duplicates AND entity_id <> $id
+] + [$id]
+"""
+
+DELETE_NODES_QUERY = f"""
+MATCH (n:{ENTITY_LABEL}) WHERE n.id IN $ids
+DETACH DELETE n
+"""
+
+PRUNE_RELATIONSHIPS_QUERY = f"""
+MATCH (:{ENTITY_LABEL})-[r]->(:{ENTITY_LABEL})
+WHERE r.confidence < $min_confidence
+CALL {{
+    WITH r
+    DELETE r
+}} IN TRANSACTIONS OF $batch_size ROWS
+RETURN count(*) AS removed
+"""
+
+REMOVE_ORPHANS_QUERY = f"""
+MATCH (n:{ENTITY_LABEL})
+WHERE size(coalesce(n.chunk_ids, [])) = 0 AND NOT (n)--()
+CALL {{
+    WITH n
+    DELETE n
+}} IN TRANSACTIONS OF $batch_size ROWS
+RETURN count(*) AS removed
+"""
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_LUCENE_SPECIAL_CHARS = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+
+def validate_identifier(name: str) -> str:
+    if not _IDENTIFIER_PATTERN.match(name):
+        raise ValueError(f"Invalid label or relationship type: {name!r}")
+    return name
+
+
+def build_fulltext_query(search_text: str, mode: str = "prefix") -> str:
+    if mode not in SEARCH_MODES:
+        raise ValueError(
+            f"Unsupported search mode: {mode}. Must be one of {SEARCH_MODES}"
+        )
+
+    terms = [
+        _LUCENE_SPECIAL_CHARS.sub(r"\\\1", term)
+        for term in search_text.lower().split()
+    ]
+    if not terms:
+        return ""
+
+    if mode == "exact":
+        return '"' + " ".join(terms) + '"'
+
+    suffix = "*" if mode == "prefix" else "~"
+    return " AND ".join(f"{term}{suffix}" for term in terms)
+
+
+def search_params(
+    search_text: str, entity_types: Optional[list[str]], limit: int, mode: str
+) -> Optional[dict[str, Any]]:
+    lucene_query = build_fulltext_query(search_text, mode)
+    if not lucene_query:
+        return None
+
+    return {
+        "index_name": FULLTEXT_INDEX,
+        "search_text": lucene_query,
+        "entity_types": entity_types or [],
+        "limit": limit,
+    }
+
+
+def expansion_params(
+    seed_texts: list[str],
+    seed_ids: list[str],
+    entity_types: Optional[list[str]],
+    mode: str,
+    matches_per_seed: int,
+    per_seed_limit: int,
+) -> dict[str, Any]:
+    seeds = [
+        {"key": text, "id": None, "search_text": build_fulltext_query(text, mode)}
+        for text in seed_texts
+    ]
+    seeds += [
+        {"key": node_id, "id": node_id, "search_text": None} for node_id in seed_ids
+    ]
+
+    for seed in seeds:
+        seed["search_text"] = seed["search_text"] or None
+
+    return {
+        "seeds": seeds,
+        "index_name": FULLTEXT_INDEX,
+        "entity_types": entity_types or [],
+        "matches_per_seed": matches_per_seed,
+        "per_seed_limit": per_seed_limit,
+    }
+
+
+def _accumulate_node(properties: str, label: str, carry: str = "") -> str:
+    return f"""
+    WITH {carry}n,
+         coalesce(n.chunk_ids, []) AS previous_chunk_ids
+    SET n += {properties},
+        n:{validate_identifier(label)},
+        n.chunk_ids = previous_chunk_ids + [
+            chunk_id IN coalesce({properties}.chunk_ids, [])
+            WHERE NOT chunk_id IN previous_chunk_ids
+        ],
+        n.updated_at = timestamp()
+    """.strip()
+
+
+def merge_node_query(label: str) -> str:
+    return f"""
+    MERGE (n:{ENTITY_LABEL} {{id: $properties.id}})
+    {_accumulate_node("$properties", label)}
+    RETURN n
+    """
+
+
+def _accumulate_relationship(properties: str, carry: str = "") -> str:
+    return f"""
+    WITH {carry}source, target, r,
+         coalesce(r.weight, 0) AS previous_weight,
+         r.confidence AS previous_confidence,
+         coalesce(r.chunk_ids, []) AS previous_chunk_ids,
+         coalesce(r.chunk_weights, []) AS previous_chunk_weights
+    SET r += {properties},
+        r.weight = previous_weight + coalesce({properties}.weight, 1),
+        r.chunk_ids = previous_chunk_ids + coalesce({properties}.chunk_ids, []),
+        r.chunk_weights = previous_chunk_weights
+            + coalesce({properties}.chunk_weights, []),
+        r.confidence = CASE
+            WHEN previous_confidence IS NULL
+              OR previous_confidence < {properties}.confidence
+            THEN {properties}.confidence
+            ELSE previous_confidence
+        END,
+        r.updated_at = timestamp(),
+        source.updated_at = timestamp(),
+        target.updated_at = timestamp()
+    """.strip()
+
+
+def merge_relationship_query(rel_type: str) -> str:
+    return f"""
+    MATCH (source:{ENTITY_LABEL} {{id: $source_id}})
+    MATCH (target:{ENTITY_LABEL} {{id: $target_id}})
+    MERGE (source)-[r:{validate_identifier(rel_type)}]->(target)
+    {_accumulate_relationship("$properties")}
+    RETURN r
+    """
+
+
+def find_node_query(label: str, property_key: str) -> str:
+    labels = validate_identifier(label)
+    if property_key == "id":
+        labels = f"{ENTITY_LABEL}:{labels}"
+
+    return f"""
+    MATCH (n:{labels} {{{validate_identifier(property_key)}: $value}})
+    RETURN n
+    LIMIT 1
+    """
+
+
+def bulk_merge_nodes_query(label: str) -> str:
+    return f"""
+    UNWIND $rows AS row
+    MERGE (n:{ENTITY_LABEL} {{id: row.id}})
+    {_accumulate_node("row", label, carry="row, ")}
+    """
+
+
+def bulk_merge_relationships_query(rel_type: str) -> str:
+    return f"""
+    UNWIND $rows AS row
+    MATCH (source:{ENTITY_LABEL} {{id: row.source_id}})
+    MATCH (target:{ENTITY_LABEL} {{id: row.target_id}})
+    MERGE (source)-[r:{validate_identifier(rel_type)}]->(target)
+    {_accumulate_relationship("row.properties", carry="row, ")}
+    """
+
+
+def _hub_predicate(hub_degree: int) -> str:
+    if not hub_degree:
+        return "true"
+    return (
+        "all(n IN nodes(path)[1..-1] "
+        "WHERE coalesce(n.degree, COUNT { (n)--() }) <= $hub_degree)"
+    )
+
+
+def _hub_filter(hub_degree: int) -> str:
+    if not hub_degree:
+        return ""
+    return f"WHERE {_hub_predicate(hub_degree)}"
+
+
+def shortest_path_query(max_hops: int, hub_degree: int = 0) -> str:
+    return f"""
+    MATCH (source:{ENTITY_LABEL} {{id: $source_id}})
+    MATCH (target:{ENTITY_LABEL} {{id: $target_id}})
+    MATCH path = shortestPath((source)-[*..{int(max_hops)}]-(target))
+    {_hub_filter(hub_degree)}
+    RETURN nodes(path) as nodes, relationships(path) as edges
+    """
+
+
+def spur_paths_query(max_hops: int, hub_degree: int = 0) -> str:
+    return f"""
+    UNWIND $spurs AS spur
+    MATCH (source:{ENTITY_LABEL} {{id: spur.source_id}})
+    MATCH (target:{ENTITY_LABEL} {{id: $target_id}})
+    MATCH path = shortestPath((source)-[*..{int(max_hops)}]-(target))
+    WHERE length(path) <= spur.max_hops
+      AND none(n IN nodes(path) WHERE n.id IN spur.banned_nodes)
+      AND none(r IN relationships(path) WHERE elementId(r) IN spur.banned_edges)
+      AND {_hub_predicate(hub_degree)}
+    RETURN spur.index AS spur, nodes(path) as nodes, relationships(path) as edges
+    """
+
+
+def related_entities_query(relation_types: Optional[list[str]] = None) -> str:
+    rel_pattern = "r"
+    if relation_types:
+        rel_filter = "|".join(validate_identifier(t) for t in relation_types)
+        rel_pattern = f"r:{rel_filter}"
+
+    return f"""
+    MATCH (source:{ENTITY_LABEL} {{id: $entity_id}})-[{rel_pattern}]-(target)
+    RETURN target, type(r) as relation_type
+    LIMIT $limit
+    """
+
+
+def _expand_hop(rel_pattern: str, hub_degree: int) -> str:
+    expandable = "hop_nodes"
+    if hub_degree:
+        expandable = (
+            "[n IN hop_nodes "
+            "WHERE coalesce(n.degree, COUNT { (n)--() }) <= $hub_degree]"
+        )
+
+    return f"""
+        CALL {{
+            WITH frontier, seen
+            UNWIND frontier AS node
+            MATCH (node)-[r{rel_pattern}]-(next:{ENTITY_LABEL})
+            WHERE NOT next IN seen
+            WITH r, next
+            LIMIT $per_seed_limit
+            RETURN collect(r) AS hop_rels, collect(DISTINCT next) AS hop_nodes
+        }}
+        WITH start,
+             seen + hop_nodes AS seen,
+             rels + hop_rels[..$per_seed_limit - size(rels)] AS rels,
+             CASE
+                 WHEN size(rels) + size(hop_rels) >= $per_seed_limit THEN []
+                 ELSE {expandable}
+             END AS frontier
+    """
+
+
+def expand_neighborhoods_query(
+    max_hops: int,
+    relation_types: Optional[list[str]] = None,
+    hub_degree: int = 0,
+) -> str:
+    rel_pattern = ""
+    if relation_types:
+        rel_pattern = ":" + "|".join(validate_identifier(t) for t in relation_types)
+    hops = "".join(
+        _expand_hop(rel_pattern, hub_degree) for _ in range(max(int(max_hops), 1))
+    )
+
+    return f"""
+    UNWIND $seeds AS seed
+    CALL {{
+        WITH seed
+        MATCH (start:{ENTITY_LABEL} {{id: seed.id}})
+        RETURN start
+        UNION
+        WITH seed
+        WITH seed WHERE seed.search_text IS NOT NULL
+        CALL db.index.fulltext.queryNodes($index_name, seed.search_text)
+        YIELD node, score
+        WHERE size($entity_types) = 0
+           OR any(label IN labels(node) WHERE label IN $entity_types)
+        RETURN node AS start
+        ORDER BY score DESC
+        LIMIT $matches_per_seed
+    }}
+    CALL {{
+        WITH start
+        WITH start, [start] AS seen, [start] AS frontier, [] AS rels
+        {hops}
+        RETURN rels
+    }}
+    WITH seed, start, rels, reduce(
+        nodes = [start], r IN rels |
+        nodes + [n IN [startNode(r), endNode(r)] WHERE NOT n IN nodes]
+    ) AS nodes
+    RETURN seed.key AS seed,
+           start.id AS start_id,
+           [n IN nodes | n {{
+               .id, .text,
+               label: [l IN labels(n) WHERE l <> '{ENTITY_LABEL}'][0]
+           }}] AS nodes,
+           [r IN rels | {{
+               source: startNode(r).id,
+               target: endNode(r).id,
+               type: type(r),
+               confidence: coalesce(r.confidence, 1.0)
+           }}] AS edges
+    """
+
+
+def search_entities_query(filter_labels: bool = False) -> str:
+    label_filter = (
+        "WHERE any(label IN labels(node) WHERE label IN $entity_types)"
+        if filter_labels
+        else ""
+    )
+
+    return f"""
+    CALL db.index.fulltext.queryNodes($index_name, $search_text)
+    YIELD node, score
+    {label_filter}
+    RETURN node AS n, score
+    LIMIT $limit
+    """
@@ -0,0 +1,192 @@
+from typing import Callable, Optional
+
+import numpy as np
+
+from scholaris.config import Config
+from scholaris.types import GraphEdge, GraphNode, GraphSubgraph
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+
+def personalized_pagerank(
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    node_count: int,
+    seeds: np.ndarray,
+    damping: float = 0.85,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+    initial: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    if node_count == 0:
+        return np.empty(0, dtype=np.float64)
+
+    rows = np.concatenate([sources, targets])
+    cols = np.concatenate([targets, sources])
+    values = np.concatenate([weights, weights]).astype(np.float64)
+
+    out_weight = np.bincount(rows, weights=values, minlength=node_count)
+    transition = values / np.where(out_weight[rows] > 0, out_weight[rows], 1.0)
+    dangling = out_weight == 0
+
+    teleport = np.zeros(node_count, dtype=np.float64)
+    if seeds.size:
+        np.add.at(teleport, seeds, 1.0)
+    else:
+        teleport[:] = 1.0
+    teleport /= teleport.sum()
+
+    rank = teleport.copy()
+    if initial is not None and initial.size == node_count and initial.sum() > 0:
+        rank = initial / initial.sum()
+    for _ in range(max_iterations):
+        spread = np.bincount(
+            cols, weights=transition * rank[rows], minlength=node_count
+        )
+        updated = damping * (spread + rank[dangling].sum() * teleport)
+        updated += (1.0 - damping) * teleport
+
+        converged = np.abs(updated - rank).sum() < tolerance
+        rank = updated
+        if converged:
+            break
+
+    return rank
+
+
+def entity_line(node: GraphNode) -> str:
+    return f"Entity: {node.properties.get('text') or node.id}"
+
+
+def relation_line(edge: GraphEdge, texts: dict[str, str]) -> str:
+    return (
+        f"Relation: {texts.get(edge.source, edge.source)} "
+        f"-[{edge.type}]-> {texts.get(edge.target, edge.target)}"
+    )
+
+
+class ContextRanker:
+
+    def __init__(self, config: Config, count_tokens: Callable[[str], int]) -> None:
+        self.config = config
+        self.count_tokens = count_tokens
+
+    def rank(
+        self, subgraph: GraphSubgraph, token_budget: Optional[int] = None
+    ) -> GraphSubgraph:
+        budget = token_budget or self.config.graph.context_token_budget
+        if not subgraph.nodes:
+            return subgraph
+
+        index = {node.id: i for i, node in enumerate(subgraph.nodes)}
+        edges = [
+            edge
+            for edge in subgraph.edges
+            if edge.source in index and edge.target in index
+        ]
+
+        sources = np.asarray([index[e.source] for e in edges], dtype=np.int64)
+        targets = np.asarray([index[e.target] for e in edges], dtype=np.int64)
+        weights = np.asarray(
+            [float(e.properties.get("confidence", 1.0)) for e in edges],
+            dtype=np.float64,
+        )
+        seeds = np.asarray(
+            [index[i] for ids in subgraph.seeds.values() for i in ids if i in index],
+            dtype=np.int64,
+        )
+
+        scores = personalized_pagerank(
+            sources,
+            targets,
+            weights,
+            len(subgraph.nodes),
+            seeds,
+            damping=self.config.graph.pagerank_damping,
+        )
+        edge_scores = np.sqrt(scores[sources] * scores[targets]) * weights
+
+        texts = {
+            node.id: node.properties.get("text") or node.id for node in subgraph.nodes
+        }
+        node_costs: dict[int, int] = {}
+
+        node_count = len(subgraph.nodes)
+        order = np.argsort(-np.concatenate([scores, edge_scores]), kind="stable")
+
+        selected_nodes: dict[int, None] = {}
+        selected_edges: list[int] = []
+        used = 0
+
+        for candidate in order.tolist():
+            if used >= budget:
+                break
+
+            if candidate < node_count:
+                members = [candidate]
+                cost = 0
+            else:
+                edge = candidate - node_count
+                members = [int(sources[edge]), int(targets[edge])]
+                cost = self.count_tokens(relation_line(edges[edge], texts))
+
+            missing = [m for m in dict.fromkeys(members) if m not in selected_nodes]
+            for member in missing:
+                if member not in node_costs:
+                    node_costs[member] = self.count_tokens(
+                        entity_line(subgraph.nodes[member])
+                    )
+                cost += node_costs[member]
+            if candidate < node_count and not missing:
+                continue
+            if used + cost > budget:
+                continue
+
+            used += cost
+            selected_nodes.update(dict.fromkeys(missing))
+            if candidate >= node_count:
+                selected_edges.append(candidate - node_count)
+
+        nodes = [
+            subgraph.nodes[i].model_copy(
+                update={
+                    "properties": {
+                        **subgraph.nodes[i].properties,
+                        "score": float(scores[i]),
+                    }
+                }
+            )
+            for i in sorted(selected_nodes, key=lambda i: scores[i], reverse=True)
+        ]
+
+        logger.debug(
+            "subgraph_ranked",
+            nodes=len(nodes),
+            edges=len(selected_edges),
+            candidates=len(order),
+            tokens=used,
+        )
+
+        selected = {node.id for node in nodes}
+        return GraphSubgraph(
+            seeds={
+                seed: [i for i in ids if i in selected]
+                for seed, ids in subgraph.seeds.items()
+            },
+            nodes=nodes,
+            edges=[edges[j] for j in selected_edges],
+        )
+
+    def build_context(
+        self, subgraph: GraphSubgraph, token_budget: Optional[int] = None
+    ) -> str:
+        ranked = self.rank(subgraph, token_budget)
+        texts = {
+            node.id: node.properties.get("text") or node.id for node in ranked.nodes
+        }
+
+        lines = [entity_line(node) for node in ranked.nodes]
+        lines.extend(relation_line(edge, texts) for edge in ranked.edges)
+        return "\n".join(lines)
@@ -0,0 +1,480 @@
+import time
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from scholaris.graph.backend import GraphBackend
+from scholaris.types import GraphEdge, GraphNode, GraphPath, GraphSubgraph
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+
+class GraphSnapshot:
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._reset()
+
+        self._scratch_generation = -1
+        self._visit_marks = np.empty(0, dtype=np.int64)
+        self._visit_stamp = 0
+        self._hub_masks: dict[int, np.ndarray] = {}
+
+    def _reset(self) -> None:
+        self.node_ids: list[str] = []
+        self.node_index: dict[str, int] = {}
+        self.node_properties: list[dict[str, Any]] = []
+
+        self.relation_types: list[str] = []
+        self._relation_codes: dict[str, int] = {}
+
+        self._edge_index: dict[tuple[int, int, int], int] = {}
+        self._sources: list[int] = []
+        self._targets: list[int] = []
+        self._types: list[int] = []
+        self._confidence: list[float] = []
+
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.empty(0, dtype=np.int32)
+        self.edge_types = np.empty(0, dtype=np.int16)
+        self.edge_confidence = np.empty(0, dtype=np.float32)
+        self.edge_outgoing = np.empty(0, dtype=bool)
+        self.edge_ids = np.empty(0, dtype=np.int64)
+
+        self.version = 0
+        self.deletions = 0
+        self.refreshed_at: Optional[float] = None
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._sources)
+
+    def load(self, client: GraphBackend) -> None:
+        self._reset()
+        start_time = time.perf_counter()
+
+        self.deletions = client.deletion_count()
+        self._apply(client.iter_nodes(), client.iter_edges())
+
+        logger.info(
+            "snapshot_loaded",
+            nodes=self.node_count,
+            edges=self.edge_count,
+            seconds=round(time.perf_counter() - start_time, 3),
+        )
+
+    def refresh(self, client: GraphBackend) -> int:
+        if self.refreshed_at is None or client.deletion_count() != self.deletions:
+            self.load(client)
+            return self.node_count
+
+        since = self.version
+        nodes, edges = self._apply(
+            client.iter_nodes(since=since), client.iter_edges(since=since), since
+        )
+
+        logger.debug("snapshot_refreshed", nodes=nodes, edges=edges)
+        return nodes
+
+    def ensure_fresh(self, client: GraphBackend, max_age_seconds: float) -> None:
+        if self.refreshed_at is None:
+            self.load(client)
+        elif time.monotonic() - self.refreshed_at >= max_age_seconds:
+            self.refresh(client)
+
+    def add_node(
+        self, node_id: str, text: str = "", label: str = "", updated_at: int = 0
+    ) -> int:
+        index = self.node_index.get(node_id)
+        if index is None:
+            index = len(self.node_ids)
+            self.node_index[node_id] = index
+            self.node_ids.append(node_id)
+            self.node_properties.append({"id": node_id})
+
+        properties = self.node_properties[index]
+        if text:
+            properties["text"] = text
+        if label:
+            properties["label"] = label
+
+        self.version = max(self.version, updated_at)
+        return index
+
+    def add_edge(
+        self, source_id: str, target_id: str, rel_type: str, confidence: float = 1.0
+    ) -> bool:
+        source = self.add_node(source_id)
+        target = self.add_node(target_id)
+
+        code = self._relation_codes.get(rel_type)
+        if code is None:
+            code = len(self.relation_types)
+            self._relation_codes[rel_type] = code
+            self.relation_types.append(rel_type)
+
+        key = (source, target, code)
+        position = self._edge_index.get(key)
+        if position is not None:
+            changed = self._confidence[position] != confidence
+            self._confidence[position] = confidence
+            return changed
+
+        self._edge_index[key] = len(self._sources)
+        self._sources.append(source)
+        self._targets.append(target)
+        self._types.append(code)
+        self._confidence.append(confidence)
+        return True
+
+    def _apply(
+        self,
+        nodes: Iterable[dict[str, Any]],
+        edges: Iterable[dict[str, Any]],
+        since: int = 0,
+    ) -> tuple[int, int]:
+        known_nodes = self.node_count
+
+        node_count = 0
+        for node in nodes:
+            updated_at = node.get("updated_at") or 0
+            if updated_at > since or node["id"] not in self.node_index:
+                node_count += 1
+            self.add_node(
+                node["id"],
+                text=node.get("text") or "",
+                label=node.get("label") or "",
+                updated_at=updated_at,
+            )
+
+        edge_count = 0
+        for edge in edges:
+            edge_count += self.add_edge(
+                edge["source_id"],
+                edge["target_id"],
+                edge["type"],
+                edge.get("confidence", 1.0),
+            )
+
+        if self.node_count != known_nodes or edge_count or self.refreshed_at is None:
+            self.rebuild()
+        else:
+            self.refreshed_at = time.monotonic()
+
+        return node_count, edge_count
+
+    def rebuild(self) -> None:
+        sources = np.asarray(self._sources, dtype=np.int64)
+        targets = np.asarray(self._targets, dtype=np.int64)
+        types = np.asarray(self._types, dtype=np.int16)
+        confidence = np.asarray(self._confidence, dtype=np.float32)
+
+        rows = np.concatenate([sources, targets])
+        cols = np.concatenate([targets, sources])
+        order = np.argsort(rows, kind="stable")
+
+        self.indices = cols[order].astype(np.int32)
+        self.edge_types = np.concatenate([types, types])[order]
+        self.edge_confidence = np.concatenate([confidence, confidence])[order]
+        self.edge_outgoing = np.concatenate(
+            [np.ones(len(sources), dtype=bool), np.zeros(len(sources), dtype=bool)]
+        )[order]
+        self.edge_ids = np.tile(np.arange(len(sources), dtype=np.int64), 2)[order]
+
+        counts = np.bincount(rows, minlength=self.node_count)
+        self.indptr = np.zeros(self.node_count + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+
+        self.generation += 1
+        self.refreshed_at = time.monotonic()
+
+    def degree(self, node: int) -> int:
+        return int(self.indptr[node + 1] - self.indptr[node])
+
+    def relation_codes(
+        self, relation_types: Optional[list[str]]
+    ) -> Optional[np.ndarray]:
+        if not relation_types:
+            return None
+
+        codes = [
+            self._relation_codes[rel_type]
+            for rel_type in relation_types
+            if rel_type in self._relation_codes
+        ]
+        return np.asarray(codes, dtype=np.int16)
+
+    def gather(
+        self, frontier: np.ndarray, codes: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        starts = self.indptr[frontier]
+        lengths = self.indptr[frontier + 1] - starts
+        total = int(lengths.sum())
+
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        segment_starts = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - segment_starts, lengths) + np.arange(total)
+        parents = np.repeat(frontier, lengths)
+
+        if codes is not None:
+            mask = np.isin(self.edge_types[positions], codes)
+            positions = positions[mask]
+            parents = parents[mask]
+
+        return parents, positions
+
+    def neighbors(
+        self,
+        node_id: str,
+        relation_types: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        node = self.node_index.get(node_id)
+        if node is None:
+            return []
+
+        _, positions = self.gather(
+            np.asarray([node], dtype=np.int64), self.relation_codes(relation_types)
+        )
+        if limit is not None:
+            positions = positions[:limit]
+
+        return [
+            {
+                "target": self.node_properties[self.indices[p]],
+                "relation_type": self.relation_types[self.edge_types[p]],
+                "confidence": float(self.edge_confidence[p]),
+            }
+            for p in positions
+        ]
+
+    def k_hop(
+        self,
+        node_id: str,
+        max_hops: int,
+        relation_types: Optional[list[str]] = None,
+    ) -> dict[str, int]:
+        node = self.node_index.get(node_id)
+        if node is None:
+            return {}
+
+        codes = self.relation_codes(relation_types)
+        distances = np.full(self.node_count, -1, dtype=np.int32)
+        distances[node] = 0
+        frontier = np.asarray([node], dtype=np.int64)
+
+        for hop in range(1, max_hops + 1):
+            _, positions = self.gather(frontier, codes)
+            reached = np.unique(self.indices[positions])
+            frontier = reached[distances[reached] < 0].astype(np.int64)
+            if frontier.size == 0:
+                break
+            distances[frontier] = hop
+
+        found = np.flatnonzero(distances >= 0)
+        return {self.node_ids[i]: int(distances[i]) for i in found}
+
+    def _sync_scratch(self) -> None:
+        if (
+            self._scratch_generation == self.generation
+            and self._visit_marks.size == self.indptr.size - 1
+        ):
+            return
+
+        self._scratch_generation = self.generation
+        self._visit_marks = np.zeros(self.indptr.size - 1, dtype=np.int64)
+        self._visit_stamp = 0
+        self._hub_masks = {}
+
+    def _hub_mask(self, hub_degree: int) -> Optional[np.ndarray]:
+        if not hub_degree:
+            return None
+
+        mask = self._hub_masks.get(hub_degree)
+        if mask is None:
+            mask = np.diff(self.indptr) > hub_degree
+            self._hub_masks[hub_degree] = mask
+        return mask
+
+    def expand(
+        self,
+        seeds: dict[str, list[str]],
+        max_hops: int,
+        relation_types: Optional[list[str]] = None,
+        per_seed_limit: Optional[int] = None,
+        hub_degree: int = 0,
+    ) -> GraphSubgraph:
+        self._sync_scratch()
+        codes = self.relation_codes(relation_types)
+        hubs = self._hub_mask(hub_degree)
+        marks = self._visit_marks
+
+        matches: dict[str, list[str]] = {}
+        node_parts: list[np.ndarray] = []
+        parent_parts: list[np.ndarray] = []
+        position_parts: list[np.ndarray] = []
+
+        for seed, node_ids in seeds.items():
+            starts = [self.node_index[i] for i in node_ids if i in self.node_index]
+            matches[seed] = [self.node_ids[start] for start in starts]
+
+            for start in starts:
+                self._visit_stamp += 1
+                stamp = self._visit_stamp
+                marks[start] = stamp
+                node_parts.append(np.asarray([start], dtype=np.int64))
+                remaining = per_seed_limit
+                frontier = np.asarray([start], dtype=np.int64)
+
+                for _ in range(max_hops):
+                    parents, positions = self.gather(frontier, codes)
+                    fresh = marks[self.indices[positions]] != stamp
+                    parents, positions = parents[fresh], positions[fresh]
+                    if remaining is not None:
+                        parents, positions = parents[:remaining], positions[:remaining]
+                        remaining -= positions.size
+
+                    reached = self.indices[positions].astype(np.int64)
+                    parent_parts.append(parents)
+                    position_parts.append(positions)
+                    node_parts.append(reached)
+
+                    reached = np.unique(reached)
+                    marks[reached] = stamp
+                    frontier = reached if hubs is None else reached[~hubs[reached]]
+                    if frontier.size == 0 or remaining == 0:
+                        break
+
+        nodes = _first_occurrences(node_parts)
+        parents = _concatenate(parent_parts)
+        positions = _concatenate(position_parts)
+        _, first = np.unique(self.edge_ids[positions], return_index=True)
+        first.sort()
+        parents, positions = parents[first], positions[first]
+
+        reached = self.indices[positions].astype(np.int64)
+        outgoing = self.edge_outgoing[positions]
+        sources = np.where(outgoing, parents, reached)
+        targets = np.where(outgoing, reached, parents)
+
+        return GraphSubgraph(
+            seeds=matches,
+            nodes=[self._graph_node(int(node)) for node in nodes],
+            edges=[
+                GraphEdge(
+                    source=self.node_ids[source],
+                    target=self.node_ids[target],
+                    type=self.relation_types[code],
+                    properties={"confidence": confidence},
+                )
+                for source, target, code, confidence in zip(
+                    sources.tolist(),
+                    targets.tolist(),
+                    self.edge_types[positions].tolist(),
+                    self.edge_confidence[positions].tolist(),
+                )
+            ],
+        )
+
+    def shortest_path(
+        self, source_id: str, target_id: str, max_hops: int
+    ) -> Optional[GraphPath]:
+        source = self.node_index.get(source_id)
+        target = self.node_index.get(target_id)
+        if source is None or target is None:
+            return None
+
+        parent = np.full(self.node_count, -1, dtype=np.int64)
+        parent_edge = np.full(self.node_count, -1, dtype=np.int64)
+        visited = np.zeros(self.node_count, dtype=bool)
+        visited[source] = True
+        frontier = np.asarray([source], dtype=np.int64)
+
+        for _ in range(max_hops):
+            if visited[target]:
+                break
+
+            parents, positions = self.gather(frontier)
+            reached = self.indices[positions].astype(np.int64)
+            reached, first = np.unique(reached, return_index=True)
+            new = ~visited[reached]
+            reached, first = reached[new], first[new]
+            if reached.size == 0:
+                break
+
+            visited[reached] = True
+            parent[reached] = parents[first]
+            parent_edge[reached] = positions[first]
+            frontier = reached
+
+        if not visited[target]:
+            return None
+
+        return self.build_path(source, target, parent, parent_edge)
+
+    def build_path(
+        self,
+        source: int,
+        target: int,
+        parent: np.ndarray,
+        parent_edge: np.ndarray,
+    ) -> GraphPath:
+        chain = [target]
+        edge_positions = []
+        while chain[-1] != source:
+            edge_positions.append(int(parent_edge[chain[-1]]))
+            chain.append(int(parent[chain[-1]]))
+
+        chain.reverse()
+        edge_positions.reverse()
+
+        return self.path_from_positions(chain, edge_positions)
+
+    def path_from_positions(
+        self, chain: list[int], edge_positions: list[int]
+    ) -> GraphPath:
+        nodes = [self._graph_node(node) for node in chain]
+
+        edges = []
+        for position in edge_positions:
+            edge = int(self.edge_ids[position])
+            edges.append(
+                GraphEdge(
+                    source=self.node_ids[self._sources[edge]],
+                    target=self.node_ids[self._targets[edge]],
+                    type=self.relation_types[self.edge_types[position]],
+                    properties={
+                        "confidence": float(self.edge_confidence[position])
+                    },
+                )
+            )
+
+        return GraphPath(nodes=nodes, edges=edges, length=len(edges))
+
+    def _graph_node(self, node: int) -> GraphNode:
+        properties = self.node_properties[node]
+        return GraphNode(
+            id=self.node_ids[node],
+            label=properties.get("label", ""),
+            properties=dict(properties),
+        )
+
+
+def _concatenate(parts: list[np.ndarray]) -> np.ndarray:
+    if not parts:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(parts).astype(np.int64, copy=False)
+
+
+def _first_occurrences(parts: list[np.ndarray]) -> np.ndarray:
+    values = _concatenate(parts)
+    _, first = np.unique(values, return_index=True)
+    return values[np.sort(first)]
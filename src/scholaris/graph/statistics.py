@@ -0,0 +1,203 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+import numpy as np
+
+from scholaris.config import Config
+from scholaris.graph.backend import GraphBackend
+from scholaris.graph.ranking import personalized_pagerank
+from scholaris.graph.snapshot import GraphSnapshot
+from scholaris.graph.traversal import GraphTraversal
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+
+class GraphStatistics:
+
+    def __init__(
+        self,
+        config: Config,
+        client: GraphBackend,
+        traversal: Optional[GraphTraversal] = None,
+    ) -> None:
+        self.config = config
+        self.client = client
+        self.traversal = traversal
+        self.snapshot = GraphSnapshot()
+
+        self.node_ids: list[str] = []
+        self.relation_types: list[str] = []
+        self.degrees = np.empty(0, dtype=np.int64)
+        self.type_degrees = np.empty((0, 0), dtype=np.int64)
+        self.pagerank = np.empty(0, dtype=np.float64)
+        self._generation = -1
+
+    @contextmanager
+    def _refreshed_snapshot(self, full: bool) -> Iterator[GraphSnapshot]:
+        if self.traversal is not None:
+            with self.traversal.refreshed_snapshot(full) as snapshot:
+                yield snapshot
+            return
+
+        if full:
+            self.snapshot.load(self.client)
+        else:
+            self.snapshot.refresh(self.client)
+        yield self.snapshot
+
+    def _previous_positions(self, current: list[str]) -> np.ndarray:
+        count = len(self.node_ids)
+
+        if current[:count] == self.node_ids:
+            positions = np.full(len(current), -1, dtype=np.int64)
+            positions[:count] = np.arange(count)
+            return positions
+
+        index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        return np.fromiter(
+            (index.get(node_id, -1) for node_id in current),
+            dtype=np.int64,
+            count=len(current),
+        )
+
+    def compute(
+        self, graph: GraphSnapshot, positions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        type_count = len(graph.relation_types)
+
+        rows = np.repeat(
+            np.arange(graph.node_count, dtype=np.int64), np.diff(graph.indptr)
+        )
+        degrees = np.diff(graph.indptr).astype(np.int64)
+        type_degrees = np.bincount(
+            rows * type_count + graph.edge_types,
+            minlength=graph.node_count * type_count,
+        ).reshape(graph.node_count, type_count)
+
+        initial = None
+        known = positions >= 0
+        if known.any():
+            initial = np.full(graph.node_count, 1.0 / graph.node_count)
+            initial[known] = self.pagerank[positions[known]]
+
+        outgoing = graph.edge_outgoing
+        pagerank = personalized_pagerank(
+            rows[outgoing],
+            graph.indices[outgoing].astype(np.int64),
+            graph.edge_confidence[outgoing],
+            graph.node_count,
+            np.empty(0, dtype=np.int64),
+            damping=self.config.graph.pagerank_damping,
+            initial=initial,
+        )
+
+        return degrees, type_degrees, pagerank
+
+    def update(self, full: bool = False) -> dict[str, Any]:
+        start_time = time.perf_counter()
+
+        with self._refreshed_snapshot(full) as snapshot:
+            if full:
+                self._generation = -1
+            if snapshot.generation == self._generation:
+                return {"nodes": snapshot.node_count, "updated": 0, "seconds": 0.0}
+
+            generation = snapshot.generation
+            node_ids = list(snapshot.node_ids)
+            snapshot_types = list(snapshot.relation_types)
+            positions = self._previous_positions(node_ids)
+            degrees, type_degrees, pagerank = self.compute(snapshot, positions)
+
+        changed = self._changed(
+            positions, snapshot_types, degrees, type_degrees, pagerank
+        )
+
+        relation_types = list(dict.fromkeys(self.relation_types + snapshot_types))
+        codes = {rel_type: code for code, rel_type in enumerate(snapshot_types)}
+        rows = [
+            self._row(
+                node_ids[node],
+                relation_types,
+                codes,
+                int(degrees[node]),
+                type_degrees[node],
+                float(pagerank[node]),
+            )
+            for node in changed
+        ]
+        written = self.client.update_node_properties(
+            rows, self.config.graph.write_batch_size
+        )
+
+        unchanged = np.ones(pagerank.size, dtype=bool)
+        unchanged[changed] = False
+        unchanged &= positions >= 0
+        pagerank[unchanged] = self.pagerank[positions[unchanged]]
+
+        self.node_ids = node_ids
+        self.relation_types = snapshot_types
+        self.degrees = degrees
+        self.type_degrees = type_degrees
+        self.pagerank = pagerank
+        self._generation = generation
+
+        stats = {
+            "nodes": len(node_ids),
+            "updated": written,
+            "seconds": round(time.perf_counter() - start_time, 3),
+        }
+        logger.info("graph_statistics_updated", full=full, **stats)
+        return stats
+
+    def _changed(
+        self,
+        positions: np.ndarray,
+        relation_types: list[str],
+        degrees: np.ndarray,
+        type_degrees: np.ndarray,
+        pagerank: np.ndarray,
+    ) -> np.ndarray:
+        known = positions >= 0
+        previous = positions[known]
+
+        previous_types = np.zeros_like(type_degrees)
+        codes = {rel_type: code for code, rel_type in enumerate(self.relation_types)}
+        for code, rel_type in enumerate(relation_types):
+            if rel_type in codes:
+                previous_types[known, code] = self.type_degrees[
+                    previous, codes[rel_type]
+                ]
+
+        tolerance = self.config.graph.stats_pagerank_tolerance
+        floor = 1.0 / max(degrees.size, 1)
+        drift = np.abs(pagerank[known] - self.pagerank[previous]) > (
+            tolerance * np.maximum(self.pagerank[previous], floor)
+        )
+
+        changed = ~known
+        changed[known] = (
+            (degrees[known] != self.degrees[previous])
+            | (type_degrees[known] != previous_types[known]).any(axis=1)
+            | drift
+        )
+        return np.flatnonzero(changed)
+
+    def _row(
+        self,
+        node_id: str,
+        relation_types: list[str],
+        codes: dict[str, int],
+        degree: int,
+        type_degrees: np.ndarray,
+        pagerank: float,
+    ) -> dict[str, Any]:
+        properties: dict[str, Any] = {"degree": degree, "pagerank": pagerank}
+        for rel_type in relation_types:
+            code = codes.get(rel_type)
+            count = 0 if code is None else int(type_degrees[code])
+            properties[f"degree_{rel_type}"] = count or None
+
+        return {"id": node_id, "properties": properties}
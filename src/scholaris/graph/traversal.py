@@ -1,38 +1,145 @@
-from typing import Any, Optional
+import asyncio
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
 
 from scholaris.config import Config
-from scholaris.graph.neo4j_client import Neo4jClient
-from scholaris.types import GraphEdge, GraphNode, GraphPath
+from scholaris.graph.async_neo4j_client import AsyncNeo4jClient
+from scholaris.graph.backend import GraphBackend
+from scholaris.graph.cache import GraphVersion, TraversalCache, cache_key
+from scholaris.graph.paths import PathFinder
+from scholaris.graph.snapshot import GraphSnapshot
+from scholaris.types import GraphPath, GraphSubgraph
+from scholaris.utils.helpers import normalize_text
 from scholaris.utils.logging import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _traversal_cache(config: Config) -> TraversalCache:
+    return TraversalCache(
+        config.graph.cache_max_entries, config.graph.cache_ttl_seconds
+    )
+
 
 class GraphTraversal:
-    def __init__(self, config: Config, neo4j_client: Neo4jClient) -> None:
+    def __init__(
+        self,
+        config: Config,
+        graph_client: GraphBackend,
+        snapshot: Optional[GraphSnapshot] = None,
+        version: Optional[GraphVersion] = None,
+    ) -> None:
         self.config = config
-        self.client = neo4j_client
+        self.client = graph_client
+        self.snapshot = snapshot
+        self.version = version or GraphVersion()
+        self.cache = _traversal_cache(config)
+        self._snapshot_version, self._snapshot_epoch = self.version.current()
+        self._snapshot_lock = threading.RLock()
+
+        if self.snapshot is None and config.graph.traversal_mode == "snapshot":
+            self.snapshot = GraphSnapshot()
+
+        self.path_finder: Optional[PathFinder] = None
+        if self.snapshot is not None:
+            self.path_finder = PathFinder(
+                self.snapshot,
+                hub_degree=config.graph.hub_degree_threshold,
+                landmark_count=config.graph.landmark_count,
+            )
+
+    def _active_snapshot(self) -> Optional[GraphSnapshot]:
+        with self._snapshot_lock:
+            return self._refresh_active_snapshot()
+
+    def _refresh_active_snapshot(self) -> Optional[GraphSnapshot]:
+        if self.snapshot is not None:
+            version, epoch = self.version.current()
+            if epoch != self._snapshot_epoch:
+                self.snapshot.load(self.client)
+            elif version != self._snapshot_version and self.snapshot.refreshed_at:
+                self.snapshot.refresh(self.client)
+            else:
+                self.snapshot.ensure_fresh(
+                    self.client, self.config.graph.snapshot_refresh_seconds
+                )
+            self._snapshot_version = version
+            self._snapshot_epoch = epoch
+        return self.snapshot
+
+    def _cached(self, key: Hashable, compute: Callable[[], T]) -> T:
+        if not self.cache.enabled:
+            return compute()
+
+        version = self.version.value
+        found, value = self.cache.get(key, version)
+        if found:
+            return value
+
+        value = compute()
+        self.cache.set(key, version, value)
+        return value
+
+    def cache_stats(self) -> dict[str, Any]:
+        return {**self.cache.stats(), "version": self.version.value}
+
+    @contextmanager
+    def refreshed_snapshot(self, full: bool = False) -> Iterator[GraphSnapshot]:
+        if self.snapshot is None:
+            raise ValueError("Graph traversal has no in-process snapshot")
+
+        with self._snapshot_lock:
+            if full:
+                self.snapshot.load(self.client)
+            else:
+                self.snapshot.refresh(self.client)
+            yield self.snapshot
 
     def find_shortest_path(
         self, source_id: str, target_id: str, max_hops: Optional[int] = None
     ) -> Optional[GraphPath]:
         hops = max_hops or self.config.graph.max_hops
-
-        query = """
-        MATCH path = shortestPath(
-            (source {id: $source_id})-[*..%d]-(target {id: $target_id})
+        key = cache_key("shortest_path", source_id, target_id, hops)
+        return self._cached(
+            key, lambda: self._find_shortest_path(source_id, target_id, hops)
         )
-        RETURN nodes(path) as nodes, relationships(path) as edges
-        """ % hops
 
-        params = {"source_id": source_id, "target_id": target_id}
+    def _find_shortest_path(
+        self, source_id: str, target_id: str, hops: int
+    ) -> Optional[GraphPath]:
+        with self._snapshot_lock:
+            if self._active_snapshot() is not None and self.path_finder is not None:
+                return self.path_finder.shortest_path(source_id, target_id, hops)
 
-        results = self.client.execute_query(query, params)
+        return self.client.find_shortest_path(source_id, target_id, hops)
 
-        if not results:
-            return None
+    def find_k_shortest_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        k: int = 3,
+        max_hops: Optional[int] = None,
+    ) -> list[GraphPath]:
+        hops = max_hops or self.config.graph.max_hops
+        key = cache_key("k_shortest_paths", source_id, target_id, k, hops)
+        return self._cached(
+            key, lambda: self._find_k_shortest_paths(source_id, target_id, k, hops)
+        )
+
+    def _find_k_shortest_paths(
+        self, source_id: str, target_id: str, k: int, hops: int
+    ) -> list[GraphPath]:
+        with self._snapshot_lock:
+            if self._active_snapshot() is not None and self.path_finder is not None:
+                return self.path_finder.k_shortest_paths(
+                    source_id, target_id, k, hops
+                )
 
-        return self._build_graph_path(results[0])
+        return self.client.find_k_shortest_paths(source_id, target_id, k, hops)
 
     def find_related_entities(
         self,
@@ -40,66 +147,323 @@ class GraphTraversal:
         relation_types: Optional[list[str]] = None,
         limit: int = 10,
     ) -> list[dict[str, Any]]:
-        if relation_types:
-            rel_filter = "|".join(relation_types)
-            query = f"""
-            MATCH (source {{id: $entity_id}})-[r:{rel_filter}]-(target)
-            RETURN target, type(r) as relation_type
-            LIMIT $limit
-            """
-        else:
-            query = """
-            MATCH (source {id: $entity_id})-[r]-(target)
-            RETURN target, type(r) as relation_type
-            LIMIT $limit
-            """
-
-        params = {"entity_id": entity_id, "limit": limit}
-        return self.client.execute_query(query, params)
+        key = cache_key("related", entity_id, relation_types, limit)
+        return self._cached(
+            key, lambda: self._find_related(entity_id, relation_types, limit)
+        )
+
+    def _find_related(
+        self, entity_id: str, relation_types: Optional[list[str]], limit: int
+    ) -> list[dict[str, Any]]:
+        with self._snapshot_lock:
+            snapshot = self._active_snapshot()
+            if snapshot is not None:
+                return snapshot.neighbors(entity_id, relation_types, limit)
+
+        return self.client.find_related(entity_id, relation_types, limit)
+
+    def expand_neighborhoods(
+        self,
+        seed_texts: Optional[list[str]] = None,
+        seed_ids: Optional[list[str]] = None,
+        max_hops: Optional[int] = None,
+        relation_types: Optional[list[str]] = None,
+        entity_types: Optional[list[str]] = None,
+        per_seed_limit: int = 25,
+        mode: str = "prefix",
+    ) -> GraphSubgraph:
+        hops = max_hops or self.config.graph.max_hops
+        key = cache_key(
+            "expand",
+            seed_texts or [],
+            seed_ids or [],
+            hops,
+            relation_types,
+            entity_types,
+            per_seed_limit,
+            mode,
+        )
+        return self._cached(
+            key,
+            lambda: self._expand_neighborhoods(
+                seed_texts,
+                seed_ids,
+                hops,
+                relation_types,
+                entity_types,
+                per_seed_limit,
+                mode,
+            ),
+        )
+
+    def _expand_neighborhoods(
+        self,
+        seed_texts: Optional[list[str]],
+        seed_ids: Optional[list[str]],
+        hops: int,
+        relation_types: Optional[list[str]],
+        entity_types: Optional[list[str]],
+        per_seed_limit: int,
+        mode: str,
+    ) -> GraphSubgraph:
+        snapshot = self._active_snapshot()
+        if snapshot is None:
+            return self.client.expand_neighborhoods(
+                seed_texts,
+                seed_ids,
+                hops,
+                relation_types,
+                entity_types,
+                per_seed_limit,
+                mode=mode,
+            )
+
+        seeds: dict[str, list[str]] = {}
+        if seed_texts:
+            result_sets = self.client.search_entities(
+                seed_texts, entity_types, 1, mode
+            )
+            for text, results in zip(seed_texts, result_sets):
+                seeds[text] = [result["n"]["id"] for result in results]
+        for node_id in seed_ids or []:
+            seeds[node_id] = [node_id]
+
+        with self._snapshot_lock:
+            return snapshot.expand(
+                seeds,
+                hops,
+                relation_types,
+                per_seed_limit,
+                hub_degree=self.config.graph.hub_degree_threshold,
+            )
 
     def search_entities_by_text(
         self,
         search_text: str,
         entity_types: Optional[list[str]] = None,
         limit: int = 10,
+        mode: str = "prefix",
     ) -> list[dict[str, Any]]:
-        if entity_types:
-            label_filter = "|".join(entity_types)
-            query = f"""
-            MATCH (n:{label_filter})
-            WHERE toLower(n.text) CONTAINS toLower($search_text)
-            RETURN n
-            LIMIT $limit
-            """
-        else:
-            query = """
-            MATCH (n)
-            WHERE toLower(n.text) CONTAINS toLower($search_text)
-            RETURN n
-            LIMIT $limit
-            """
-
-        params = {"search_text": search_text, "limit": limit}
-        return self.client.execute_query(query, params)
-
-    def _build_graph_path(self, result: dict[str, Any]) -> GraphPath:
-        nodes = [
-            GraphNode(
-                id=node.get("id", ""),
-                label=list(node.labels)[0] if node.labels else "",
-                properties=dict(node),
-            )
-            for node in result.get("nodes", [])
+        return self.search_entities_by_texts(
+            [search_text], entity_types, limit, mode
+        )[0]
+
+    def search_entities_by_texts(
+        self,
+        search_texts: list[str],
+        entity_types: Optional[list[str]] = None,
+        limit: int = 10,
+        mode: str = "prefix",
+    ) -> list[list[dict[str, Any]]]:
+        version = self.version.value
+        keys = [
+            cache_key("search", normalize_text(text), entity_types, limit, mode)
+            for text in search_texts
         ]
+        results, missing = _cached_results(self.cache, keys, version)
 
-        edges = [
-            GraphEdge(
-                source=edge.start_node.get("id", ""),
-                target=edge.end_node.get("id", ""),
-                type=edge.type,
-                properties=dict(edge),
+        if missing:
+            fetched = self.client.search_entities(
+                [search_texts[i] for i in missing], entity_types, limit, mode
             )
-            for edge in result.get("edges", [])
+            _store_results(self.cache, keys, version, results, missing, fetched)
+
+        return results
+
+
+def _cached_results(
+    cache: TraversalCache, keys: list[Hashable], version: int
+) -> tuple[list[Any], list[int]]:
+    results: list[Any] = []
+    missing: list[int] = []
+    for i, key in enumerate(keys):
+        found, value = cache.get(key, version)
+        results.append(value)
+        if not found:
+            missing.append(i)
+    return results, missing
+
+
+def _store_results(
+    cache: TraversalCache,
+    keys: list[Hashable],
+    version: int,
+    results: list[Any],
+    missing: list[int],
+    fetched: list[Any],
+) -> None:
+    for i, value in zip(missing, fetched):
+        results[i] = value
+        cache.set(keys[i], version, value)
+
+
+class AsyncGraphTraversal:
+    def __init__(
+        self,
+        config: Config,
+        neo4j_client: AsyncNeo4jClient,
+        version: Optional[GraphVersion] = None,
+        snapshot_traversal: Optional[GraphTraversal] = None,
+    ) -> None:
+        self.config = config
+        self.client = neo4j_client
+        self.version = version or GraphVersion()
+        self.cache = _traversal_cache(config)
+        self.snapshot_traversal = snapshot_traversal
+
+    async def _cached(
+        self, key: Hashable, compute: Callable[[], Awaitable[T]]
+    ) -> T:
+        if not self.cache.enabled:
+            return await compute()
+
+        version = self.version.value
+        found, value = self.cache.get(key, version)
+        if found:
+            return value
+
+        value = await compute()
+        self.cache.set(key, version, value)
+        return value
+
+    def cache_stats(self) -> dict[str, Any]:
+        return {**self.cache.stats(), "version": self.version.value}
+
+    async def find_shortest_path(
+        self, source_id: str, target_id: str, max_hops: Optional[int] = None
+    ) -> Optional[GraphPath]:
+        if self.snapshot_traversal is not None:
+            return await asyncio.to_thread(
+                self.snapshot_traversal.find_shortest_path,
+                source_id,
+                target_id,
+                max_hops,
+            )
+
+        hops = max_hops or self.config.graph.max_hops
+        key = cache_key("shortest_path", source_id, target_id, hops)
+        return await self._cached(
+            key, lambda: self.client.find_shortest_path(source_id, target_id, hops)
+        )
+
+    async def find_k_shortest_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        k: int = 3,
+        max_hops: Optional[int] = None,
+    ) -> list[GraphPath]:
+        if self.snapshot_traversal is not None:
+            return await asyncio.to_thread(
+                self.snapshot_traversal.find_k_shortest_paths,
+                source_id,
+                target_id,
+                k,
+                max_hops,
+            )
+
+        hops = max_hops or self.config.graph.max_hops
+        key = cache_key("k_shortest_paths", source_id, target_id, k, hops)
+        return await self._cached(
+            key,
+            lambda: self.client.find_k_shortest_paths(source_id, target_id, k, hops),
+        )
+
+    async def find_related_entities(
+        self,
+        entity_id: str,
+        relation_types: Optional[list[str]] = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        if self.snapshot_traversal is not None:
+            return await asyncio.to_thread(
+                self.snapshot_traversal.find_related_entities,
+                entity_id,
+                relation_types,
+                limit,
+            )
+
+        key = cache_key("related", entity_id, relation_types, limit)
+        return await self._cached(
+            key, lambda: self.client.find_related(entity_id, relation_types, limit)
+        )
+
+    async def expand_neighborhoods(
+        self,
+        seed_texts: Optional[list[str]] = None,
+        seed_ids: Optional[list[str]] = None,
+        max_hops: Optional[int] = None,
+        relation_types: Optional[list[str]] = None,
+        entity_types: Optional[list[str]] = None,
+        per_seed_limit: int = 25,
+        mode: str = "prefix",
+    ) -> GraphSubgraph:
+        if self.snapshot_traversal is not None:
+            return await asyncio.to_thread(
+                self.snapshot_traversal.expand_neighborhoods,
+                seed_texts,
+                seed_ids,
+                max_hops,
+                relation_types,
+                entity_types,
+                per_seed_limit,
+                mode,
+            )
+
+        hops = max_hops or self.config.graph.max_hops
+        key = cache_key(
+            "expand",
+            seed_texts or [],
+            seed_ids or [],
+            hops,
+            relation_types,
+            entity_types,
+            per_seed_limit,
+            mode,
+        )
+        return await self._cached(
+            key,
+            lambda: self.client.expand_neighborhoods(
+                seed_texts,
+                seed_ids,
+                hops,
+                relation_types,
+                entity_types,
+                per_seed_limit,
+                mode=mode,
+            ),
+        )
+
+    async def search_entities_by_text(
+        self,
+        search_text: str,
+        entity_types: Optional[list[str]] = None,
+        limit: int = 10,
+        mode: str = "prefix",
+    ) -> list[dict[str, Any]]:
+        results = await self.search_entities_by_texts(
+            [search_text], entity_types, limit, mode
+        )
+        return results[0]
+
+    async def search_entities_by_texts(
+        self,
+        search_texts: list[str],
+        entity_types: Optional[list[str]] = None,
+        limit: int = 10,
+        mode: str = "prefix",
+    ) -> list[list[dict[str, Any]]]:
+        version = self.version.value
+        keys = [
+            cache_key("search", normalize_text(text), entity_types, limit, mode)
+            for text in search_texts
         ]
+        results, missing = _cached_results(self.cache, keys, version)
+
+        if missing:
+            fetched = await self.client.search_entities(
+                [search_texts[i] for i in missing], entity_types, limit, mode
+            )
+            _store_results(self.cache, keys, version, results, missing, fetched)
 
-        return GraphPath(nodes=nodes, edges=edges, length=len(edges))
+        return results
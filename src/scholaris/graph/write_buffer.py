@@ -0,0 +1,193 @@
+import queue
+import threading
+import time
+from typing import Any, Optional
+
+from scholaris.extraction.entities import merge_entities
+from scholaris.extraction.relations import merge_relations, relation_key
+from scholaris.graph.builder import GraphBuilder
+from scholaris.types import Entity, Relation
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+
+class GraphWriteError(Exception):
+    pass
+
+
+class GraphWriteBuffer:
+
+    def __init__(
+        self,
+        builder: GraphBuilder,
+        queue_size: Optional[int] = None,
+        flush_size: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+    ) -> None:
+        graph_config = builder.config.graph
+        self.builder = builder
+        self.flush_size = flush_size or graph_config.write_flush_size
+        self.flush_seconds = (
+            flush_seconds
+            if flush_seconds is not None
+            else graph_config.write_flush_seconds
+        )
+
+        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue(
+            maxsize=queue_size or graph_config.write_queue_size
+        )
+        self._entities: dict[str, Entity] = {}
+        self._relations: dict[tuple[str, str, str], Relation] = {}
+        self._worker: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+        self.stats: dict[str, int] = {
+            "entities_received": 0,
+            "relations_received": 0,
+            "entities_written": 0,
+            "relations_written": 0,
+            "coalesced": 0,
+            "flushes": 0,
+        }
+
+    def __enter__(self) -> "GraphWriteBuffer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close(raise_errors=exc_type is None)
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="graph-write-buffer", daemon=True
+            )
+            self._worker.start()
+
+    def add_entities(self, entities: list[Entity]) -> None:
+        if entities:
+            self._put("entities", list(entities))
+
+    def add_relations(self, relations: list[Relation]) -> None:
+        if relations:
+            self._put("relations", list(relations))
+
+    def flush(self) -> None:
+        done = threading.Event()
+        self._put("flush", done)
+        done.wait()
+        self._raise_error()
+
+    def close(self, raise_errors: bool = True) -> dict[str, int]:
+        if self._worker is not None:
+            self._queue.put(("stop", None))
+            self._worker.join()
+            self._worker = None
+
+        logger.info("graph_write_buffer_closed", **self.stats)
+
+        if raise_errors:
+            self._raise_error()
+        return self.stats
+
+    def _put(self, kind: str, payload: Any) -> None:
+        self._raise_error()
+        if self._worker is None:
+            raise GraphWriteError("Graph write buffer is not running")
+        self._queue.put((kind, payload))
+
+    def _raise_error(self) -> None:
+        error = self._error
+        if error is not None:
+            raise GraphWriteError(f"Graph write failed: {error}") from error
+
+    def _run(self) -> None:
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+
+            try:
+                kind, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush_pending()
+                deadline = None
+                continue
+
+            if kind == "entities":
+                self._coalesce_entities(payload)
+            elif kind == "relations":
+                self._coalesce_relations(payload)
+            else:
+                self._flush_pending()
+                deadline = None
+                if kind == "stop":
+                    return
+                payload.set()
+                continue
+
+            if self._pending() >= self.flush_size:
+                self._flush_pending()
+                deadline = None
+            elif deadline is None:
+                deadline = time.monotonic() + self.flush_seconds
+
+    def _pending(self) -> int:
+        return len(self._entities) + len(self._relations)
+
+    def _coalesce_entities(self, entities: list[Entity]) -> None:
+        for entity in entities:
+            self.stats["entities_received"] += 1
+            if not entity.id:
+                logger.warning("entity_missing_id", text=entity.text)
+                continue
+
+            existing = self._entities.get(entity.id)
+            if existing is None:
+                self._entities[entity.id] = entity
+                continue
+
+            self.stats["coalesced"] += 1
+            self._entities[entity.id] = merge_entities(existing, entity)
+
+    def _coalesce_relations(self, relations: list[Relation]) -> None:
+        for relation in relations:
+            self.stats["relations_received"] += 1
+            key = relation_key(relation)
+
+            existing = self._relations.get(key)
+            if existing is None:
+                self._relations[key] = relation
+                continue
+
+            self.stats["coalesced"] += 1
+            self._relations[key] = merge_relations(existing, relation)
+
+    def _flush_pending(self) -> None:
+        if not self._pending():
+            return
+
+        entities = list(self._entities.values())
+        relations = list(self._relations.values())
+        self._entities.clear()
+        self._relations.clear()
+
+        try:
+            written = self.builder.build_graph(entities, relations)
+        except Exception as e:
+            logger.error(
+                "graph_write_flush_failed",
+                entities=len(entities),
+                relations=len(relations),
+                error=str(e),
+            )
+            if self._error is None:
+                self._error = e
+            return
+
+        self.stats["entities_written"] += written["entities"]
+        self.stats["relations_written"] += written["relations"]
+        self.stats["flushes"] += 1
@@ -1,5 +1,8 @@
-
-from typing import Optional
+import re
+import zlib
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional, Union
 
 from scholaris.types import DocumentChunk
 from scholaris.utils.helpers import generate_id
@@ -10,13 +13,120 @@ logger = StructuredLogger(__name__)
 DEFAULT_CHUNK_SIZE = 1000
 DEFAULT_OVERLAP = 200
 
+SENTENCE_BOUNDARY = re.compile(r"\. ")
+SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*(?=\s+[\"'(\[]?[A-Z0-9])")
+NON_SPACE = re.compile(r"\S")
+WHITESPACE = re.compile(r"\s+")
+MAX_SENTENCE_CHARS_PER_TOKEN = 8
 
-def chunk_text(
-    text: str,
-    document_id: str,
-    chunk_size: int = DEFAULT_CHUNK_SIZE,
-    overlap: int = DEFAULT_OVERLAP,
-) -> list[DocumentChunk]:
+CUT_WINDOW = 32
+CUT_WORD_CHARS = 6
+CUTS_PER_CHUNK = 8
+
+
+class ChunkView:
+
+    __slots__ = (
+        "document_id",
+        "buffer",
+        "offset",
+        "start_char",
+        "end_char",
+        "index",
+        "page_start",
+        "page_end",
+        "sentences",
+        "tokens",
+        "_id",
+    )
+
+    def __init__(
+        self,
+        document_id: str,
+        buffer: str,
+        offset: int,
+        start_char: int,
+        end_char: int,
+        index: int,
+        page_start: Optional[int] = None,
+        page_end: Optional[int] = None,
+        sentences: Optional[int] = None,
+        tokens: Optional[int] = None,
+    ) -> None:
+        self.document_id = document_id
+        self.buffer = buffer
+        self.offset = offset
+        self.start_char = start_char
+        self.end_char = end_char
+        self.index = index
+        self.page_start = page_start
+        self.page_end = page_end
+        self.sentences = sentences
+        self.tokens = tokens
+        self._id: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return self.buffer[self.start_char - self.offset : self.end_char - self.offset]
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = generate_id(f"{self.document_id}_{self.text}")
+        return self._id
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        metadata: dict[str, Any] = {"chunk_index": self.index}
+        if self.sentences is not None:
+            metadata["sentences"] = self.sentences
+        if self.tokens is not None:
+            metadata["tokens"] = self.tokens
+        if self.page_start is not None:
+            metadata["page_start"] = self.page_start
+            metadata["page_end"] = self.page_end
+        return metadata
+
+    def to_chunk(self) -> DocumentChunk:
+        return DocumentChunk(
+            id=self.id,
+            document_id=self.document_id,
+            text=self.text,
+            start_char=self.start_char,
+            end_char=self.end_char,
+            metadata=self.metadata,
+        )
+
+
+Chunk = Union[DocumentChunk, ChunkView]
+
+
+class _PageIndex:
+
+    __slots__ = ("offsets", "pages")
+
+    def __init__(self) -> None:
+        self.offsets: list[int] = []
+        self.pages: list[Optional[int]] = []
+
+    def add(self, offset: int, page: Optional[int]) -> None:
+        self.offsets.append(offset)
+        self.pages.append(page)
+
+    def span(self, start: int, end: int) -> tuple[Optional[int], Optional[int]]:
+        first = self.pages[bisect_right(self.offsets, start) - 1]
+        last = self.pages[bisect_right(self.offsets, end - 1) - 1]
+        if first is None or last is None:
+            return None, None
+        return first, last
+
+    def trim(self, start: int) -> None:
+        keep = bisect_right(self.offsets, start) - 1
+        del self.offsets[:keep]
+        del self.pages[:keep]
+
+
+def _validate_chunking(chunk_size: int, overlap: int) -> None:
     if chunk_size <= 0:
         raise ValueError(f"Chunk size must be positive, got {chunk_size}")
 
@@ -25,74 +135,295 @@ def chunk_text(
             f"Overlap must be between 0 and chunk_size ({chunk_size}), got {overlap}"
         )
 
-    if not text:
-        return []
 
-    chunks = []
-    start = 0
-    chunk_index = 0
+def chunk_text(
+    text: str,
+    document_id: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overlap: int = DEFAULT_OVERLAP,
+) -> list[DocumentChunk]:
+    return [
+        view.to_chunk()
+        for view in iter_chunks([(None, text)], document_id, chunk_size, overlap)
+    ]
 
-    while start < len(text):
-        end = min(start + chunk_size, len(text))
-        chunk_text = text[start:end]
 
-        chunk_id = generate_id(f"{document_id}_{chunk_index}")
+def iter_chunks(
+    segments: Iterable[tuple[Optional[int], str]],
+    document_id: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overlap: int = DEFAULT_OVERLAP,
+) -> Iterator[ChunkView]:
+    _validate_chunking(chunk_size, overlap)
+    return _iter_chunks(segments, document_id, chunk_size, overlap)
 
-        chunk = DocumentChunk(
-            id=chunk_id,
-            document_id=document_id,
-            text=chunk_text,
-            start_char=start,
-            end_char=end,
-            metadata={"chunk_index": chunk_index},
-        )
-        chunks.append(chunk)
 
-        chunk_index += 1
-        start = end - overlap
+def _cut_divisor(chunk_size: int) -> int:
+    return max(1, chunk_size // (2 * CUT_WORD_CHARS * CUTS_PER_CHUNK))
 
-        if end >= len(text):
+
+def _find_cut(
+    buffer: str,
+    buffer_start: int,
+    chunk_start: int,
+    core_start: int,
+    chunk_size: int,
+    divisor: int,
+    final: bool,
+) -> Optional[int]:
+    length = buffer_start + len(buffer)
+    low = max(core_start + 1, chunk_start + chunk_size // 2)
+    high = chunk_start + chunk_size
+    if length <= high:
+        return length if final else None
+
+    cut = high
+    for match in WHITESPACE.finditer(buffer, low - buffer_start):
+        end = match.end()
+        if buffer_start + end > high:
             break
+        window = buffer[max(0, end - CUT_WINDOW) : end].encode()
+        if zlib.crc32(window) % divisor == 0:
+            cut = buffer_start + end
+
+    return cut
+
+
+def _iter_chunks(
+    segments: Iterable[tuple[Optional[int], str]],
+    document_id: str,
+    chunk_size: int,
+    overlap: int,
+) -> Iterator[ChunkView]:
+    buffer = ""
+    buffer_start = 0
+    pages = _PageIndex()
+
+    core_start = 0
+    chunk_index = 0
+    total_chars = 0
+    divisor = _cut_divisor(chunk_size)
+
+    def chunks(final: bool) -> Iterator[ChunkView]:
+        nonlocal core_start, chunk_index, total_chars
+        while core_start < buffer_start + len(buffer):
+            start = max(0, core_start - overlap)
+            end = _find_cut(
+                buffer, buffer_start, start, core_start, chunk_size, divisor, final
+            )
+            if end is None:
+                return
+
+            first, last = pages.span(start, end)
+            total_chars += end - start
+            yield ChunkView(
+                document_id, buffer, buffer_start, start, end, chunk_index, first, last
+            )
+
+            chunk_index += 1
+            core_start = end
+
+    for page, segment in segments:
+        if not segment:
+            continue
+
+        pages.add(buffer_start + len(buffer), page)
+        buffer += segment
+        yield from chunks(final=False)
+
+        keep = core_start - max(overlap, CUT_WINDOW)
+        if keep > buffer_start:
+            buffer = buffer[keep - buffer_start :]
+            buffer_start = keep
+            pages.trim(keep)
+
+    yield from chunks(final=True)
 
     logger.info(
         "chunked_text",
         document_id=document_id,
-        total_chunks=len(chunks),
-        avg_size=sum(len(c.text) for c in chunks) // len(chunks) if chunks else 0,
+        total_chunks=chunk_index,
+        avg_size=total_chars // chunk_index if chunk_index else 0,
     )
 
-    return chunks
-
 
 def chunk_by_sentences(
     text: str, document_id: str, max_sentences: int = 5
 ) -> list[DocumentChunk]:
-    sentences = text.split(". ")
+    spans = []
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        spans.append((start, boundary.start() + 1))
+        start = boundary.end()
+    if start < len(text):
+        spans.append((start, len(text)))
+
     chunks = []
-    chunk_index = 0
-    start_char = 0
+    for chunk_index, i in enumerate(range(0, len(spans), max_sentences)):
+        group = spans[i : i + max_sentences]
+        view = ChunkView(
+            document_id,
+            text,
+            0,
+            group[0][0],
+            group[-1][1],
+            chunk_index,
+            sentences=len(group),
+        )
+        chunks.append(view.to_chunk())
 
-    for i in range(0, len(sentences), max_sentences):
-        sentence_group = sentences[i : i + max_sentences]
-        chunk_text = ". ".join(sentence_group)
+    return chunks
 
-        if not chunk_text.endswith("."):
-            chunk_text += "."
 
-        end_char = start_char + len(chunk_text)
-        chunk_id = generate_id(f"{document_id}_{chunk_index}")
+def iter_token_chunks(
+    segments: Iterable[tuple[Optional[int], str]],
+    document_id: str,
+    encoder: Any,
+    max_tokens: int,
+    overlap_tokens: int = 0,
+) -> Iterator[ChunkView]:
+    if max_tokens <= 0:
+        raise ValueError(f"Token budget must be positive, got {max_tokens}")
 
-        chunk = DocumentChunk(
-            id=chunk_id,
-            document_id=document_id,
-            text=chunk_text,
-            start_char=start_char,
-            end_char=end_char,
-            metadata={"chunk_index": chunk_index, "sentences": len(sentence_group)},
+    if overlap_tokens < 0 or overlap_tokens >= max_tokens:
+        raise ValueError(
+            f"Token overlap must be between 0 and max_tokens ({max_tokens}), "
+            f"got {overlap_tokens}"
         )
-        chunks.append(chunk)
 
+    return _iter_token_chunks(
+        segments, document_id, encoder, max_tokens, overlap_tokens
+    )
+
+
+def _iter_token_chunks(
+    segments: Iterable[tuple[Optional[int], str]],
+    document_id: str,
+    encoder: Any,
+    max_tokens: int,
+    overlap_tokens: int,
+) -> Iterator[ChunkView]:
+    buffer = ""
+    buffer_start = 0
+    pages = _PageIndex()
+
+    sentence_start = 0
+    window: list[tuple[int, int, int]] = []
+    chunk_index = 0
+    total_tokens = 0
+    max_sentence_chars = max_tokens * MAX_SENTENCE_CHARS_PER_TOKEN
+
+    def make_chunk(start: int, end: int, tokens: int, sentences: int) -> ChunkView:
+        nonlocal chunk_index
+        text_start = NON_SPACE.search(buffer, start - buffer_start, end - buffer_start)
+        if text_start is not None:
+            start = buffer_start + text_start.start()
+
+        first, last = pages.span(start, end)
+        view = ChunkView(
+            document_id,
+            buffer,
+            buffer_start,
+            start,
+            end,
+            chunk_index,
+            first,
+            last,
+            sentences,
+            tokens,
+        )
         chunk_index += 1
-        start_char = end_char
+        return view
 
-    return chunks
+    def window_chunk() -> ChunkView:
+        return make_chunk(
+            window[0][0],
+            window[-1][1],
+            sum(tokens for _, _, tokens in window),
+            len(window),
+        )
+
+    def split_sentence(start: int, end: int, tokens: list[int]) -> list[ChunkView]:
+        _, offsets = encoder.decode_with_offsets(tokens)
+        chunks = []
+        for i in range(0, len(tokens), max_tokens):
+            piece_start = start + offsets[i]
+            piece_end = (
+                start + offsets[i + max_tokens] if i + max_tokens < len(tokens) else end
+            )
+            if piece_end > piece_start:
+                chunks.append(
+                    make_chunk(
+                        piece_start, piece_end, len(tokens[i : i + max_tokens]), 1
+                    )
+                )
+        return chunks
+
+    def pack(start: int, end: int) -> list[ChunkView]:
+        nonlocal total_tokens
+        text = buffer[start - buffer_start : end - buffer_start]
+        if not text.strip():
+            return []
+
+        tokens = encoder.encode(text)
+        count = len(tokens)
+        total_tokens += count
+        chunks = []
+
+        if count > max_tokens:
+            if window:
+                chunks.append(window_chunk())
+                window.clear()
+            chunks.extend(split_sentence(start, end, tokens))
+            return chunks
+
+        if window and sum(tokens for _, _, tokens in window) + count > max_tokens:
+            chunks.append(window_chunk())
+            carry: list[tuple[int, int, int]] = []
+            carried = 0
+            for sentence in reversed(window[1:]):
+                carried += sentence[2]
+                if carried > overlap_tokens or carried + count > max_tokens:
+                    break
+                carry.insert(0, sentence)
+            window[:] = carry
+
+        window.append((start, end, count))
+        return chunks
+
+    for page, segment in segments:
+        if not segment:
+            continue
+
+        pages.add(buffer_start + len(buffer), page)
+        buffer += segment
+
+        for match in SENTENCE_END.finditer(buffer, sentence_start - buffer_start):
+            end = buffer_start + match.end()
+            yield from pack(sentence_start, end)
+            sentence_start = end
+
+        length = buffer_start + len(buffer)
+        while length - sentence_start > max_sentence_chars:
+            limit = sentence_start - buffer_start + max_sentence_chars
+            cut = buffer.rfind(" ", sentence_start - buffer_start + 1, limit)
+            end = buffer_start + (cut if cut > 0 else limit)
+            yield from pack(sentence_start, end)
+            sentence_start = end
+
+        keep = min(window[0][0], sentence_start) if window else sentence_start
+        if keep > buffer_start:
+            buffer = buffer[keep - buffer_start :]
+            buffer_start = keep
+            pages.trim(keep)
+
+    yield from pack(sentence_start, buffer_start + len(buffer))
+    if window:
+        yield window_chunk()
+
+    logger.info(
+        "chunked_tokens",
+        document_id=document_id,
+        total_chunks=chunk_index,
+        total_tokens=total_tokens,
+    )
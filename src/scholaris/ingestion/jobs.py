@@ -0,0 +1,304 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Optional
+from uuid import uuid4
+
+from scholaris.config import Config
+from scholaris.memory.redis_client import RedisClient
+from scholaris.types import IngestionJob, IngestionJobStatus
+from scholaris.utils.helpers import process_pool
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+JOB_KEY_PREFIX = "ingest_job"
+JOB_INDEX_KEY = "ingest_jobs"
+OWNER_KEY_PREFIX = "ingest_job_owner"
+PROGRESS_INTERVAL = 1.0
+OWNER_TTL = 30
+
+FINISHED_STATUSES = {
+    IngestionJobStatus.SUCCEEDED,
+    IngestionJobStatus.FAILED,
+    IngestionJobStatus.CANCELLED,
+}
+
+Ingest = Callable[..., dict[str, Any]]
+
+_worker: dict[str, Any] = {}
+
+
+class IngestionCancelledError(Exception):
+    pass
+
+
+class IngestionJobStore:
+
+    def __init__(self, redis_client: RedisClient, ttl: int) -> None:
+        self.redis = redis_client
+        self.ttl = ttl
+
+    def _key(self, job_id: str) -> str:
+        return f"{JOB_KEY_PREFIX}:{job_id}"
+
+    def _cancel_key(self, job_id: str) -> str:
+        return f"{JOB_KEY_PREFIX}:{job_id}:cancel"
+
+    def save(self, job: IngestionJob) -> None:
+        self.redis.set(self._key(job.id), job.model_dump(mode="json"), self.ttl)
+
+    def load(self, job_id: str) -> Optional[IngestionJob]:
+        data = self.redis.get(self._key(job_id))
+        return IngestionJob(**data) if data else None
+
+    def cancel_requested(self, job_id: str) -> bool:
+        return self.redis.exists(self._cancel_key(job_id))
+
+    def request_cancel(self, job_id: str) -> None:
+        self.redis.set(self._cancel_key(job_id), True, self.ttl)
+
+    def run(self, ingest: Ingest, job_id: str) -> None:
+        job = self.load(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return
+
+        if self.cancel_requested(job_id):
+            self.finish(job, IngestionJobStatus.CANCELLED)
+            return
+
+        job.status = IngestionJobStatus.RUNNING
+        job.started_at = datetime.now()
+        self.save(job)
+        logger.info("ingestion_job_started", job_id=job_id, file=job.file_path)
+
+        last_update = time.monotonic()
+
+        def progress(counts: dict[str, int]) -> None:
+            nonlocal last_update
+            job.progress = counts
+            if time.monotonic() - last_update < PROGRESS_INTERVAL:
+                return
+            last_update = time.monotonic()
+
+            self.save(job)
+            if self.cancel_requested(job_id):
+                raise IngestionCancelledError(f"Job {job_id} was cancelled")
+
+        try:
+            result = ingest(job.file_path, force=job.force, progress=progress)
+        except IngestionCancelledError:
+            self.finish(job, IngestionJobStatus.CANCELLED)
+        except Exception as e:
+            logger.error("ingestion_job_failed", job_id=job_id, error=str(e))
+            self.finish(job, IngestionJobStatus.FAILED, error=str(e))
+        else:
+            self.finish(job, IngestionJobStatus.SUCCEEDED, result=result)
+
+    def finish(
+        self,
+        job: IngestionJob,
+        status: IngestionJobStatus,
+        result: Optional[dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        job.status = status
+        job.result = result
+        job.error = error
+        job.cancel_requested = False
+        job.finished_at = datetime.now()
+        if result is not None:
+            job.progress = {
+                "chunks": result.get("chunks", 0),
+                "chunks_added": result.get("chunks_added", 0),
+                "entities": result.get("entities", 0),
+                "relations": result.get("relations", 0),
+            }
+
+        self.save(job)
+        self.redis.delete(self._cancel_key(job.id))
+        logger.info("ingestion_job_finished", job_id=job.id, status=status.value)
+
+
+def _init_worker(config: Config, ingest_factory: Callable[[Config], Ingest]) -> None:
+    _worker["store"] = IngestionJobStore(RedisClient(config), config.extraction.job_ttl)
+    _worker["ingest"] = ingest_factory(config)
+
+
+def _run_in_worker(job_id: str) -> None:
+    _worker["store"].run(_worker["ingest"], job_id)
+
+
+class IngestionJobQueue:
+
+    def __init__(
+        self,
+        config: Config,
+        redis_client: RedisClient,
+        ingest: Ingest,
+        ingest_factory: Optional[Callable[[Config], Ingest]] = None,
+    ) -> None:
+        self.config = config
+        self.redis = redis_client
+        self.ingest = ingest
+        self.ingest_factory = ingest_factory
+        self.ttl = config.extraction.job_ttl
+        self.workers = config.extraction.job_workers
+        self.store = IngestionJobStore(redis_client, self.ttl)
+        self.owner = uuid4().hex
+
+        self._task: Callable[[str], None] = self._run_local
+        if ingest_factory is not None:
+            self._task = _run_in_worker
+
+        self._futures: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._executor = self._start_executor()
+
+        self._beat()
+        self._heartbeat = threading.Thread(
+            target=self._run_heartbeat, name="ingestion-job-heartbeat", daemon=True
+        )
+        self._heartbeat.start()
+        self.recover()
+
+    def _start_executor(self) -> Executor:
+        if self.ingest_factory is None:
+            return ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="ingestion-job"
+            )
+        return process_pool(
+            self.workers, [__name__], _init_worker, (self.config, self.ingest_factory)
+        )
+
+    def _run_local(self, job_id: str) -> None:
+        self.store.run(self.ingest, job_id)
+
+    def _owner_key(self, owner: str) -> str:
+        return f"{OWNER_KEY_PREFIX}:{owner}"
+
+    def _beat(self) -> None:
+        self.redis.set(self._owner_key(self.owner), True, OWNER_TTL)
+
+    def _run_heartbeat(self) -> None:
+        swept_at = time.monotonic()
+        while not self._stopped.wait(OWNER_TTL / 3):
+            try:
+                self._beat()
+                if time.monotonic() - swept_at >= OWNER_TTL:
+                    swept_at = time.monotonic()
+                    self.recover()
+            except Exception as e:
+                logger.warning("ingestion_job_heartbeat_failed", error=str(e))
+
+    def recover(self) -> int:
+        interrupted = 0
+        for job_id in self.redis.index_members(JOB_INDEX_KEY):
+            job = self.store.load(job_id)
+            if job is None or job.status in FINISHED_STATUSES:
+                continue
+            if job.owner == self.owner or (
+                job.owner and self.redis.exists(self._owner_key(job.owner))
+            ):
+                continue
+
+            self.store.finish(
+                job,
+                IngestionJobStatus.FAILED,
+                error="Interrupted: the process running this job stopped",
+            )
+            interrupted += 1
+
+        if interrupted:
+            logger.warning("ingestion_jobs_interrupted", jobs=interrupted)
+        return interrupted
+
+    def submit(self, file_path: str, force: bool = False) -> IngestionJob:
+        job = IngestionJob(
+            id=str(uuid4()), file_path=file_path, force=force, owner=self.owner
+        )
+        self.store.save(job)
+
+        now = time.time()
+        self.redis.add_to_index(JOB_INDEX_KEY, job.id, now)
+        self.redis.remove_from_index(JOB_INDEX_KEY, max_score=now - self.ttl)
+
+        self._dispatch(job.id)
+        logger.info("ingestion_job_submitted", job_id=job.id, file=file_path)
+        return job
+
+    def _dispatch(self, job_id: str) -> None:
+        with self._lock:
+            try:
+                future = self._executor.submit(self._task, job_id)
+            except BrokenProcessPool:
+                self._executor.shutdown(wait=False)
+                self._executor = self._start_executor()
+                logger.warning("ingestion_job_pool_restarted")
+                future = self._executor.submit(self._task, job_id)
+            self._futures[job_id] = future
+        future.add_done_callback(lambda done: self._on_done(job_id, done))
+
+    def _on_done(self, job_id: str, future: Future[None]) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+        if future.cancelled() or future.exception() is None:
+            return
+
+        error = future.exception()
+        job = self.store.load(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return
+
+        if (
+            isinstance(error, BrokenProcessPool)
+            and job.status == IngestionJobStatus.QUEUED
+            and not self._stopped.is_set()
+        ):
+            self._dispatch(job_id)
+            return
+
+        logger.error("ingestion_job_crashed", job_id=job_id, error=str(error))
+        self.store.finish(job, IngestionJobStatus.FAILED, error=str(error))
+
+    def get(self, job_id: str) -> Optional[IngestionJob]:
+        job = self.store.load(job_id)
+        if job is not None and job.status not in FINISHED_STATUSES:
+            job.cancel_requested = self.store.cancel_requested(job_id)
+        return job
+
+    def list_jobs(self, limit: int = 50) -> list[IngestionJob]:
+        jobs = []
+        expired = []
+        for job_id in self.redis.index_members(JOB_INDEX_KEY, limit):
+            job = self.get(job_id)
+            if job is None:
+                expired.append(job_id)
+            else:
+                jobs.append(job)
+
+        self.redis.remove_from_index(JOB_INDEX_KEY, *expired)
+        return jobs
+
+    def cancel(self, job_id: str) -> Optional[IngestionJob]:
+        job = self.store.load(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return job
+
+        self.store.request_cancel(job_id)
+        logger.info("ingestion_job_cancel_requested", job_id=job_id)
+        return self.get(job_id)
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        with self._lock:
+            job_ids = list(self._futures)
+        for job_id in job_ids:
+            self.cancel(job_id)
+        self._executor.shutdown(wait=True)
+        self._heartbeat.join()
+        self.redis.delete(self._owner_key(self.owner))
@@ -1,10 +1,16 @@
 
+import math
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from pypdf import PdfReader
 
-from scholaris.utils.helpers import generate_id
+from scholaris.utils.helpers import generate_id, process_pool
 from scholaris.utils.logging import StructuredLogger
 
 logger = StructuredLogger(__name__)
@@ -15,29 +21,95 @@ class DocumentLoadError(Exception):
     pass
 
 
-def load_pdf(file_path: Path) -> str:
-    try:
-        reader = PdfReader(file_path)
-        text_parts = []
-
-        for page_num, page in enumerate(reader.pages, start=1):
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-
-        full_text = "\n\n".join(text_parts)
-        logger.info(
-            "loaded_pdf",
-            file=file_path.name,
-            pages=len(reader.pages),
-            chars=len(full_text),
+PAGE_SEPARATOR = "\n\n"
+TEXT_BLOCK_SIZE = 65536
+
+
+def extract_pdf_pages(file_path: str, start: int, stop: int) -> list[str]:
+    with open(file_path, "rb") as f:
+        reader = PdfReader(f)
+        return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _extract_pdf_parallel(
+    file_path: Path, page_count: int, workers: int
+) -> Iterator[str]:
+    range_size = math.ceil(page_count / (workers * 4))
+    ranges = iter(
+        (start, min(start + range_size, page_count))
+        for start in range(0, page_count, range_size)
+    )
+
+    with process_pool(workers, [__name__]) as executor:
+        pending: deque[Future[list[str]]] = deque(
+            executor.submit(extract_pdf_pages, str(file_path), start, stop)
+            for start, stop in islice(ranges, workers * 2)
         )
-        return full_text
+        while pending:
+            texts = pending.popleft().result()
+            for start, stop in islice(ranges, 1):
+                pending.append(
+                    executor.submit(extract_pdf_pages, str(file_path), start, stop)
+                )
+            yield from texts
+
+
+def iter_pdf_pages(
+    file_path: Path, workers: int = 1, parallel_pages: int = 0
+) -> Iterator[tuple[Optional[int], str]]:
+    try:
+        with file_path.open("rb") as f:
+            reader = PdfReader(f)
+            page_count = len(reader.pages)
+            chars = 0
+
+            texts: Iterable[str] = (page.extract_text() for page in reader.pages)
+            if workers > 1 and parallel_pages and page_count >= parallel_pages:
+                logger.info(
+                    "loading_pdf_parallel",
+                    file=file_path.name,
+                    pages=page_count,
+                    workers=workers,
+                )
+                texts = _extract_pdf_parallel(file_path, page_count, workers)
+
+            for page_num, text in enumerate(texts, start=1):
+                if not text:
+                    continue
+                if chars:
+                    text = PAGE_SEPARATOR + text
+                chars += len(text)
+                yield page_num, text
+
+            logger.info(
+                "loaded_pdf",
+                file=file_path.name,
+                pages=page_count,
+                chars=chars,
+            )
 
     except Exception as e:
         raise DocumentLoadError(f"Failed to load PDF {file_path}: {e}") from e
 
 
+def iter_text_blocks(file_path: Path) -> Iterator[tuple[Optional[int], str]]:
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            chars = 0
+            while block := f.read(TEXT_BLOCK_SIZE):
+                chars += len(block)
+                yield None, block
+
+        logger.info("loaded_text", file=file_path.name, chars=chars)
+
+    except Exception as e:
+        raise DocumentLoadError(f"Failed to load text file {file_path}: {e}") from e
+
+
+def load_pdf(file_path: Path) -> str:
+    return "".join(text for _, text in iter_pdf_pages(file_path))
+
+
 def load_text(file_path: Path) -> str:
     try:
         with open(file_path, encoding="utf-8") as f:
@@ -54,7 +126,11 @@ def load_markdown(file_path: Path) -> str:
     return load_text(file_path)
 
 
-def load_document(file_path: str) -> tuple[str, str]:
+def document_id_for(path: Path) -> str:
+    return generate_id(str(path.resolve()))
+
+
+def _resolve_loader(file_path: str, loaders: dict[str, Any]) -> tuple[Path, Any]:
     path = Path(file_path)
 
     if not path.exists():
@@ -64,13 +140,6 @@ def load_document(file_path: str) -> tuple[str, str]:
         raise DocumentLoadError(f"Not a file: {file_path}")
 
     suffix = path.suffix.lower()
-    loaders = {
-        ".pdf": load_pdf,
-        ".txt": load_text,
-        ".md": load_markdown,
-        ".markdown": load_markdown,
-    }
-
     loader = loaders.get(suffix)
     if not loader:
         raise ValueError(
@@ -78,7 +147,41 @@ def load_document(file_path: str) -> tuple[str, str]:
             f"Supported types: {list(loaders.keys())}"
         )
 
+    return path, loader
+
+
+def load_document(file_path: str) -> tuple[str, str]:
+    path, loader = _resolve_loader(
+        file_path,
+        {
+            ".pdf": load_pdf,
+            ".txt": load_text,
+            ".md": load_markdown,
+            ".markdown": load_markdown,
+        },
+    )
+
     content = loader(path)
-    document_id = generate_id(f"{path.name}_{path.stat().st_mtime}")
+    document_id = document_id_for(path)
 
     return document_id, content
+
+
+def stream_document(
+    file_path: str, pdf_workers: int = 1, pdf_parallel_pages: int = 0
+) -> tuple[str, Iterator[tuple[Optional[int], str]]]:
+    path, loader = _resolve_loader(
+        file_path,
+        {
+            ".pdf": partial(
+                iter_pdf_pages,
+                workers=pdf_workers,
+                parallel_pages=pdf_parallel_pages,
+            ),
+            ".txt": iter_text_blocks,
+            ".md": iter_text_blocks,
+            ".markdown": iter_text_blocks,
+        },
+    )
+
+    return document_id_for(path), loader(path)
@@ -0,0 +1,161 @@
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from scholaris.config import Config
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+PIPELINE_VERSION = 4
+HASH_BLOCK_SIZE = 1 << 20
+
+MANIFEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    document_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    pipeline_version TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    chunks INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def pipeline_version(config: Config) -> str:
+    extraction = config.extraction
+    if extraction.chunk_tokens:
+        chunking = [
+            "tokens",
+            extraction.tokenizer_encoding,
+            extraction.chunk_tokens,
+            extraction.chunk_overlap_tokens,
+        ]
+    else:
+        chunking = ["chars", extraction.chunk_size, extraction.chunk_overlap]
+
+    return ":".join(
+        str(part)
+        for part in [
+            PIPELINE_VERSION,
+            *chunking,
+            extraction.entity_confidence_threshold,
+            extraction.relation_confidence_threshold,
+        ]
+    )
+
+
+class IngestionManifest:
+
+    def __init__(self, path: str, version: str) -> None:
+        self.path = path
+        self.version = version
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(MANIFEST_SCHEMA)
+
+        logger.info("ingestion_manifest_opened", path=path, version=version)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get(self, document_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM documents WHERE document_id = ?", (document_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def check(self, path: Path, document_id: str) -> tuple[bool, dict[str, Any]]:
+        stat = path.stat()
+        fingerprint: dict[str, Any] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "content_hash": None,
+        }
+
+        entry = self.get(document_id)
+        if (
+            entry is not None
+            and entry["status"] == "ingested"
+            and entry["pipeline_version"] == self.version
+            and entry["size"] == stat.st_size
+        ):
+            fingerprint["chunks"] = entry["chunks"]
+            if entry["mtime_ns"] == stat.st_mtime_ns:
+                fingerprint["content_hash"] = entry["content_hash"]
+                return True, fingerprint
+
+            fingerprint["content_hash"] = file_hash(path)
+            if fingerprint["content_hash"] == entry["content_hash"]:
+                self.record(path, document_id, "ingested", fingerprint, entry["chunks"])
+                return True, fingerprint
+            return False, fingerprint
+
+        fingerprint["content_hash"] = file_hash(path)
+        return False, fingerprint
+
+    def record(
+        self,
+        path: Path,
+        document_id: str,
+        status: str,
+        fingerprint: dict[str, Any],
+        chunks: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                INSERT INTO documents (
+                    document_id, path, content_hash, pipeline_version, size,
+                    mtime_ns, chunks, status, error, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(document_id) DO UPDATE SET
+                    path = excluded.path,
+                    content_hash = excluded.content_hash,
+                    pipeline_version = excluded.pipeline_version,
+                    size = excluded.size,
+                    mtime_ns = excluded.mtime_ns,
+                    chunks = excluded.chunks,
+                    status = excluded.status,
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    document_id,
+                    str(path),
+                    fingerprint["content_hash"],
+                    self.version,
+                    fingerprint["size"],
+                    fingerprint["mtime_ns"],
+                    chunks,
+                    status,
+                    error,
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
@@ -0,0 +1,307 @@
+import queue
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.managers import SyncManager
+from pathlib import Path
+from typing import Any, Optional
+
+from scholaris.config import Config
+from scholaris.extraction.chunks import extract_chunk
+from scholaris.extraction.entities import EntityExtractor
+from scholaris.extraction.relations import RelationExtractor
+from scholaris.ingestion.loader import document_id_for
+from scholaris.ingestion.pipeline import IngestionPipeline, create_ingestion_pipeline
+from scholaris.types import DocumentChunk, Entity, Relation
+from scholaris.utils.helpers import process_context, process_pool
+from scholaris.utils.logging import StructuredLogger
+
+logger = StructuredLogger(__name__)
+
+RESULT_QUEUE_BATCHES = 4
+RESULT_POLL_SECONDS = 0.1
+BUFFERED_BATCHES_PER_WORKER = 16
+
+Extraction = tuple[list[Entity], list[Relation]]
+ChunkBatch = list[tuple[DocumentChunk, Optional[Extraction]]]
+
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(config: Config, pdf_workers: int = 1) -> None:
+    _worker["pipeline"] = create_ingestion_pipeline(config, pdf_workers)
+    _worker["entity_extractor"] = EntityExtractor(config)
+    _worker["relation_extractor"] = RelationExtractor(config)
+
+
+def _put_batch(results: Any, stop: Any, batch: ChunkBatch) -> bool:
+    while not stop.is_set():
+        try:
+            results.put(batch, timeout=RESULT_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def extract_document(
+    file_path: str,
+    known_chunk_ids: frozenset[str],
+    results: Any,
+    stop: Any,
+    batch_size: int,
+) -> int:
+    _, stream = _worker["pipeline"].stream_document(file_path)
+
+    chunks = 0
+    batch: ChunkBatch = []
+    for view in stream:
+        chunk = view.to_chunk()
+        extracted = None
+        if chunk.id not in known_chunk_ids:
+            extracted = extract_chunk(
+                chunk, _worker["entity_extractor"], _worker["relation_extractor"]
+            )
+        batch.append((chunk, extracted))
+        chunks += 1
+
+        if len(batch) >= batch_size:
+            if not _put_batch(results, stop, batch):
+                return chunks
+            batch = []
+
+    if batch:
+        _put_batch(results, stop, batch)
+    return chunks
+
+
+class _DocumentTask:
+
+    __slots__ = (
+        "file_path",
+        "known_chunk_ids",
+        "future",
+        "results",
+        "stop",
+        "buffered",
+    )
+
+    def __init__(
+        self,
+        file_path: str,
+        known_chunk_ids: frozenset[str],
+        future: Future[int],
+        results: Any,
+        stop: Any,
+    ) -> None:
+        self.file_path = file_path
+        self.known_chunk_ids = known_chunk_ids
+        self.future = future
+        self.results = results
+        self.stop = stop
+        self.buffered: deque[ChunkBatch] = deque()
+
+    @property
+    def succeeded(self) -> bool:
+        return self.future.done() and self.future.exception() is None
+
+
+class _ExtractionRun:
+
+    def __init__(
+        self,
+        extractor: "ParallelExtractor",
+        files: Iterable[Path],
+        known_chunk_ids: Callable[[Path], frozenset[str]],
+    ) -> None:
+        self.extractor = extractor
+        self.paths = iter(files)
+        self.known_chunk_ids = known_chunk_ids
+        self.in_flight: deque[_DocumentTask] = deque()
+        self.errors: deque[tuple[str, Exception]] = deque()
+        self.budget = extractor.workers * BUFFERED_BATCHES_PER_WORKER
+        self.buffered = 0
+        self.exhausted = False
+
+    def top_up(self) -> None:
+        running = sum(1 for task in self.in_flight if not task.future.done())
+        while (
+            not self.exhausted
+            and running < self.extractor.workers * 2
+            and self.buffered < self.budget
+        ):
+            path = next(self.paths, None)
+            if path is None:
+                self.exhausted = True
+                return
+            try:
+                task = self.extractor._submit(str(path), self.known_chunk_ids(path))
+            except Exception as e:
+                self.errors.append((str(path), e))
+                continue
+            self.in_flight.append(task)
+            running += 1
+
+    def pump(self) -> None:
+        for task in self.in_flight:
+            while self.buffered < self.budget:
+                try:
+                    task.buffered.append(task.results.get_nowait())
+                except queue.Empty:
+                    break
+                self.buffered += 1
+        self.top_up()
+
+    def next_task(self) -> Optional[_DocumentTask]:
+        self.top_up()
+        if not self.in_flight:
+            return None
+
+        task = next((t for t in self.in_flight if t.succeeded), self.in_flight[0])
+        self.in_flight.remove(task)
+        return task
+
+    def stream(
+        self, task: _DocumentTask, extracted: dict[str, Extraction]
+    ) -> Iterator[DocumentChunk]:
+        try:
+            for batch in self.batches(task):
+                for chunk, result in batch:
+                    if result is not None:
+                        extracted[chunk.id] = result
+                    yield chunk
+        except BrokenProcessPool:
+            logger.error("extraction_worker_crashed", file=task.file_path)
+            self.extractor._restart_pool()
+            for i, other in enumerate(self.in_flight):
+                if other.succeeded:
+                    continue
+                self.buffered -= len(other.buffered)
+                self.in_flight[i] = self.extractor._submit(
+                    other.file_path, other.known_chunk_ids
+                )
+            raise
+        finally:
+            if not task.future.done():
+                task.stop.set()
+            self.buffered -= len(task.buffered)
+            task.buffered.clear()
+
+    def batches(self, task: _DocumentTask) -> Iterator[ChunkBatch]:
+        while True:
+            if task.buffered:
+                self.buffered -= 1
+                yield task.buffered.popleft()
+                continue
+
+            done = task.future.done()
+            try:
+                batch = task.results.get(timeout=0 if done else RESULT_POLL_SECONDS)
+            except queue.Empty:
+                if done:
+                    task.future.result()
+                    return
+                self.pump()
+                continue
+
+            yield batch
+            self.pump()
+
+
+class ParallelExtractor:
+
+    def __init__(self, config: Config, workers: Optional[int] = None) -> None:
+        self.config = config
+        self.workers = workers or config.extraction.workers
+        self.batch_size = config.extraction.batch_size
+        self.pipeline: Optional[IngestionPipeline] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager: Optional[SyncManager] = None
+
+    def __enter__(self) -> "ParallelExtractor":
+        if self.workers > 1:
+            self._manager = process_context([__name__]).Manager()
+            self._executor = self._start_pool()
+        else:
+            self.pipeline = create_ingestion_pipeline(
+                self.config, self.config.extraction.pdf_workers
+            )
+        logger.info("parallel_extraction_started", workers=self.workers)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=exc_type is not None)
+            self._executor = None
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        return process_pool(self.workers, [__name__], _init_worker, (self.config,))
+
+    def _restart_pool(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._start_pool()
+        logger.warning("extraction_pool_restarted", workers=self.workers)
+
+    def _submit(self, file_path: str, known_chunk_ids: frozenset[str]) -> _DocumentTask:
+        if self._executor is None or self._manager is None:
+            raise RuntimeError("ParallelExtractor is not running")
+
+        results = self._manager.Queue(maxsize=RESULT_QUEUE_BATCHES)
+        stop = self._manager.Event()
+        future = self._executor.submit(
+            extract_document,
+            file_path,
+            known_chunk_ids,
+            results,
+            stop,
+            self.batch_size,
+        )
+        return _DocumentTask(file_path, known_chunk_ids, future, results, stop)
+
+    def extract(
+        self,
+        files: Iterable[Path],
+        known_chunk_ids: Callable[[Path], frozenset[str]],
+    ) -> Iterator[tuple[str, Optional[dict[str, Any]], Optional[Exception]]]:
+        if self._executor is None:
+            yield from self._extract_sequential(files)
+            return
+
+        run = _ExtractionRun(self, files, known_chunk_ids)
+        while True:
+            task = run.next_task()
+            while run.errors:
+                file_path, error = run.errors.popleft()
+                yield file_path, None, error
+            if task is None:
+                return
+
+            extracted: dict[str, Extraction] = {}
+            yield task.file_path, {
+                "document_id": document_id_for(Path(task.file_path)),
+                "chunks": run.stream(task, extracted),
+                "extracted": extracted,
+            }, None
+
+    def _extract_sequential(
+        self, files: Iterable[Path]
+    ) -> Iterator[tuple[str, Optional[dict[str, Any]], Optional[Exception]]]:
+        if self.pipeline is None:
+            raise RuntimeError("ParallelExtractor is not running")
+
+        for path in files:
+            try:
+                document_id, chunks = self.pipeline.stream_document(str(path))
+            except Exception as e:
+                yield str(path), None, e
+                continue
+            yield str(path), {
+                "document_id": document_id,
+                "chunks": chunks,
+                "extracted": {},
+            }, None
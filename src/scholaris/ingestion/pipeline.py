@@ -1,38 +1,94 @@
 
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from scholaris.ingestion.chunker import chunk_text
-from scholaris.ingestion.loader import load_document
+from scholaris.config import Config
+from scholaris.ingestion.chunker import ChunkView, iter_chunks, iter_token_chunks
+from scholaris.ingestion.loader import stream_document
 from scholaris.types import DocumentChunk
 from scholaris.utils.logging import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
+SUPPORTED_EXTENSIONS = {".pdf", ".txt", ".md", ".markdown"}
+
+
+def find_documents(path: Path) -> list[Path]:
+    if path.is_file():
+        return [path]
+    return sorted(
+        file_path
+        for file_path in path.rglob("*")
+        if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS
+    )
+
 
 class IngestionPipeline:
 
-    def __init__(self, chunk_size: int = 1000, overlap: int = 200) -> None:
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        overlap: int = 200,
+        pdf_workers: int = 1,
+        pdf_parallel_pages: int = 0,
+        chunk_tokens: int = 0,
+        overlap_tokens: int = 0,
+        encoding: str = "cl100k_base",
+    ) -> None:
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.pdf_workers = pdf_workers
+        self.pdf_parallel_pages = pdf_parallel_pages
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.encoding = encoding
+        self._encoder: Optional[Any] = None
+
+    @property
+    def encoder(self) -> Any:
+        if self._encoder is None:
+            import tiktoken
+
+            self._encoder = tiktoken.get_encoding(self.encoding)
+        return self._encoder
 
     def process_document(self, file_path: str) -> tuple[str, list[DocumentChunk]]:
         logger.info("processing_document", file=file_path)
 
-        document_id, content = load_document(file_path)
-
-        chunks = chunk_text(
-            text=content,
-            document_id=document_id,
-            chunk_size=self.chunk_size,
-            overlap=self.overlap,
-        )
+        document_id, stream = self.stream_document(file_path)
+        chunks = [view.to_chunk() for view in stream]
 
         logger.info(
             "document_processed",
             document_id=document_id,
             chunks=len(chunks),
-            total_chars=len(content),
+            total_chars=chunks[-1].end_char if chunks else 0,
+        )
+
+        return document_id, chunks
+
+    def stream_document(self, file_path: str) -> tuple[str, Iterator[ChunkView]]:
+        logger.info("streaming_document", file=file_path)
+
+        document_id, segments = stream_document(
+            file_path, self.pdf_workers, self.pdf_parallel_pages
+        )
+        if self.chunk_tokens:
+            chunks = iter_token_chunks(
+                segments,
+                document_id=document_id,
+                encoder=self.encoder,
+                max_tokens=self.chunk_tokens,
+                overlap_tokens=self.overlap_tokens,
+            )
+            return document_id, chunks
+
+        chunks = iter_chunks(
+            segments,
+            document_id=document_id,
+            chunk_size=self.chunk_size,
+            overlap=self.overlap,
         )
 
         return document_id, chunks
@@ -46,16 +102,31 @@ class IngestionPipeline:
         if not directory.is_dir():
             raise ValueError(f"Not a directory: {directory_path}")
 
-        supported_extensions = {".pdf", ".txt", ".md", ".markdown"}
         results = {}
 
-        for file_path in directory.rglob("*"):
-            if file_path.suffix.lower() in supported_extensions:
-                try:
-                    document_id, chunks = self.process_document(str(file_path))
-                    results[document_id] = chunks
-                except Exception as e:
-                    logger.error("document_processing_failed", file=str(file_path), error=str(e))
+        for file_path in find_documents(directory):
+            try:
+                document_id, chunks = self.process_document(str(file_path))
+                results[document_id] = chunks
+            except Exception as e:
+                logger.error(
+                    "document_processing_failed", file=str(file_path), error=str(e)
+                )
 
         logger.info("directory_processed", total_documents=len(results))
         return results
+
+
+def create_ingestion_pipeline(
+    config: Config, pdf_workers: Optional[int] = None
+) -> IngestionPipeline:
+    extraction = config.extraction
+    return IngestionPipeline(
+        chunk_size=extraction.chunk_size,
+        overlap=extraction.chunk_overlap,
+        pdf_workers=pdf_workers or extraction.pdf_workers,
+        pdf_parallel_pages=extraction.pdf_parallel_pages,
+        chunk_tokens=extraction.chunk_tokens,
+        overlap_tokens=extraction.chunk_overlap_tokens,
+        encoding=extraction.tokenizer_encoding,
+    )
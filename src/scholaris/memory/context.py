@@ -48,10 +48,13 @@ class ContextManager:
     def should_summarize(self, conversation: ConversationHistory) -> bool:
         return conversation.token_count >= self.config.context.summarization_trigger
 
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoder.encode(text))
+
     def _count_tokens(self, conversation: ConversationHistory) -> int:
         total = 0
         for message in conversation.messages:
-            tokens = len(self.encoder.encode(message.content))
+            tokens = self.count_tokens(message.content)
             total += tokens
         return total
 
@@ -61,6 +61,32 @@ class RedisClient:
     def exists(self, key: str) -> bool:
         return bool(self.client.exists(key))
 
+    def add_to_index(self, key: str, member: str, score: float) -> None:
+        self.client.zadd(key, {member: score})
+
+    def index_members(self, key: str, limit: Optional[int] = None) -> list[str]:
+        end = -1 if limit is None else limit - 1
+        return list(self.client.zrevrange(key, 0, end))
+
+    def remove_from_index(
+        self, key: str, *members: str, max_score: Optional[float] = None
+    ) -> None:
+        if members:
+            self.client.zrem(key, *members)
+        if max_score is not None:
+            self.client.zremrangebyscore(key, "-inf", max_score)
+
+    def increment_counters(self, key: str, **amounts: int) -> dict[str, int]:
+        pipeline = self.client.pipeline()
+        for field, amount in amounts.items():
+            pipeline.hincrby(key, field, amount)
+        return dict(zip(amounts, pipeline.execute()))
+
+    def counters(self, key: str) -> dict[str, int]:
+        return {
+            field: int(value) for field, value in self.client.hgetall(key).items()
+        }
+
     def clear_pattern(self, pattern: str) -> int:
         keys = list(self.client.scan_iter(match=pattern))
         if keys:
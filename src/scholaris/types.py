@@ -49,6 +49,9 @@ class Entity(BaseModel):
     metadata: dict[str, Any] = Field(
         default_factory=dict, description="Additional entity metadata"
     )
+    chunk_ids: list[str] = Field(
+        default_factory=list, description="Chunks the entity was extracted from"
+    )
 
 
 class Relation(BaseModel):
@@ -59,9 +62,15 @@ class Relation(BaseModel):
     confidence: float = Field(
         default=1.0, ge=0.0, le=1.0, description="Extraction confidence score"
     )
+    weight: int = Field(
+        default=1, ge=1, description="Number of times the relation was observed"
+    )
     metadata: dict[str, Any] = Field(
         default_factory=dict, description="Additional relation metadata"
     )
+    provenance: dict[str, int] = Field(
+        default_factory=dict, description="Observation count per contributing chunk"
+    )
 
 
 class DocumentChunk(BaseModel):
@@ -102,6 +111,19 @@ class GraphPath(BaseModel):
     length: int = Field(ge=0, description="Path length (number of edges)")
 
 
+class GraphSubgraph(BaseModel):
+
+    seeds: dict[str, list[str]] = Field(
+        default_factory=dict, description="Node identifiers matched by each seed"
+    )
+    nodes: list[GraphNode] = Field(
+        default_factory=list, description="Distinct nodes in the subgraph"
+    )
+    edges: list[GraphEdge] = Field(
+        default_factory=list, description="Distinct edges in the subgraph"
+    )
+
+
 class ReasoningStep(BaseModel):
 
     step_number: int = Field(ge=1, description="Step number in sequence")
@@ -185,6 +207,43 @@ class ReasoningState(BaseModel):
     is_complete: bool = Field(default=False, description="Whether reasoning is done")
 
 
+class IngestionJobStatus(str, Enum):
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class IngestionJob(BaseModel):
+
+    id: str = Field(description="Job identifier")
+    file_path: str = Field(description="Document being ingested")
+    force: bool = Field(default=False, description="Ignore the ingestion manifest")
+    status: IngestionJobStatus = Field(
+        default=IngestionJobStatus.QUEUED, description="Current job state"
+    )
+    progress: dict[str, int] = Field(
+        default_factory=dict, description="Chunks, entities and relations so far"
+    )
+    result: Optional[dict[str, Any]] = Field(
+        default=None, description="Ingestion result once the job succeeds"
+    )
+    error: Optional[str] = Field(default=None, description="Failure reason")
+    cancel_requested: bool = Field(
+        default=False, description="Whether cancellation has been requested"
+    )
+    owner: Optional[str] = Field(
+        default=None, description="Job queue instance that runs the job"
+    )
+    submitted_at: datetime = Field(
+        default_factory=datetime.now, description="Submission time"
+    )
+    started_at: Optional[datetime] = Field(default=None, description="Start time")
+    finished_at: Optional[datetime] = Field(default=None, description="Finish time")
+
+
 class ConversationMessage(BaseModel):
 
     role: str = Field(description="Message role (user, assistant, system)")
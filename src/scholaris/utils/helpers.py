@@ -1,6 +1,10 @@
 
 import hashlib
-from typing import Any
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any, Optional
 
 
 def generate_id(text: str) -> str:
@@ -23,3 +27,26 @@ def safe_get(dictionary: dict[str, Any], key: str, default: Any = None) -> Any:
 
 def chunk_list(items: list[Any], chunk_size: int) -> list[list[Any]]:
     return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def process_context(preload: list[str]) -> BaseContext:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(preload)
+    return context
+
+
+def process_pool(
+    workers: int,
+    preload: list[str],
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=process_context(preload),
+        initializer=initializer,
+        initargs=initargs,
+    )
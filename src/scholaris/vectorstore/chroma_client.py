@@ -37,7 +37,7 @@ class ChromaClient:
         documents: list[str],
         metadatas: Optional[list[dict[str, Any]]] = None,
     ) -> None:
-        self.collection.add(
+        self.collection.upsert(
             ids=ids,
             embeddings=embeddings,
             documents=documents,
@@ -46,6 +46,13 @@ class ChromaClient:
 
         logger.info("embeddings_added", count=len(ids))
 
+    def delete_embeddings(self, ids: list[str]) -> None:
+        if not ids:
+            return
+
+        self.collection.delete(ids=ids)
+        logger.info("embeddings_deleted", count=len(ids))
+
     def search(
         self, query_embedding: list[float], n_results: int = 5
     ) -> dict[str, Any]:
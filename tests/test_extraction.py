@@ -1,8 +1,34 @@
 """Tests for extraction modules."""
 
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from scholaris.extraction.chunks import extract_chunk
 from scholaris.extraction.entities import EntityExtractor
 from scholaris.extraction.linker import EntityLinker
-from scholaris.types import Entity, EntityType
+from scholaris.extraction.relations import RelationExtractor
+from scholaris.ingestion import jobs, parallel
+from scholaris.ingestion.chunker import (
+    ChunkView,
+    chunk_by_sentences,
+    chunk_text,
+    iter_chunks,
+    iter_token_chunks,
+)
+from scholaris.ingestion.loader import iter_pdf_pages, load_pdf
+from scholaris.ingestion.manifest import IngestionManifest
+from scholaris.ingestion.parallel import ParallelExtractor
+from scholaris.ingestion.pipeline import find_documents
+from scholaris.types import Entity, EntityType, IngestionJob, IngestionJobStatus
+from scholaris.utils.helpers import process_context
 
 
 def test_entity_extraction(config, sample_text):
@@ -37,3 +63,497 @@ def test_entity_linking():
     id2 = linker.link_entity(entity2)
 
     assert id1 == id2
+
+
+def test_proximity_relations_are_aggregated(config):
+    """Test that repeated co-occurrences collapse into one weighted edge."""
+    extractor = RelationExtractor(config)
+    entities = [
+        Entity(id="b", text="Attention", type=EntityType.CONCEPT),
+        Entity(id="a", text="Transformer", type=EntityType.METHOD),
+        Entity(id="b", text="Attention", type=EntityType.CONCEPT),
+    ]
+
+    relations = extractor.extract_relations("Attention Transformer Attention", entities)
+
+    assert len(relations) == 1
+    assert (relations[0].source_id, relations[0].target_id) == ("a", "b")
+    assert relations[0].weight == 2
+
+
+def consume_documents(extractor, files, known=lambda path: frozenset()):
+    """Drain each streamed document into (chunks, extractions) or an error."""
+    results = {}
+    for file_path, document, error in extractor.extract(files, known):
+        if document is not None:
+            try:
+                chunks = list(document["chunks"])
+            except Exception as e:
+                document, error = None, e
+            else:
+                document = (chunks, dict(document["extracted"]))
+        results[file_path] = (document, error)
+    return results
+
+
+def test_parallel_extraction_isolates_failures(config, tmp_path):
+    """Test that workers stream back the chunks and extractions per file."""
+    config.extraction.chunk_size = 60
+    config.extraction.chunk_overlap = 10
+    config.extraction.batch_size = 1
+    for name in ["a", "b", "c"]:
+        (tmp_path / f"{name}.txt").write_text(
+            f"Graph Neural Networks use Message Passing. {name.upper()} Paper. " * 6
+        )
+    (tmp_path / "broken.pdf").write_bytes(b"not a pdf")
+    files = find_documents(tmp_path)
+
+    with ParallelExtractor(config, 1) as extractor:
+        sequential = consume_documents(extractor, files)
+    with ParallelExtractor(config, 2) as extractor:
+        parallel = consume_documents(extractor, files)
+
+    assert sorted(parallel) == sorted(sequential) == [str(f) for f in files]
+    broken = str(tmp_path / "broken.pdf")
+    assert parallel[broken][0] is None and parallel[broken][1] is not None
+    assert sequential[broken][0] is None and sequential[broken][1] is not None
+
+    entity_extractor = EntityExtractor(config)
+    relation_extractor = RelationExtractor(config)
+    for file_path, (document, error) in sequential.items():
+        if error is None:
+            chunks, extracted = parallel[file_path][0]
+            assert len(chunks) > 4
+            assert [c.id for c in chunks] == [c.id for c in document[0]]
+            assert document[1] == {}
+            assert extracted == {
+                chunk.id: extract_chunk(chunk, entity_extractor, relation_extractor)
+                for chunk in chunks
+            }
+
+    with ParallelExtractor(config, 2) as extractor:
+        [(chunks, extracted)] = [
+            document
+            for document, _ in consume_documents(
+                extractor,
+                files[:1],
+                lambda path: frozenset(c.id for c in sequential[str(path)][0][0]),
+            ).values()
+        ]
+    assert chunks and extracted == {}
+
+
+class CrashingPool:
+    """Process pool stand-in that breaks on one file, failing later tasks too."""
+
+    def __init__(self):
+        self.submitted = []
+        self.broken = False
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def submit(self, fn, file_path, *args):
+        self.submitted.append(file_path)
+        return self.executor.submit(self.run, fn, file_path, *args)
+
+    def run(self, fn, file_path, *args):
+        if file_path.endswith("crash.txt"):
+            self.broken = True
+        if self.broken:
+            raise BrokenProcessPool("worker died")
+        return fn(file_path, *args)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def test_parallel_extraction_survives_broken_pool(config, tmp_path, monkeypatch):
+    """Test that a crashed worker fails one file and the pool is rebuilt."""
+    pools = []
+
+    def crashing_pool(workers, preload, initializer, initargs):
+        initializer(*initargs)
+        pools.append(CrashingPool())
+        return pools[-1]
+
+    monkeypatch.setattr(parallel, "process_pool", crashing_pool)
+    files = [tmp_path / name for name in ["crash.txt", "a.txt", "b.txt"]]
+    for path in files:
+        path.write_text("Transformers use Attention.")
+
+    with ParallelExtractor(config, 2) as extractor:
+        results = consume_documents(extractor, files)
+
+    assert isinstance(results[str(files[0])][1], BrokenProcessPool)
+    assert all(results[str(path)][1] is None for path in files[1:])
+    assert len(pools) == 2
+    assert pools[1].submitted == [str(path) for path in files[1:]]
+
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    assert process_context([]).get_start_method() == "spawn"
+
+
+def test_parallel_extraction_drains_workers_behind_the_head(config, tmp_path):
+    """Test that workers behind the streamed document are not capped at its queue."""
+    config.extraction.chunk_size = 60
+    config.extraction.chunk_overlap = 10
+    config.extraction.batch_size = 1
+    head = tmp_path / "head.txt"
+    head.write_text("Graph Neural Networks use Message Passing. " * 300)
+    other = tmp_path / "other.txt"
+    other.write_text("Transformers use Attention. " * 30)
+
+    with ParallelExtractor(config, 2) as extractor:
+        run = parallel._ExtractionRun(extractor, [head, other], lambda p: frozenset())
+        task = run.next_task()
+        assert task.file_path == str(head)
+        chunks = list(run.stream(task, {}))
+
+        [behind] = run.in_flight
+        behind.future.result(timeout=30)
+        assert len(chunks) > 100
+        assert len(behind.buffered) > parallel.RESULT_QUEUE_BATCHES
+        assert run.buffered == len(behind.buffered)
+        assert run.next_task() is behind
+
+
+def test_streamed_chunks_match_whole_text_chunking():
+    """Test that page-streamed chunks match chunking the joined text."""
+    pages = ["a" * 25, "\n\n" + "b" * 3, "", "\n\n" + "c" * 40]
+    consumed = []
+
+    def page_stream():
+        for page_num, text in enumerate(pages, start=1):
+            consumed.append(page_num)
+            yield page_num, text
+
+    chunks = iter_chunks(page_stream(), "doc", chunk_size=10, overlap=3)
+    first = next(chunks)
+    assert consumed == [1]
+    assert (first.metadata["page_start"], first.metadata["page_end"]) == (1, 1)
+
+    streamed = [first, *chunks]
+    expected = chunk_text("".join(pages), "doc", chunk_size=10, overlap=3)
+
+    assert [(c.id, c.start_char, c.end_char) for c in streamed] == [
+        (c.id, c.start_char, c.end_char) for c in expected
+    ]
+    spans = [(c.metadata["page_start"], c.metadata["page_end"]) for c in streamed]
+    assert spans[:6] == [(1, 1), (1, 1), (1, 1), (1, 2), (1, 4), (2, 4)]
+    assert set(spans[6:]) == {(4, 4)}
+    assert [c.text for c in streamed[3:5]] == ["aaaa\n\n", "a\n\nbbb\n\n"]
+
+
+def test_small_edit_changes_only_nearby_chunk_ids():
+    """Test that content-defined cut points keep unedited chunk ids stable."""
+    text = " ".join(
+        f"Model {i} applies method {i * 7 % 13} to dataset {i * 3 % 11}."
+        for i in range(300)
+    )
+    middle = len(text) // 2
+    edited = text[:middle] + "x" + text[middle:]
+
+    before = chunk_text(text, "doc", chunk_size=200, overlap=20)
+    after = chunk_text(edited, "doc", chunk_size=200, overlap=20)
+    unchanged = {chunk.id for chunk in before}
+    changed = [chunk for chunk in after if chunk.id not in unchanged]
+
+    assert len(before) > 50
+    assert 1 <= len(changed) <= 2
+    assert all(c.start_char <= middle < c.end_char for c in changed)
+    assert len(after) - len(changed) >= len(before) - 2
+
+
+def test_content_defined_chunks_stay_close_to_chunk_size():
+    """Test that content-defined cuts keep the mean chunk near chunk_size."""
+    text = " ".join(
+        f"Model {i} applies method {i * 7 % 13} to dataset {i * 3 % 11}."
+        for i in range(20000)
+    )
+
+    chunks = chunk_text(text, "doc", chunk_size=1000, overlap=200)
+    mean = sum(chunk.end_char - chunk.start_char for chunk in chunks) / len(chunks)
+
+    assert mean >= 900
+    assert len(chunks) <= 1.15 * (len(text) - 200) / 800
+
+
+def write_pdf(path, page_texts):
+    """Write a PDF with one line of Helvetica text per page."""
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    for text in page_texts:
+        page = writer.add_blank_page(612, 792)
+        if text:
+            content = DecodedStreamObject()
+            content.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode())
+            page.replace_contents(content)
+            page[NameObject("/Resources")] = DictionaryObject(
+                {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+            )
+    writer.write(path)
+
+
+def test_parallel_pdf_pages_keep_page_order(tmp_path):
+    """Test that page ranges extracted in a pool are reassembled in order."""
+    path = tmp_path / "proceedings.pdf"
+    write_pdf(path, [f"Page {i} Transformer" if i != 4 else "" for i in range(1, 11)])
+
+    sequential = list(iter_pdf_pages(path))
+    parallel = list(iter_pdf_pages(path, workers=2, parallel_pages=5))
+
+    assert parallel == sequential
+    assert [page for page, _ in parallel] == [1, 2, 3, 5, 6, 7, 8, 9, 10]
+    assert "".join(text for _, text in parallel) == load_pdf(path)
+    assert parallel[1][1] == "\n\nPage 2 Transformer"
+
+
+def test_ingestion_manifest_skips_unchanged_files(tmp_path):
+    """Test that the manifest skips files whose content hash is unchanged."""
+    path = tmp_path / "paper.txt"
+    path.write_text("Transformers use Attention.")
+    manifest = IngestionManifest(str(tmp_path / "manifest.db"), "1:1000:200")
+
+    current, fingerprint = manifest.check(path, "doc")
+    assert not current
+    manifest.record(path, "doc", "ingested", fingerprint, chunks=3)
+
+    current, fingerprint = manifest.check(path, "doc")
+    assert current and fingerprint["chunks"] == 3
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert manifest.check(path, "doc")[0]
+    assert manifest.get("doc")["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+    path.write_text("Transformers use Attentiom.")
+    current, fingerprint = manifest.check(path, "doc")
+    assert not current
+    manifest.record(path, "doc", "failed", fingerprint, error="boom")
+    assert not manifest.check(path, "doc")[0]
+
+    manifest.record(path, "doc", "ingested", fingerprint, chunks=1)
+    manifest.close()
+
+    reopened = IngestionManifest(str(tmp_path / "manifest.db"), "1:1000:200")
+    assert reopened.check(path, "doc")[0]
+    assert not IngestionManifest(str(tmp_path / "manifest.db"), "2:1000:200").check(
+        path, "doc"
+    )[0]
+
+
+def test_chunk_views_materialize_lazily_with_exact_offsets():
+    """Test that chunk views slice the source lazily and convert on demand."""
+    text = "Attention helps. Transformers scale. BERT extends them. GPT too"
+    [view] = list(iter_chunks([(3, text)], "doc", chunk_size=100, overlap=10))
+
+    assert isinstance(view, ChunkView)
+    assert not hasattr(view, "__dict__")
+    assert view._id is None
+    assert view.text == text
+    assert view.to_chunk() == chunk_text(text, "doc", 100, 10)[0].model_copy(
+        update={"metadata": {"chunk_index": 0, "page_start": 3, "page_end": 3}}
+    )
+
+    chunks = chunk_by_sentences(text, "doc", max_sentences=2)
+    assert [chunk.text for chunk in chunks] == [
+        "Attention helps. Transformers scale.",
+        "BERT extends them. GPT too",
+    ]
+    for chunk in chunks:
+        assert text[chunk.start_char : chunk.end_char] == chunk.text
+
+
+class WordEncoder:
+    """Offline stand-in for a tiktoken encoding that treats words as tokens."""
+
+    def __init__(self):
+        self.words = []
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        tokens = []
+        for match in re.finditer(r"\s*\S+", text):
+            tokens.append(len(self.words))
+            self.words.append(match.group())
+        return tokens
+
+    def decode_with_offsets(self, tokens):
+        offsets, text = [], ""
+        for token in tokens:
+            offsets.append(len(text))
+            text += self.words[token]
+        return text, offsets
+
+
+def test_token_chunks_pack_sentences_within_budget():
+    """Test that token chunks respect the budget and keep exact offsets."""
+    pages = [
+        (1, "One two three. Four five. Six seven eight. "),
+        (2, "Ten eleven twelve thirteen fourteen fifteen sixteen. Last one."),
+    ]
+    text = "".join(segment for _, segment in pages)
+    encoder = WordEncoder()
+
+    chunks = list(iter_token_chunks(pages, "doc", encoder, 6, 2))
+
+    assert [chunk.text for chunk in chunks] == [
+        "One two three. Four five.",
+        "Four five. Six seven eight.",
+        "Ten eleven twelve thirteen fourteen fifteen",
+        "sixteen.",
+        "Last one.",
+    ]
+    assert encoder.calls == 5
+    for chunk in chunks:
+        assert text[chunk.start_char : chunk.end_char] == chunk.text
+        assert chunk.tokens <= 6
+    assert [(chunk.page_start, chunk.page_end) for chunk in chunks] == [
+        (1, 1),
+        (1, 1),
+        (2, 2),
+        (2, 2),
+        (2, 2),
+    ]
+
+
+class MemoryRedis:
+    """In-memory stand-in for RedisClient covering the job queue's calls."""
+
+    def __init__(self):
+        self.values = {}
+        self.index = {}
+
+    def set(self, key, value, ttl=None):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def exists(self, key):
+        return key in self.values
+
+    def add_to_index(self, key, member, score):
+        self.index[member] = score
+
+    def index_members(self, key, limit=None):
+        return sorted(self.index, key=self.index.get, reverse=True)[:limit]
+
+    def remove_from_index(self, key, *members, max_score=None):
+        for member in members:
+            self.index.pop(member, None)
+
+
+def test_ingestion_jobs_report_progress_and_cancel(config, monkeypatch):
+    """Test that ingestion jobs run in the background and can be cancelled."""
+    monkeypatch.setattr(jobs, "PROGRESS_INTERVAL", 0.0)
+    started = threading.Event()
+    polled = threading.Event()
+
+    def ingest(file_path, force, progress):
+        progress({"chunks": 1, "entities": 2, "relations": 3})
+        if file_path == "done.pdf":
+            return {"document_id": "doc", "chunks": 4, "entities": 5, "relations": 6}
+        started.set()
+        polled.wait(5)
+        while True:
+            progress({"chunks": 2, "entities": 4, "relations": 6})
+
+    queue = jobs.IngestionJobQueue(config, MemoryRedis(), ingest)
+    running = queue.submit("slow.pdf")
+    queued = queue.submit("done.pdf")
+    assert started.wait(5)
+
+    assert queue.get(running.id).status == IngestionJobStatus.RUNNING
+    assert queue.get(running.id).progress == {
+        "chunks": 1,
+        "entities": 2,
+        "relations": 3,
+    }
+    assert queue.cancel(queued.id).cancel_requested
+    assert queue.cancel(running.id).cancel_requested
+    polled.set()
+    queue.shutdown()
+
+    assert [job.id for job in queue.list_jobs()] == [queued.id, running.id]
+    for job in queue.list_jobs():
+        assert job.status == IngestionJobStatus.CANCELLED
+        assert not job.cancel_requested
+
+    queue = jobs.IngestionJobQueue(config, MemoryRedis(), ingest)
+    finished = queue.submit("done.pdf")
+    queue.shutdown()
+    job = queue.get(finished.id)
+    assert job.status == IngestionJobStatus.SUCCEEDED
+    assert job.progress["relations"] == 6
+    assert queue.cancel(finished.id).status == IngestionJobStatus.SUCCEEDED
+    assert job.owner == queue.owner
+    assert not queue.redis.exists(f"{jobs.OWNER_KEY_PREFIX}:{queue.owner}")
+
+
+def test_ingestion_jobs_fail_orphaned_jobs_on_startup(config):
+    """Test that jobs left behind by a stopped process are marked failed."""
+    redis = MemoryRedis()
+    redis.set(f"{jobs.OWNER_KEY_PREFIX}:alive", True)
+    seeded = {
+        "running": IngestionJob(
+            id="running", file_path="a.pdf", status="running", owner="gone"
+        ),
+        "queued": IngestionJob(id="queued", file_path="b.pdf", owner="gone"),
+        "legacy": IngestionJob(id="legacy", file_path="c.pdf"),
+        "alive": IngestionJob(
+            id="alive", file_path="d.pdf", status="running", owner="alive"
+        ),
+        "done": IngestionJob(
+            id="done", file_path="e.pdf", status="succeeded", owner="gone"
+        ),
+    }
+    for score, job in enumerate(seeded.values()):
+        redis.set(f"{jobs.JOB_KEY_PREFIX}:{job.id}", job.model_dump(mode="json"))
+        redis.add_to_index(jobs.JOB_INDEX_KEY, job.id, score)
+
+    queue = jobs.IngestionJobQueue(config, redis, lambda *args, **kwargs: {})
+    assert queue.recover() == 0
+    queue.shutdown()
+
+    statuses = {job.id: job.status for job in queue.list_jobs()}
+    assert statuses == {
+        "running": IngestionJobStatus.FAILED,
+        "queued": IngestionJobStatus.FAILED,
+        "legacy": IngestionJobStatus.FAILED,
+        "alive": IngestionJobStatus.RUNNING,
+        "done": IngestionJobStatus.SUCCEEDED,
+    }
+    assert queue.get("running").error.startswith("Interrupted")
+
+
+def test_ingestion_jobs_fail_orphans_once_owner_expires(config, monkeypatch):
+    """Test that the periodic sweep fails jobs whose owner expires after startup."""
+    monkeypatch.setattr(jobs, "OWNER_TTL", 0.15)
+    redis = MemoryRedis()
+    owner_key = f"{jobs.OWNER_KEY_PREFIX}:crashed"
+    redis.set(owner_key, True)
+    job = IngestionJob(id="job", file_path="a.pdf", status="running", owner="crashed")
+    redis.set(f"{jobs.JOB_KEY_PREFIX}:job", job.model_dump(mode="json"))
+    redis.add_to_index(jobs.JOB_INDEX_KEY, "job", 0)
+
+    queue = jobs.IngestionJobQueue(config, redis, lambda *args, **kwargs: {})
+    assert queue.get("job").status == IngestionJobStatus.RUNNING
+
+    redis.delete(owner_key)
+    deadline = time.monotonic() + 5
+    while queue.get("job").status == IngestionJobStatus.RUNNING:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    queue.shutdown()
+
+    assert queue.get("job").status == IngestionJobStatus.FAILED
@@ -0,0 +1,920 @@
+"""Tests for graph modules."""
+
+import threading
+
+import pytest
+from neo4j import READ_ACCESS, WRITE_ACCESS
+from neo4j.exceptions import ClientError, TransientError
+
+from scholaris.graph.admin_import import AdminImportWriter
+from scholaris.graph.builder import AsyncGraphBuilder, GraphBuilder
+from scholaris.graph.cache import GraphVersion, cache_key
+from scholaris.graph.compaction import dedup_key, plan_merge
+from scholaris.graph.embedded import EmbeddedGraphClient
+from scholaris.graph.neo4j_client import (
+    GraphConnectionError,
+    KShortestPathSearch,
+    Neo4jClient,
+    driver_options,
+)
+from scholaris.graph.paths import PathFinder
+from scholaris.graph.queries import build_fulltext_query, validate_identifier
+from scholaris.graph.ranking import ContextRanker
+from scholaris.graph.snapshot import GraphSnapshot
+from scholaris.graph.statistics import GraphStatistics
+from scholaris.graph.traversal import AsyncGraphTraversal, GraphTraversal
+from scholaris.graph.write_buffer import GraphWriteBuffer, GraphWriteError
+from scholaris.types import (
+    DocumentChunk,
+    Entity,
+    EntityType,
+    GraphEdge,
+    GraphNode,
+    GraphSubgraph,
+    Relation,
+    RelationType,
+)
+
+
+class RecordingClient:
+    """Graph client stub that records bulk writes."""
+
+    def __init__(self):
+        self.node_batches = []
+        self.relationship_batches = []
+
+    def bulk_create_nodes(self, label, rows, batch_size=None):
+        self.node_batches.append((label, rows))
+        return len(rows)
+
+    def bulk_create_relationships(self, rel_type, rows, batch_size=None):
+        self.relationship_batches.append((rel_type, rows))
+        return len(rows)
+
+
+class AsyncRecordingClient(RecordingClient):
+    """Async graph client stub that records bulk writes."""
+
+    async def bulk_create_nodes(self, label, rows, batch_size=None):
+        return RecordingClient.bulk_create_nodes(self, label, rows, batch_size)
+
+    async def bulk_create_relationships(self, rel_type, rows, batch_size=None):
+        return RecordingClient.bulk_create_relationships(
+            self, rel_type, rows, batch_size
+        )
+
+
+def test_build_graph_groups_bulk_writes(config):
+    """Test that build_graph writes one bulk group per label and type."""
+    client = RecordingClient()
+    builder = GraphBuilder(config, client)
+
+    entities = [
+        Entity(id="1", text="Transformer", type=EntityType.METHOD),
+        Entity(id="2", text="Attention", type=EntityType.CONCEPT),
+        Entity(id="3", text="Vaswani", type=EntityType.AUTHOR),
+        Entity(id="4", text="Encoder", type=EntityType.CONCEPT),
+        Entity(text="Unidentified", type=EntityType.CONCEPT),
+    ]
+    relations = [
+        Relation(source_id="1", target_id="2", type=RelationType.USES),
+        Relation(source_id="3", target_id="1", type=RelationType.PROPOSES),
+        Relation(source_id="1", target_id="4", type=RelationType.USES),
+    ]
+
+    stats = builder.build_graph(entities, relations)
+
+    labels = {label: len(rows) for label, rows in client.node_batches}
+    rel_types = {rel_type: len(rows) for rel_type, rows in client.relationship_batches}
+
+    assert labels == {"METHOD": 1, "CONCEPT": 2, "AUTHOR": 1}
+    assert rel_types == {"USES": 2, "PROPOSES": 1}
+    assert stats["entities"] == 4
+    assert stats["relations"] == 3
+    assert stats["rows_per_sec"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_async_build_graph(config):
+    """Test that the async builder issues the same grouped writes."""
+    client = AsyncRecordingClient()
+    builder = AsyncGraphBuilder(config, client)
+
+    entities = [
+        Entity(id="1", text="Transformer", type=EntityType.METHOD),
+        Entity(id="2", text="Attention", type=EntityType.CONCEPT),
+    ]
+    relations = [Relation(source_id="1", target_id="2", type=RelationType.USES)]
+
+    stats = await builder.build_graph(entities, relations)
+
+    assert [label for label, _ in client.node_batches] == ["METHOD", "CONCEPT"]
+    assert stats["relations"] == 1
+
+
+def test_validate_identifier_rejects_injection():
+    """Test that labels interpolated into Cypher are validated."""
+    assert validate_identifier("CONCEPT") == "CONCEPT"
+
+    with pytest.raises(ValueError):
+        validate_identifier("CONCEPT) DETACH DELETE (n")
+
+
+def test_build_fulltext_query_modes():
+    """Test Lucene query construction for each search mode."""
+    assert build_fulltext_query("Neural Networks") == "neural* AND networks*"
+    assert build_fulltext_query("bert", mode="fuzzy") == "bert~"
+    assert build_fulltext_query("Graph  theory", mode="exact") == '"graph theory"'
+    assert build_fulltext_query("C++ (lang)") == "c\\+\\+* AND \\(lang\\)*"
+    assert build_fulltext_query("   ") == ""
+
+
+@pytest.fixture
+def snapshot():
+    """Small in-memory graph snapshot: a chain A-B-C-D plus a spur B-E."""
+    graph = GraphSnapshot()
+    for node_id in "ABCDE":
+        graph.add_node(node_id, text=f"Entity {node_id}", label="CONCEPT")
+
+    graph.add_edge("A", "B", "USES", 0.9)
+    graph.add_edge("B", "C", "EXTENDS", 0.8)
+    graph.add_edge("D", "C", "CITES", 0.7)
+    graph.add_edge("B", "E", "USES", 0.6)
+    graph.rebuild()
+    return graph
+
+
+def test_snapshot_neighbors_and_k_hop(snapshot):
+    """Test CSR neighbor lookups and k-hop expansion."""
+    neighbors = snapshot.neighbors("B", relation_types=["USES"])
+    assert {n["target"]["id"] for n in neighbors} == {"A", "E"}
+
+    assert snapshot.k_hop("A", 2) == {"A": 0, "B": 1, "C": 2, "E": 2}
+
+
+def test_snapshot_shortest_path_preserves_direction(snapshot):
+    """Test BFS shortest path over the snapshot."""
+    path = snapshot.shortest_path("A", "D", max_hops=5)
+
+    assert [node.id for node in path.nodes] == ["A", "B", "C", "D"]
+    assert (path.edges[-1].source, path.edges[-1].target) == ("D", "C")
+    assert snapshot.shortest_path("A", "D", max_hops=2) is None
+
+
+def test_embedded_backend_end_to_end(config):
+    """Test building and traversing a graph without a Neo4j server."""
+    client = EmbeddedGraphClient(config)
+    builder = GraphBuilder(config, client)
+    traversal = GraphTraversal(config, client)
+
+    entities = [
+        Entity(id="1", text="Transformer Model", type=EntityType.METHOD),
+        Entity(id="2", text="Self Attention", type=EntityType.CONCEPT),
+        Entity(id="3", text="Vaswani", type=EntityType.AUTHOR),
+    ]
+    relations = [
+        Relation(source_id="1", target_id="2", type=RelationType.USES),
+        Relation(source_id="3", target_id="1", type=RelationType.PROPOSES),
+    ]
+    builder.build_graph(entities, relations)
+
+    results = traversal.search_entities_by_text("transf")
+    assert [r["n"]["id"] for r in results] == ["1"]
+    fuzzy = traversal.search_entities_by_text("atention", mode="fuzzy")
+    assert fuzzy[0]["n"]["id"] == "2"
+    assert not traversal.search_entities_by_text("transformer", entity_types=["AUTHOR"])
+
+    related = traversal.find_related_entities("1", relation_types=["USES"])
+    assert [r["target"]["id"] for r in related] == ["2"]
+
+    path = traversal.find_shortest_path("3", "2")
+    assert [node.id for node in path.nodes] == ["3", "1", "2"]
+    assert path.edges[0].type == "PROPOSES"
+
+    subgraph = traversal.expand_neighborhoods(seed_texts=["vaswani"], max_hops=2)
+    assert subgraph.seeds == {"vaswani": ["3"]}
+    assert {node.id for node in subgraph.nodes} == {"1", "2", "3"}
+
+
+def test_snapshot_expand_deduplicates_overlapping_seeds(snapshot):
+    """Test that multi-seed expansion returns one merged subgraph."""
+    subgraph = snapshot.expand({"a": ["A"], "c": ["C"], "x": ["missing"]}, 1)
+
+    assert subgraph.seeds == {"a": ["A"], "c": ["C"], "x": []}
+    assert {node.id for node in subgraph.nodes} == {"A", "B", "C", "D"}
+    assert {(e.source, e.target, e.type) for e in subgraph.edges} == {
+        ("A", "B", "USES"),
+        ("B", "C", "EXTENDS"),
+        ("D", "C", "CITES"),
+    }
+
+    limited = snapshot.expand({"b": ["B"]}, 2, per_seed_limit=2)
+    assert len(limited.edges) == 2
+
+
+def test_snapshot_expand_limit_skips_visited_nodes(snapshot):
+    """Test that the per-seed limit is spent only on edges to unvisited nodes."""
+    subgraph = snapshot.expand({"e": ["E"]}, 3, per_seed_limit=3)
+
+    assert [node.id for node in subgraph.nodes] == ["E", "B", "C", "A"]
+    assert {(e.source, e.target) for e in subgraph.edges} == {
+        ("B", "E"),
+        ("B", "C"),
+        ("A", "B"),
+    }
+    assert snapshot.expand({"e": ["E"]}, 3, per_seed_limit=3) == subgraph
+
+    snapshot.add_edge("E", "D", "CITES")
+    snapshot.rebuild()
+    widened = snapshot.expand({"e": ["E"]}, 1)
+    assert {node.id for node in widened.nodes} == {"E", "B", "D"}
+
+
+@pytest.fixture
+def hub_graph():
+    """Graph where hub H links A, B and C, beside a longer route A-X-Y-C."""
+    graph = GraphSnapshot()
+    for node_id in ["A", "X", "Y", "C"]:
+        graph.add_node(node_id)
+    for spoke in ["A", "B", "C", "S1", "S2"]:
+        graph.add_edge("H", spoke, "RELATED_TO")
+    graph.add_edge("A", "X", "USES")
+    graph.add_edge("X", "Y", "USES")
+    graph.add_edge("Y", "C", "USES")
+    graph.add_node("Z")
+    graph.rebuild()
+    return graph
+
+
+def test_path_finder_prunes_hubs(hub_graph):
+    """Test bidirectional search with and without hub pruning."""
+    unpruned = PathFinder(hub_graph).shortest_path("A", "C", max_hops=10)
+    assert [node.id for node in unpruned.nodes] == ["A", "H", "C"]
+
+    pruned = PathFinder(hub_graph, hub_degree=3).shortest_path("A", "C", max_hops=10)
+    assert [node.id for node in pruned.nodes] == ["A", "X", "Y", "C"]
+
+
+def test_snapshot_expand_stops_at_hubs(hub_graph):
+    """Test that expansion reaches hubs but does not fan out through them."""
+    subgraph = hub_graph.expand({"a": ["A"]}, 2, hub_degree=3)
+
+    assert {node.id for node in subgraph.nodes} == {"A", "H", "X", "Y"}
+
+
+def test_path_finder_landmarks_bound_distances(hub_graph):
+    """Test ALT lower bounds and early rejection of disconnected pairs."""
+    finder = PathFinder(hub_graph, landmark_count=2)
+
+    assert finder.distance_lower_bound("A", "Z") is None
+    assert finder.shortest_path("A", "Z", max_hops=10) is None
+    assert finder.distance_lower_bound("S1", "Y") <= 3
+    assert finder.shortest_path("S1", "Y", max_hops=3).length == 3
+
+
+def test_path_finder_k_shortest_paths(hub_graph):
+    """Test that k-shortest paths are loopless and ordered by length."""
+    paths = PathFinder(hub_graph).k_shortest_paths("A", "C", k=3, max_hops=10)
+
+    assert [path.length for path in paths] == [2, 3]
+    assert [node.id for node in paths[1].nodes] == ["A", "X", "Y", "C"]
+
+
+def test_context_ranker_prefers_seed_neighborhood(config):
+    """Test that personalized PageRank keeps the seed's neighbors within budget."""
+    nodes = [
+        GraphNode(id=i, label="CONCEPT", properties={"text": f"Entity {i}"})
+        for i in ["S", "N1", "N2", "F1", "F2", "F3"]
+    ]
+    edges = [
+        GraphEdge(source="S", target="N1", type="USES"),
+        GraphEdge(source="S", target="N2", type="USES"),
+        GraphEdge(source="F1", target="F2", type="CITES"),
+        GraphEdge(source="F2", target="F3", type="CITES"),
+    ]
+    subgraph = GraphSubgraph(seeds={"s": ["S"]}, nodes=nodes, edges=edges)
+    ranker = ContextRanker(config, lambda text: len(text.split()))
+
+    ranked = ranker.rank(subgraph, token_budget=14)
+
+    assert [node.id for node in ranked.nodes][0] == "S"
+    assert {node.id for node in ranked.nodes} <= {"S", "N1", "N2"}
+    assert all(edge.type == "USES" for edge in ranked.edges)
+    assert len(ranker.build_context(subgraph, token_budget=14).split()) <= 14
+
+
+class CountingClient(EmbeddedGraphClient):
+    """Embedded client that counts search round trips."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.searches = 0
+
+    def search_entities(self, search_texts, entity_types=None, limit=10, mode="prefix"):
+        self.searches += 1
+        return super().search_entities(search_texts, entity_types, limit, mode)
+
+
+def test_traversal_cache_invalidated_by_builder_writes(config):
+    """Test that cached reads are reused until the builder writes again."""
+    client = CountingClient(config)
+    builder = GraphBuilder(config, client)
+    traversal = GraphTraversal(config, client, version=builder.version)
+
+    builder.build_graph(
+        [Entity(id="1", text="Transformer", type=EntityType.METHOD)], []
+    )
+    assert len(traversal.search_entities_by_text("Transformer")) == 1
+    assert len(traversal.search_entities_by_text("  transformer ")) == 1
+    assert client.searches == 1
+
+    builder.add_entity(Entity(id="2", text="Transformer XL", type=EntityType.METHOD))
+    assert len(traversal.search_entities_by_text("transformer")) == 2
+    assert client.searches == 2
+
+    stats = traversal.cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["version"] == builder.version.value
+
+
+class CounterRedis:
+    """In-memory stand-in for the RedisClient hash counters."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.reads = 0
+        self.down = False
+
+    def increment_counters(self, key, **amounts):
+        if self.down:
+            raise ConnectionError("redis unavailable")
+        counters = self.hashes.setdefault(key, {})
+        for field, amount in amounts.items():
+            counters[field] = counters.get(field, 0) + amount
+        return {field: counters[field] for field in amounts}
+
+    def counters(self, key):
+        self.reads += 1
+        if self.down:
+            raise ConnectionError("redis unavailable")
+        return dict(self.hashes.get(key, {}))
+
+
+def test_graph_version_shared_across_processes(config):
+    """Test that a Redis-backed version invalidates caches in other processes."""
+    redis = CounterRedis()
+    client = CountingClient(config)
+    writer = GraphBuilder(config, client, GraphVersion(redis, refresh_seconds=60))
+    version = GraphVersion(redis, refresh_seconds=60)
+    traversal = GraphTraversal(config, client, version=version)
+
+    writer.add_entity(Entity(id="1", text="Transformer", type=EntityType.METHOD))
+    version.refresh()
+    assert len(traversal.search_entities_by_text("Transformer")) == 1
+    writer.add_entity(Entity(id="2", text="Transformer XL", type=EntityType.METHOD))
+    reads = redis.reads
+    assert len(traversal.search_entities_by_text("Transformer")) == 1
+    assert redis.reads == reads
+    version.refresh()
+    assert len(traversal.search_entities_by_text("Transformer")) == 2
+    assert client.searches == 2
+
+    writer.version.bump(removed=True)
+    assert version.refresh() == (3, 1)
+
+    redis.down = True
+    assert version.refresh() == (3, 1)
+    assert len(traversal.search_entities_by_text("Transformer")) == 2
+    assert version.bump() == 4
+    assert cache_key("related", "Node-A", ["B", "a"]) == (
+        "related",
+        "Node-A",
+        ("B", "a"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_traversal_routes_through_snapshot(config):
+    """Test that async traversal serves snapshot-mode reads from the snapshot."""
+    client = CountingClient(config)
+    builder = GraphBuilder(config, client)
+    builder.build_graph(
+        [
+            Entity(id="1", text="Transformer", type=EntityType.METHOD),
+            Entity(id="2", text="Attention", type=EntityType.CONCEPT),
+        ],
+        [Relation(source_id="1", target_id="2", type=RelationType.USES)],
+    )
+    snapshot = GraphSnapshot()
+    snapshot.load(client)
+    traversal = GraphTraversal(config, client, snapshot, builder.version)
+    async_traversal = AsyncGraphTraversal(
+        config, None, builder.version, snapshot_traversal=traversal
+    )
+
+    path = await async_traversal.find_shortest_path("1", "2")
+    assert [node.id for node in path.nodes] == ["1", "2"]
+
+    subgraph = await async_traversal.expand_neighborhoods(seed_ids=["1"], max_hops=1)
+    assert {node.id for node in subgraph.nodes} == {"1", "2"}
+    assert client.searches == 0
+
+
+def test_snapshot_refreshes_from_streamed_exports(config):
+    """Test that snapshots load and refresh incrementally from export iterators."""
+    client = EmbeddedGraphClient(config)
+    builder = GraphBuilder(config, client)
+    builder.build_graph(
+        [
+            Entity(id="1", text="Transformer", type=EntityType.METHOD),
+            Entity(id="2", text="Attention", type=EntityType.CONCEPT),
+        ],
+        [Relation(source_id="1", target_id="2", type=RelationType.USES)],
+    )
+
+    snapshot = GraphSnapshot()
+    snapshot.load(client)
+    assert (snapshot.node_count, snapshot.edge_count) == (2, 1)
+    assert snapshot.refresh(client) == 0
+
+    builder.add_entity(Entity(id="3", text="Encoder", type=EntityType.CONCEPT))
+    builder.add_relation(
+        Relation(source_id="3", target_id="2", type=RelationType.EXTENDS)
+    )
+
+    assert snapshot.refresh(client) == 2
+    assert snapshot.k_hop("1", 2) == {"1": 0, "2": 1, "3": 2}
+
+
+def test_snapshot_refresh_reloads_after_external_deletions(config):
+    """Test that a refresh drops entities deleted behind the snapshot's back."""
+    client = EmbeddedGraphClient(config)
+    builder = GraphBuilder(config, client)
+    builder.build_graph(
+        [
+            Entity(id="1", text="Transformer", type=EntityType.METHOD),
+            Entity(id="2", text="Attention", type=EntityType.CONCEPT, chunk_ids=["c"]),
+        ],
+        [Relation(source_id="1", target_id="2", type=RelationType.USES)],
+    )
+    builder.record_chunks("doc", {"c": ["2"]})
+
+    snapshot = GraphSnapshot()
+    snapshot.load(client)
+    assert snapshot.k_hop("1", 1) == {"1": 0, "2": 1}
+
+    client.remove_chunks(["c"])
+    assert client.deletion_count() == 1
+
+    snapshot.refresh(client)
+    assert "2" not in snapshot.node_index
+    assert snapshot.k_hop("1", 1) == {"1": 0}
+
+
+def test_write_buffer_coalesces_and_flushes_by_size(config):
+    """Test that the write buffer merges duplicates and flushes in batches."""
+    client = RecordingClient()
+    builder = GraphBuilder(config, client)
+
+    entity = Entity(id="1", text="Transformer", type=EntityType.METHOD)
+    other = Entity(id="2", text="Attention", type=EntityType.CONCEPT)
+    mention = Relation(source_id="1", target_id="2", type=RelationType.MENTIONS)
+
+    with GraphWriteBuffer(builder, queue_size=1, flush_size=3) as buffer:
+        buffer.add_entities([entity, other])
+        buffer.add_relations([mention])
+        buffer.add_entities([entity])
+        buffer.add_relations([mention.model_copy(update={"confidence": 0.95})])
+
+    assert buffer.stats["flushes"] == 2
+    assert buffer.stats["coalesced"] == 0
+    assert sum(len(rows) for _, rows in client.node_batches) == 3
+
+    client = RecordingClient()
+    with GraphWriteBuffer(GraphBuilder(config, client), flush_size=100) as buffer:
+        for _ in range(3):
+            buffer.add_entities([entity, other])
+            buffer.add_relations([mention])
+
+    assert buffer.stats["flushes"] == 1
+    assert buffer.stats["coalesced"] == 6
+    assert [len(rows) for _, rows in client.relationship_batches] == [1]
+
+
+def test_write_buffer_surfaces_flush_errors(config):
+    """Test that a failed flush is raised to the producer."""
+
+    class FailingClient(RecordingClient):
+        def bulk_create_nodes(self, label, rows, batch_size=None):
+            raise RuntimeError("database unavailable")
+
+    buffer = GraphWriteBuffer(GraphBuilder(config, FailingClient()), flush_size=1)
+    buffer.start()
+    buffer.add_entities([Entity(id="1", text="Transformer", type=EntityType.METHOD)])
+
+    with pytest.raises(GraphWriteError):
+        buffer.flush()
+    buffer.close(raise_errors=False)
+
+
+def test_embedded_relationship_writes_accumulate(config):
+    """Test that re-writing an edge increments its weight and keeps max confidence."""
+    client = EmbeddedGraphClient(config)
+    builder = GraphBuilder(config, client)
+    entities = [
+        Entity(id="1", text="Transformer", type=EntityType.METHOD),
+        Entity(id="2", text="Attention", type=EntityType.CONCEPT),
+    ]
+
+    for confidence in (0.9, 0.7):
+        relation = Relation(
+            source_id="1",
+            target_id="2",
+            type=RelationType.MENTIONS,
+            confidence=confidence,
+            weight=2,
+        )
+        builder.build_graph(entities, [relation])
+
+    edges = client.export_edges()
+    assert len(edges) == 1
+    path = client.find_shortest_path("1", "2", 1)
+    assert path.edges[0].properties["weight"] == 4
+    assert path.edges[0].properties["confidence"] == 0.9
+
+
+def test_graph_statistics_written_incrementally(config):
+    """Test that degree and PageRank are stored and only changed nodes rewritten."""
+    client = EmbeddedGraphClient(config)
+    builder = GraphBuilder(config, client)
+    entities = [
+        Entity(id=str(i), text=f"Entity {i}", type=EntityType.CONCEPT)
+        for i in range(6)
+    ]
+    relations = [
+        Relation(source_id="0", target_id=str(i), type=RelationType.USES)
+        for i in range(1, 4)
+    ]
+    relations.append(Relation(source_id="4", target_id="5", type=RelationType.USES))
+    builder.build_graph(entities, relations)
+
+    statistics = GraphStatistics(config, client)
+    assert statistics.update()["updated"] == 6
+
+    hub = client.find_node("CONCEPT", "id", "0")
+    assert hub["degree"] == 3
+    assert hub["degree_USES"] == 3
+    assert hub["pagerank"] > client.find_node("CONCEPT", "id", "1")["pagerank"]
+    assert "degree_CITES" not in hub
+
+    assert statistics.update()["updated"] == 0
+
+    builder.build_graph(
+        [], [Relation(source_id="1", target_id="2", type=RelationType.CITES)]
+    )
+    assert statistics.update()["updated"] == 4
+    assert client.find_node("CONCEPT", "id", "2")["degree_CITES"] == 1
+
+
+def test_graph_statistics_refresh_shared_snapshot_under_lock(config):
+    """Test that statistics refresh the traversal's snapshot only under its lock."""
+    config.graph.traversal_mode = "snapshot"
+    client = EmbeddedGraphClient(config)
+    GraphBuilder(config, client).build_graph(
+        [
+            Entity(id=node_id, text=f"Entity {node_id}", type=EntityType.CONCEPT)
+            for node_id in ("a", "b")
+        ],
+        [Relation(source_id="a", target_id="b", type=RelationType.USES)],
+    )
+    traversal = GraphTraversal(config, client)
+    statistics = GraphStatistics(config, client, traversal)
+
+    updated = threading.Event()
+
+    def update():
+        statistics.update()
+        updated.set()
+
+    with traversal._snapshot_lock:
+        worker = threading.Thread(target=update)
+        worker.start()
+        assert not updated.wait(0.2)
+        assert traversal.snapshot.node_count == 0
+    worker.join(5)
+
+    assert updated.is_set()
+    assert traversal.snapshot.node_count == 2
+    assert client.find_node("CONCEPT", "id", "a")["degree"] == 1
+    assert traversal.find_related_entities("a")
+
+
+def test_removing_chunks_replaces_stale_contributions(config):
+    """Test that removed chunks drop only the entities and edges they alone added."""
+    client = EmbeddedGraphClient(config)
+    builder = GraphBuilder(config, client)
+
+    def extracted(chunk_id, entity_ids):
+        entities = [
+            Entity(
+                id=entity_id,
+                text=f"Entity {entity_id}",
+                type=EntityType.CONCEPT,
+                chunk_ids=[chunk_id],
+            )
+            for entity_id in entity_ids
+        ]
+        relation = Relation(
+            source_id=entity_ids[0],
+            target_id=entity_ids[1],
+            type=RelationType.MENTIONS,
+            provenance={chunk_id: 1},
+        )
+        return entities, [relation]
+
+    chunks = {"c1": ["a", "b"], "c2": ["a", "b"], "c3": ["b", "c"]}
+    for chunk_id, entity_ids in chunks.items():
+        builder.build_graph(*extracted(chunk_id, entity_ids))
+    builder.record_chunks("doc", chunks)
+
+    removed = builder.remove_chunks(["c2", "c3"])
+
+    assert removed == {"chunks": 2, "entities": 1, "relations": 1}
+    assert client.document_chunks("doc") == ["c1"]
+    assert {node["id"] for node in client.export_nodes()} == {"a", "b"}
+    path = client.find_shortest_path("a", "b", 1)
+    assert path.edges[0].properties["weight"] == 1
+    assert path.edges[0].properties["chunk_ids"] == ["c1"]
+    assert client.find_shortest_path("b", "c", 2) is None
+    assert client.search_entities(["entity c"]) == [[]]
+
+
+def test_plan_merge_rewires_duplicate_edges():
+    """Test that duplicate merges rewire edges onto one canonical node."""
+    assert dedup_key("x", "Self  Attention", "CONCEPT") == dedup_key(
+        "y", "self attention", "CONCEPT"
+    )
+    assert dedup_key("x", "", "CONCEPT") != dedup_key("y", "", "CONCEPT")
+
+    nodes = [
+        {"id": "b", "chunk_ids": ["c2"], "confidence": 0.9},
+        {"id": "a", "chunk_ids": ["c1"], "confidence": 0.6},
+    ]
+    edges = [
+        {
+            "source_id": "b",
+            "target_id": "x",
+            "type": "USES",
+            "properties": {
+                "confidence": 0.8,
+                "weight": 2,
+                "chunk_ids": ["c2"],
+                "chunk_weights": [2],
+            },
+        },
+        {
+            "source_id": "b",
+            "target_id": "x",
+            "type": "USES",
+            "properties": {"confidence": 0.9, "weight": 1},
+        },
+        {"source_id": "a", "target_id": "b", "type": "CITES", "properties": {}},
+    ]
+
+    plan = plan_merge(nodes, edges)
+
+    assert plan["canonical"] == "a"
+    assert plan["duplicates"] == ["b"]
+    assert plan["chunk_ids"] == ["c2", "c1"]
+    assert plan["confidence"] == 0.9
+    [row] = plan["relationships"]["USES"]
+    assert (row["source_id"], row["target_id"]) == ("a", "x")
+    assert row["properties"]["weight"] == 3
+    assert row["properties"]["confidence"] == 0.9
+    assert row["properties"]["chunk_ids"] == ["c2"]
+    assert "CITES" not in plan["relationships"]
+
+
+def write_admin_import(config, output_dir, spill_rows):
+    """Write a small corpus with repeated entities and relations as CSV."""
+    entity_a = Entity(id="a", text="Attention", type=EntityType.CONCEPT)
+    entity_b = Entity(id="b", text="Transformer", type=EntityType.METHOD)
+
+    with AdminImportWriter(config, output_dir, spill_rows) as writer:
+        for chunk_id, confidence in [("c2", 0.6), ("c1", 0.9), ("c2", 0.6)]:
+            chunk = DocumentChunk(
+                id=chunk_id, document_id="d", text="", start_char=0, end_char=0
+            )
+            entities = [
+                entity_a.model_copy(
+                    update={"chunk_ids": [chunk_id], "confidence": confidence}
+                ),
+                entity_b.model_copy(update={"chunk_ids": [chunk_id]}),
+            ]
+            relation = Relation(
+                source_id="b",
+                target_id="a",
+                type=RelationType.USES,
+                confidence=confidence,
+                weight=2,
+                provenance={chunk_id: 2},
+            )
+            writer.add_chunk(chunk, entities, [relation])
+
+    return {
+        name: (output_dir / name).read_bytes()
+        for name in ["entities.csv", "chunks.csv", "relationships.csv"]
+    }
+
+
+def test_admin_import_writes_deduplicated_csv(config, tmp_path):
+    """Test that bulk import CSVs are aggregated and identical across spills."""
+    in_memory = write_admin_import(config, tmp_path / "memory", 1000)
+    spilled = write_admin_import(config, tmp_path / "spilled", 1)
+
+    assert spilled == in_memory
+    assert write_admin_import(config, tmp_path / "memory", 1000) == in_memory
+    assert sorted(path.name for path in (tmp_path / "spilled").iterdir()) == [
+        "chunks.csv",
+        "entities.csv",
+        "relationships.csv",
+    ]
+
+    assert in_memory["entities.csv"].decode().splitlines()[1:] == [
+        "a,Entity;CONCEPT,Attention,0.9,c1;c2",
+        "b,Entity;METHOD,Transformer,1.0,c1;c2",
+    ]
+    assert in_memory["chunks.csv"].decode().splitlines()[1:] == [
+        "c2,Chunk,d,a;b",
+        "c1,Chunk,d,a;b",
+    ]
+    assert in_memory["relationships.csv"].decode().splitlines()[1:] == [
+        "b,a,USES,0.9,4,c1;c2,2;2",
+    ]
+
+
+class FakeDriver:
+    """Neo4j driver stand-in that retries managed transactions like the driver."""
+
+    def __init__(self, failures):
+        self.failures = list(failures)
+        self.calls = []
+        self.attempts = 0
+
+    def session(self, database, default_access_mode):
+        return FakeSession(self, default_access_mode)
+
+
+class FakeSession:
+    """Session stand-in recording how transaction functions are run."""
+
+    def __init__(self, driver, access_mode):
+        self.driver = driver
+        self.access_mode = access_mode
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_read(self, work, *args, **kwargs):
+        return self._managed("execute_read", work, *args, **kwargs)
+
+    def execute_write(self, work, *args, **kwargs):
+        return self._managed("execute_write", work, *args, **kwargs)
+
+    def _managed(self, method, work, *args, **kwargs):
+        self.driver.calls.append((method, self.access_mode))
+        while True:
+            self.driver.attempts += 1
+            try:
+                return work(self, *args, **kwargs)
+            except (TransientError, ClientError) as e:
+                if not e.is_retryable():
+                    raise
+
+    def run(self, query, parameters):
+        if self.driver.failures:
+            raise self.driver.failures.pop(0)
+        return [{"query": query, **parameters}]
+
+
+def fake_neo4j_client(config, failures=()):
+    client = Neo4jClient.__new__(Neo4jClient)
+    client.config = config
+    client.driver = FakeDriver(failures)
+    return client
+
+
+def test_neo4j_client_routes_managed_transactions(config):
+    """Test that reads and writes use managed transactions and retry."""
+    client = fake_neo4j_client(config, [TransientError("leader switch")])
+
+    assert client.execute_read("MATCH (n) RETURN n", {"id": "a"}) == [
+        {"query": "MATCH (n) RETURN n", "id": "a"}
+    ]
+    assert client.driver.calls == [("execute_read", READ_ACCESS)]
+    assert client.driver.attempts == 2
+
+    client.driver.calls.clear()
+    rows = [{"id": str(i)} for i in range(5)]
+    assert client.bulk_create_nodes("Concept", rows, batch_size=2) == 5
+    client.execute_write("CREATE (n)")
+    assert client.driver.calls == [
+        ("execute_write", WRITE_ACCESS),
+        ("execute_write", WRITE_ACCESS),
+        ("execute_write", WRITE_ACCESS),
+        ("execute_write", WRITE_ACCESS),
+    ]
+
+    retry_time = driver_options(config)["max_transaction_retry_time"]
+    assert retry_time == config.neo4j.max_transaction_retry_time
+
+    client = fake_neo4j_client(config, [ClientError("syntax error")])
+    with pytest.raises(GraphConnectionError):
+        client.execute_write("CREATE (n")
+    assert client.driver.attempts == 1
+
+
+class FakeNode(dict):
+    """Neo4j node stand-in."""
+
+    labels = frozenset({"Entity", "Concept"})
+
+
+class FakeRelationship(dict):
+    """Neo4j relationship stand-in with an element id."""
+
+    def __init__(self, element_id, start_node, end_node):
+        super().__init__()
+        self.element_id = element_id
+        self.start_node = start_node
+        self.end_node = end_node
+        self.type = "USES"
+
+
+def run_spur_requests(graph, query_params):
+    """Answer a spur batch with a banned-aware BFS, like Cypher shortestPath."""
+    nodes = {node_id: FakeNode(id=node_id) for node_id in graph}
+    records = []
+    for spur in query_params["spurs"]:
+        routes = {spur["source_id"]: ([nodes[spur["source_id"]]], [])}
+        frontier = [spur["source_id"]]
+        while frontier and query_params["target_id"] not in routes:
+            reached = []
+            for node_id in frontier:
+                for neighbor in graph[node_id]:
+                    element_id = "-".join(sorted([node_id, neighbor]))
+                    if (
+                        neighbor in routes
+                        or neighbor in spur["banned_nodes"]
+                        or element_id in spur["banned_edges"]
+                    ):
+                        continue
+                    path_nodes, path_edges = routes[node_id]
+                    edge = FakeRelationship(
+                        element_id, nodes[node_id], nodes[neighbor]
+                    )
+                    routes[neighbor] = (
+                        path_nodes + [nodes[neighbor]],
+                        path_edges + [edge],
+                    )
+                    reached.append(neighbor)
+            frontier = reached
+
+        route = routes.get(query_params["target_id"])
+        if route is not None and len(route[1]) <= spur["max_hops"]:
+            records.append(
+                {"spur": spur["index"], "nodes": route[0], "edges": route[1]}
+            )
+    return records
+
+
+def test_k_shortest_path_search_runs_yen_rounds(config):
+    """Test that Cypher k-shortest paths are loopless, distinct and ordered."""
+    graph = {
+        "A": ["B", "X"],
+        "B": ["A", "C", "D"],
+        "C": ["B", "D", "Y"],
+        "D": ["B", "C"],
+        "X": ["A", "Y"],
+        "Y": ["X", "C"],
+    }
+    search = KShortestPathSearch(config, "A", "C", k=3, max_hops=4)
+
+    rounds = 0
+    request = search.request()
+    while request is not None:
+        query, params = request
+        assert "shortestPath" in query
+        search.add_results(run_spur_requests(graph, params))
+        request = search.request()
+        rounds += 1
+
+    paths = [[node.id for node in path.nodes] for path in search.paths()]
+    assert rounds == 3
+    assert paths[0] == ["A", "B", "C"]
+    assert sorted(paths[1:]) == [["A", "B", "D", "C"], ["A", "X", "Y", "C"]]
+    assert all(len(set(path)) == len(path) for path in paths)
+    assert KShortestPathSearch(config, "A", "C", k=0, max_hops=4).request() is None